@@ -0,0 +1,97 @@
+"""
+벤치마크 공용: 지연 통계(p50/p95/p99), 결과 JSON 저장/비교.
+"""
+from __future__ import annotations
+
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+
+def percentile(sorted_xs: list[float], q: float) -> float:
+    if not sorted_xs:
+        return 0.0
+    k = (len(sorted_xs) - 1) * q
+    lo, hi = math.floor(k), math.ceil(k)
+    if lo == hi:
+        return sorted_xs[lo]
+    return sorted_xs[lo] + (sorted_xs[hi] - sorted_xs[lo]) * (k - lo)
+
+
+def summarize(samples_s: list[float], wall_s: float | None = None, errors: int = 0) -> dict:
+    """
+    초 단위 샘플 → ms 통계. wall_s가 있으면 처리량(ops/s)은 wall 기준.
+    """
+    xs = sorted(samples_s)
+    total = wall_s if wall_s is not None else sum(xs)
+    return {
+        "count": len(xs),
+        "errors": errors,
+        "throughput_per_s": (len(xs) / total) if total > 0 else 0.0,
+        "mean_ms": (sum(xs) / len(xs) * 1000) if xs else 0.0,
+        "p50_ms": percentile(xs, 0.50) * 1000,
+        "p95_ms": percentile(xs, 0.95) * 1000,
+        "p99_ms": percentile(xs, 0.99) * 1000,
+        "max_ms": (xs[-1] * 1000) if xs else 0.0,
+    }
+
+
+def git_rev() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def save_results(name: str, results: dict, config: dict, out: str | None = None) -> Path:
+    doc = {
+        "benchmark": name,
+        "git_rev": git_rev(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "config": config,
+        "results": results,
+    }
+    path = Path(out) if out else RESULTS_DIR / f"{name}-{doc['git_rev']}-{int(time.time())}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(doc, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def print_table(results: dict) -> None:
+    print(f"{'name':<34} {'count':>6} {'err':>4} {'ops/s':>9} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for name, r in results.items():
+        print(
+            f"{name:<34} {r['count']:>6} {r['errors']:>4} {r['throughput_per_s']:>9.1f}"
+            f" {r['p50_ms']:>8.2f}ms {r['p95_ms']:>8.2f}ms {r['p99_ms']:>8.2f}ms"
+        )
+
+
+def compare(baseline_path: str, results: dict) -> None:
+    """
+    이전 결과 JSON과 p50/p95/처리량 비교(+는 느려짐/줄어듦).
+    """
+    base = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    print(f"\ncompare vs {base.get('git_rev')} ({baseline_path})")
+    print(f"{'name':<34} {'p50 Δ':>9} {'p95 Δ':>9} {'ops/s Δ':>9}")
+    for name, r in results.items():
+        b = base["results"].get(name)
+        if not b:
+            continue
+
+        def pct(new: float, old: float) -> str:
+            return f"{(new - old) / old * 100:+8.1f}%" if old else "     n/a"
+
+        print(
+            f"{name:<34} {pct(r['p50_ms'], b['p50_ms'])} {pct(r['p95_ms'], b['p95_ms'])}"
+            f" {pct(r['throughput_per_s'], b['throughput_per_s'])}"
+        )
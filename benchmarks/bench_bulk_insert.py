@@ -0,0 +1,99 @@
+"""
+TopicRepo.create(행마다 INSERT+COMMIT+refresh) vs TopicRepo.bulk_create(multi-row INSERT 1회) 비교.
+DraftRepo도 같은 방식으로 비교한다.
+
+    PYTHONPATH=src python benchmarks/bench_bulk_insert.py --rows 50 --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from autodraft.db.base import Base
+from autodraft.db.models import Draft, Topic
+from autodraft.db.repos import DraftRepo, TopicRepo
+
+
+def make_topics(n: int) -> list[Topic]:
+    now = datetime.utcnow()
+    return [
+        Topic(
+            id=f"t_{uuid.uuid4().hex[:10]}",
+            pillar="학습법",
+            audience="학생-초급",
+            title=f"벤치마크 토픽 {i}",
+            angle="문제→원인→해결",
+            score=70,
+            status="NEW",
+            created_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+def make_drafts(topics: list[Topic]) -> list[Draft]:
+    now = datetime.utcnow()
+    body = "# 제목\n\n## 본문\n- 항목\n" * 40
+    return [
+        Draft(
+            id=f"d_{uuid.uuid4().hex[:10]}",
+            topic_id=t.id,
+            title=t.title,
+            content_md=body,
+            summary="요약",
+            risk_score=0,
+            status="DRAFTED",
+            export_html_ref="",
+            last_error=None,
+            updated_at=now,
+        )
+        for t in topics
+    ]
+
+
+def timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", future=True)
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine, autoflush=False, future=True)
+
+        cases = {"topic.create": [], "topic.bulk_create": [], "draft.create": [], "draft.bulk_create": []}
+        for _ in range(args.repeat):
+            with Session() as db:
+                topics = make_topics(args.rows)
+                cases["topic.create"].append(timed(lambda: [TopicRepo.create(db, t) for t in topics]))
+                drafts = make_drafts(topics)
+                cases["draft.create"].append(timed(lambda: [DraftRepo.create(db, d) for d in drafts]))
+
+                topics = make_topics(args.rows)
+                cases["topic.bulk_create"].append(timed(lambda: TopicRepo.bulk_create(db, topics)))
+                drafts = make_drafts(topics)
+                cases["draft.bulk_create"].append(timed(lambda: DraftRepo.bulk_create(db, drafts)))
+
+        print(f"rows={args.rows} repeat={args.repeat}")
+        for name, xs in cases.items():
+            med = statistics.median(xs)
+            print(f"{name:<20} median={med * 1000:8.2f} ms  rows/s={args.rows / med:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
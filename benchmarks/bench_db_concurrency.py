@@ -0,0 +1,138 @@
+"""
+SQLite 기본 설정(rollback journal) vs 튜닝(WAL/synchronous=NORMAL/busy_timeout/mmap) 동시성 비교.
+스레드 여러 개가 쓰기(INSERT+COMMIT)와 읽기(SELECT)를 섞어 실행한다.
+aiosqlite가 있으면 AsyncSession 경로도 같이 잰다.
+
+    PYTHONPATH=src python benchmarks/bench_db_concurrency.py --threads 8 --ops 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from autodraft.db.base import Base
+from autodraft.db.models import Topic
+from autodraft.db.session import build_async_engine, build_engine
+
+
+def new_topic() -> Topic:
+    return Topic(
+        id=f"t_{uuid.uuid4().hex[:10]}",
+        pillar="학습법",
+        audience="학생-초급",
+        title="동시성 벤치마크",
+        angle="-",
+        score=50,
+        status="NEW",
+        created_at=datetime.utcnow(),
+    )
+
+
+def run_sync(db_url: str, tuned: bool, threads: int, ops: int, write_ratio: float) -> dict:
+    engine = build_engine(db_url, tune_sqlite=tuned)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, future=True)
+    errors = 0
+    lock = threading.Lock()
+    writes_every = max(1, round(1 / write_ratio)) if write_ratio > 0 else 0
+
+    def worker() -> None:
+        nonlocal errors
+        with Session() as db:
+            for i in range(ops):
+                try:
+                    if writes_every and i % writes_every == 0:
+                        db.add(new_topic())
+                        db.commit()
+                    else:
+                        db.scalar(select(func.count()).select_from(Topic))
+                        db.rollback()  # 읽기 트랜잭션 종료
+                except OperationalError:
+                    db.rollback()
+                    with lock:
+                        errors += 1
+
+    ts = [threading.Thread(target=worker) for _ in range(threads)]
+    t0 = time.perf_counter()
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+    elapsed = time.perf_counter() - t0
+    engine.dispose()
+    return {"elapsed_s": elapsed, "ops_per_s": threads * ops / elapsed, "errors": errors}
+
+
+def run_async(db_url: str, tasks: int, ops: int, write_ratio: float) -> dict:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async def main() -> dict:
+        engine = build_async_engine(db_url)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        Session = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        writes_every = max(1, round(1 / write_ratio)) if write_ratio > 0 else 0
+        errors = 0
+
+        async def worker() -> None:
+            nonlocal errors
+            async with Session() as db:
+                for i in range(ops):
+                    try:
+                        if writes_every and i % writes_every == 0:
+                            db.add(new_topic())
+                            await db.commit()
+                        else:
+                            await db.scalar(select(func.count()).select_from(Topic))
+                            await db.rollback()
+                    except OperationalError:
+                        await db.rollback()
+                        errors += 1
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(tasks)))
+        elapsed = time.perf_counter() - t0
+        await engine.dispose()
+        return {"elapsed_s": elapsed, "ops_per_s": tasks * ops / elapsed, "errors": errors}
+
+    return asyncio.run(main())
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--threads", type=int, default=8)
+    ap.add_argument("--ops", type=int, default=200)
+    ap.add_argument("--write-ratio", type=float, default=0.2)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = []
+        for name, tuned in (("sqlite-default", False), ("sqlite-tuned", True)):
+            url = f"sqlite:///{Path(tmp) / f'{name}.db'}"
+            rows.append((name, run_sync(url, tuned, args.threads, args.ops, args.write_ratio)))
+
+        try:
+            import aiosqlite  # noqa: F401
+        except ImportError:
+            print("(aiosqlite 미설치: async 경로 생략)")
+        else:
+            url = f"sqlite:///{Path(tmp) / 'sqlite-async.db'}"
+            rows.append(("sqlite-tuned-async", run_async(url, args.threads, args.ops, args.write_ratio)))
+
+    print(f"threads={args.threads} ops/thread={args.ops} write_ratio={args.write_ratio}")
+    for name, r in rows:
+        print(f"{name:<20} {r['ops_per_s']:10.0f} ops/s  elapsed={r['elapsed_s']:.2f}s  lock_errors={r['errors']}")
+
+
+if __name__ == "__main__":
+    main()
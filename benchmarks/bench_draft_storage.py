@@ -0,0 +1,179 @@
+"""
+drafts 본문 저장 방식 비교: 이전(content_md Text, 항상 로드) vs 현재(content_blob 압축 + deferred).
+
+- DB 크기: 같은 본문 --rows개를 넣고 VACUUM 한 뒤 파일 크기
+- 메모리: 상태/목록 조회처럼 Draft 전체를 ORM으로 읽을 때 RSS 증가량과 tracemalloc peak
+  (케이스마다 새 프로세스에서 측정)
+
+    PYTHONPATH=src python benchmarks/bench_draft_storage.py --rows 20000 --body-kb 4
+    DRAFT_BODY_CODEC=zstd PYTHONPATH=src python benchmarks/bench_draft_storage.py   # zstandard 설치 시
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import random
+import resource
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, create_engine, insert, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, undefer
+
+from autodraft.db.codec import encode_body
+from autodraft.db.migrations import migrate
+from autodraft.db.models import Draft
+from autodraft.settings import settings
+
+WORDS = (
+    "포인터 배열 함수 변수 반복문 조건문 재귀 메모리 주소 참조 값 복사 예시 연습 숙제 정리 원인 해결 "
+    "루틴 체크리스트 개념 정의 실수 습관 시험 문제 풀이 설명 비유 그림 단계 순서 입력 출력 결과 확인 "
+    "오늘 내일 다음 먼저 그리고 그래서 하지만 예를 들어 즉 결국 천천히 꼭 자주 가끔 처음 마지막"
+).split()
+
+
+class LegacyBase(DeclarativeBase):
+    pass
+
+
+class LegacyDraft(LegacyBase):
+    # 이전 스키마: 본문이 평문 Text이고 행을 읽을 때마다 같이 로드된다
+    __tablename__ = "drafts"
+    # 크기 비교가 본문 차이만 보이도록 인덱스는 현재와 같게
+    __table_args__ = tuple(Index(ix.name, *[c.name for c in ix.columns]) for ix in Draft.__table__.indexes)
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    topic_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    content_md: Mapped[str] = mapped_column(Text, nullable=False)
+    summary: Mapped[str] = mapped_column(Text, nullable=False)
+    risk_score: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    export_html_ref: Mapped[str] = mapped_column(Text, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+def make_body(rng: random.Random, i: int, size: int) -> str:
+    parts = [f"# 벤치마크 초안 {i}\n\n> 대상: 학생-초급  \n> 구성: 문제→원인→해결\n"]
+    n = 0
+    section = 1
+    while n < size:
+        parts.append(f"\n## {section}) 소제목\n")
+        for _ in range(rng.randrange(3, 7)):
+            line = "- " + " ".join(rng.choice(WORDS) for _ in range(rng.randrange(6, 14))) + ".\n"
+            parts.append(line)
+            n += len(line.encode("utf-8"))
+        section += 1
+    return "".join(parts)
+
+
+def seed(db_path: Path, rows: int, body_kb: int, compressed: bool) -> float:
+    engine = create_engine(f"sqlite:///{db_path}", future=True)
+    if compressed:
+        migrate(engine)
+        table = Draft.__table__
+    else:
+        LegacyBase.metadata.create_all(engine)
+        table = LegacyDraft.__table__
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    raw_bytes = 0
+    with engine.begin() as conn:
+        for lo in range(0, rows, 1000):
+            batch = []
+            for i in range(lo, min(rows, lo + 1000)):
+                body = make_body(rng, i, body_kb * 1024)
+                raw_bytes += len(body.encode("utf-8"))
+                row = {
+                    "id": f"d_{i:010d}",
+                    "topic_id": f"t_{i:010d}",
+                    "title": f"벤치마크 초안 {i}",
+                    "summary": "요약 한 줄",
+                    "risk_score": 0,
+                    "status": "EXPORTED",
+                    "export_html_ref": f"exports/d_{i:010d}.html",
+                    "last_error": None,
+                    "updated_at": now,
+                }
+                if compressed:
+                    row["content_blob"] = encode_body(body)
+                else:
+                    row["content_md"] = body
+                batch.append(row)
+            conn.execute(insert(table), batch)
+    engine.dispose()
+    con = sqlite3.connect(db_path)
+    con.execute("VACUUM")
+    con.close()
+    return raw_bytes
+
+
+def _measure(db_path: str, model_name: str, read_body: bool, out: mp.Queue) -> None:
+    model = LegacyDraft if model_name == "legacy" else Draft
+    engine = create_engine(f"sqlite:///{db_path}", future=True)
+    rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    stmt = select(model)
+    if read_body:
+        # 본문이 필요한 일괄 작업은 undefer로 한 쿼리에 같이 읽는다(행마다 lazy load 하지 않게)
+        stmt = stmt.options(undefer(Draft.content_blob))
+    with Session(engine) as db:
+        rows = list(db.scalars(stmt))
+        for d in rows:
+            d.status
+            if read_body:
+                d.content_md
+        elapsed = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    out.put({"rss_kb": rss1 - rss0, "peak_kb": peak // 1024, "elapsed_ms": elapsed * 1000, "rows": len(rows)})
+
+
+def measure(db_path: Path, model_name: str, read_body: bool) -> dict:
+    ctx = mp.get_context("spawn")
+    q = ctx.Queue()
+    p = ctx.Process(target=_measure, args=(str(db_path), model_name, read_body, q))
+    p.start()
+    res = q.get()
+    p.join()
+    return res
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=20_000)
+    ap.add_argument("--body-kb", type=int, default=4, help="초안 본문 크기(대략, KB)")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_db = Path(tmp) / "legacy.db"
+        blob_db = Path(tmp) / "blob.db"
+        raw = seed(legacy_db, args.rows, args.body_kb, compressed=False)
+        seed(blob_db, args.rows, args.body_kb, compressed=True)
+
+        legacy_size = os.path.getsize(legacy_db)
+        blob_size = os.path.getsize(blob_db)
+        print(f"rows={args.rows} body≈{args.body_kb}KB codec={settings.draft_body_codec} raw body total={raw / 2**20:.1f}MB")
+        print(f"db size   legacy={legacy_size / 2**20:8.1f}MB  compressed={blob_size / 2**20:8.1f}MB"
+              f"  ({(1 - blob_size / legacy_size) * 100:.0f}% smaller)")
+
+        cases = [
+            ("legacy: list drafts (body eager)", legacy_db, "legacy", False),
+            ("current: list drafts (body deferred)", blob_db, "current", False),
+            ("current: list + undefer + decode bodies", blob_db, "current", True),
+        ]
+        print(f"\n{'case':<38} {'rss Δ':>10} {'heap peak':>10} {'time':>10}")
+        for name, path, model_name, read_body in cases:
+            r = measure(path, model_name, read_body)
+            print(f"{name:<38} {r['rss_kb'] / 1024:>8.1f}MB {r['peak_kb'] / 1024:>8.1f}MB {r['elapsed_ms']:>8.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+GET /topics, GET /drafts 목록 쿼리: keyset(TopicRepo.page / DraftRepo.page) vs OFFSET, 결과 앞/중간/끝 페이지 비교.
+임시 SQLite DB에 migrate()로 스키마(인덱스 포함)를 만들고 --rows개 topics/drafts를 채운다.
+keyset은 깊이와 무관하게 거의 같아야 하고, OFFSET은 깊을수록 느려진다.
+
+    PYTHONPATH=src python benchmarks/bench_list_pages.py --rows 1000000 --repeat 20
+    PYTHONPATH=src python benchmarks/bench_list_pages.py --rows 200000 --explain   # 쿼리 플랜도 출력
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from autodraft.db.codec import encode_body
+from autodraft.db.migrations import migrate
+from autodraft.db.models import Draft, Topic
+from autodraft.db.repos import DraftRepo, TopicRepo
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _common import print_table, save_results, summarize  # noqa: E402
+
+PILLARS = ["공지", "학습법", "문법", "어휘", "시험", "후기"]
+AUDIENCES = ["학생-초급", "학생-중급", "학부모", "교사"]
+TOPIC_STATUSES = (["NEW"] * 6) + ["SELECTED", "DONE", "DONE", "DUPLICATE"]
+DRAFT_STATUSES = (["EXPORTED"] * 7) + ["NEEDS_REVIEW", "NEEDS_REVIEW", "FAILED"]
+DEPTHS = (0.0, 0.5, 0.99)
+
+
+def seed(engine, rows: int, chunk: int = 50_000) -> None:
+    rng = random.Random(7)
+    start = datetime(2025, 1, 1)
+    span_s = 365 * 24 * 3600
+    with engine.begin() as conn:
+        for lo in range(0, rows, chunk):
+            topics, drafts = [], []
+            for i in range(lo, min(rows, lo + chunk)):
+                created = start + timedelta(seconds=rng.randrange(span_s))
+                topics.append(
+                    {
+                        "id": f"t_{i:010d}",
+                        "pillar": rng.choice(PILLARS),
+                        "audience": rng.choice(AUDIENCES),
+                        "title": f"벤치마크 토픽 {i}",
+                        "angle": "문제→원인→해결",
+                        "score": rng.randrange(100),
+                        "status": rng.choice(TOPIC_STATUSES),
+                        "created_at": created,
+                        "updated_at": created,
+                    }
+                )
+                drafts.append(
+                    {
+                        "id": f"d_{i:010d}",
+                        "topic_id": f"t_{i:010d}",
+                        "title": f"벤치마크 토픽 {i}",
+                        "content_blob": encode_body("# 제목\n\n본문"),
+                        "summary": "요약",
+                        "risk_score": rng.randrange(100),
+                        "status": rng.choice(DRAFT_STATUSES),
+                        "export_html_ref": "",
+                        "last_error": None,
+                        "updated_at": created + timedelta(seconds=rng.randrange(3600)),
+                    }
+                )
+            conn.execute(insert(Topic.__table__), topics)
+            conn.execute(insert(Draft.__table__), drafts)
+        conn.exec_driver_sql("ANALYZE")
+
+
+def conditions(model, filters: dict) -> list:
+    # Repo.page와 같은 필터(…_from 포함, …_to 제외)
+    order_col = model.created_at if model is Topic else model.updated_at
+    out = []
+    for key, value in filters.items():
+        if key.endswith("_from"):
+            out.append(order_col >= value)
+        elif key.endswith("_to"):
+            out.append(order_col < value)
+        else:
+            out.append(getattr(model, key) == value)
+    return out
+
+
+def offset_page(db, model, limit: int, offset: int, **filters) -> list:
+    # 비교용: 같은 필터/정렬을 OFFSET으로(앞의 offset개를 매번 읽고 버린다)
+    order_col = model.created_at if model is Topic else model.updated_at
+    stmt = select(model).where(*conditions(model, filters))
+    stmt = stmt.order_by(order_col.desc(), model.id.desc()).offset(offset).limit(limit)
+    return list(db.scalars(stmt))
+
+
+def count(db, model, **filters) -> int:
+    return db.scalar(select(func.count()).select_from(model).where(*conditions(model, filters))) or 0
+
+
+def timed(fn, repeat: int) -> list[float]:
+    xs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        xs.append(time.perf_counter() - t0)
+    return xs
+
+
+def captured_sql(engine, fn) -> tuple[str, tuple]:
+    # fn이 마지막으로 보낸 SQL 문장/파라미터(EXPLAIN QUERY PLAN용)
+    captured: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return captured[-1]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=1_000_000)
+    ap.add_argument("--limit", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--explain", action="store_true", help="keyset 쿼리의 EXPLAIN QUERY PLAN 출력")
+    ap.add_argument("--out", default=None, help="결과 JSON 경로(기본: benchmarks/results/)")
+    args = ap.parse_args()
+
+    topic_cases = {
+        "topics": {},
+        "topics?status": {"status": "NEW"},
+        "topics?pillar&audience": {"pillar": "학습법", "audience": "학부모"},
+        "topics?status&range": {
+            "status": "DONE",
+            "created_from": datetime(2025, 3, 1),
+            "created_to": datetime(2025, 9, 1),
+        },
+    }
+    draft_cases = {
+        "drafts": {},
+        "drafts?status": {"status": "NEEDS_REVIEW"},
+        "drafts?range": {"updated_from": datetime(2025, 6, 1), "updated_to": datetime(2025, 7, 1)},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", future=True)
+        migrate(engine)
+        t0 = time.perf_counter()
+        seed(engine, args.rows)
+        print(f"seeded topics={args.rows} drafts={args.rows} in {time.perf_counter() - t0:.1f}s")
+        Session = sessionmaker(bind=engine, autoflush=False, future=True)
+
+        results: dict[str, dict] = {}
+        with Session() as db:
+            for model, cases, keyset, order_key in (
+                (Topic, topic_cases, TopicRepo.page, "created_at"),
+                (Draft, draft_cases, DraftRepo.page, "updated_at"),
+            ):
+                for name, filters in cases.items():
+                    total = count(db, model, **filters)
+                    for depth in DEPTHS:
+                        offset = min(int(total * depth), max(0, total - args.limit))
+                        # depth 위치의 keyset 커서(= 직전 행) 준비는 측정 밖
+                        after = None
+                        if offset:
+                            prev = offset_page(db, model, 1, offset - 1, **filters)[0]
+                            after = (getattr(prev, order_key), prev.id)
+                        db.expunge_all()
+
+                        ks = keyset(db, args.limit, after, **filters)
+                        off = offset_page(db, model, args.limit, offset, **filters)
+                        assert [r.id for r in ks] == [r.id for r in off], name
+
+                        label = f"{name}@{depth:.0%}"
+                        results[f"{label} keyset"] = summarize(
+                            timed(lambda: (keyset(db, args.limit, after, **filters), db.expunge_all()), args.repeat)
+                        )
+                        results[f"{label} offset"] = summarize(
+                            timed(lambda: (offset_page(db, model, args.limit, offset, **filters), db.expunge_all()), args.repeat)
+                        )
+                    if args.explain:
+                        statement, params = captured_sql(engine, lambda: keyset(db, args.limit, after, **filters))
+                        db.expunge_all()
+                        plan = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", params).all()
+                        print(f"{name}: rows={total}\n  " + " | ".join(r[-1] for r in plan))
+
+        print(f"\nrows={args.rows} limit={args.limit} repeat={args.repeat}")
+        print_table(results)
+        path = save_results(
+            "list_pages", results, {"rows": args.rows, "limit": args.limit, "repeat": args.repeat}, args.out
+        )
+        print(f"\nsaved: {path}")
+
+
+if __name__ == "__main__":
+    main()
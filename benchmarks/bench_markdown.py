@@ -0,0 +1,110 @@
+"""
+md_to_basic_html: 이전 구현(줄마다 re.match + _wrap_list_items 2차 패스) vs 단일 패스 렌더러.
+
+    PYTHONPATH=src python benchmarks/bench_markdown.py --sections 2000 --repeat 10
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import re
+import statistics
+import time
+
+from autodraft.pipelines.steps.export import escape_html, md_to_basic_html
+from autodraft.pipelines.steps.markdown import render_markdown
+
+
+# ---- 비교 기준: 이전 구현 그대로 ----
+def legacy_md_to_basic_html(md: str) -> str:
+    lines = md.splitlines()
+    html_lines: list[str] = []
+    for line in lines:
+        if line.startswith("# "):
+            html_lines.append(f"<h1>{escape_html(line[2:].strip())}</h1>")
+        elif line.startswith("## "):
+            html_lines.append(f"<h2>{escape_html(line[3:].strip())}</h2>")
+        elif line.startswith("> "):
+            html_lines.append(f"<blockquote>{escape_html(line[2:].strip())}</blockquote>")
+        elif line.startswith("- "):
+            html_lines.append(f"<li>{escape_html(line[2:].strip())}</li>")
+        elif re.match(r"^\d+\.\s+", line):
+            html_lines.append(f"<p>{escape_html(line.strip())}</p>")
+        elif line.strip() == "":
+            html_lines.append("<br/>")
+        else:
+            html_lines.append(f"<p>{escape_html(line.strip())}</p>")
+    return "\n".join(_legacy_wrap_list_items(html_lines))
+
+
+def _legacy_wrap_list_items(html_lines: list[str]) -> list[str]:
+    out: list[str] = []
+    in_ul = False
+    for l in html_lines:
+        if l.startswith("<li>") and not in_ul:
+            out.append("<ul>")
+            in_ul = True
+            out.append(l)
+        elif l.startswith("<li>") and in_ul:
+            out.append(l)
+        else:
+            if in_ul:
+                out.append("</ul>")
+                in_ul = False
+            out.append(l)
+    if in_ul:
+        out.append("</ul>")
+    return out
+
+
+SECTION = """## {i}) 핵심 개념
+> 대상: 학생-초급
+> 구성: **문제→원인→해결**
+
+- 쉬운 말로 정의하고 *예시*를 하나 든다
+- 자세한 내용은 [가이드](https://example.com/guide/{i}) 참고
+- 코드 예: `int *p = &x;`
+
+1. 오늘 할 일
+2. 내일 할 일
+3. 체크리스트
+
+본문 문단입니다. 포인터가 헷갈리는 이유를 & 기호와 < > 비교로 설명합니다.
+
+"""
+
+
+def bench(fn, md: str, repeat: int) -> float:
+    xs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(md)
+        xs.append(time.perf_counter() - t0)
+    return statistics.median(xs)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sections", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=10)
+    args = ap.parse_args()
+
+    rich = "# 대형 초안\n\n" + "".join(SECTION.format(i=i) for i in range(args.sections))
+    # 인라인 마크업 없는 입력: 이전 구현과 같은 일을 할 때의 비용 비교
+    plain = re.sub(r"[*`\[\]]", "", rich)
+
+    cases = {
+        "legacy md_to_basic_html": legacy_md_to_basic_html,
+        "md_to_basic_html": md_to_basic_html,
+        "render_markdown(stream)": lambda s: render_markdown(s, io.StringIO()),
+    }
+    for label, md in (("inline-rich", rich), ("plain", plain)):
+        size_kb = len(md.encode("utf-8")) / 1024
+        print(f"[{label}] input={size_kb:.0f} KB repeat={args.repeat}")
+        for name, fn in cases.items():
+            t = bench(fn, md, args.repeat)
+            print(f"  {name:<26} median={t * 1000:8.2f} ms  {size_kb / 1024 / t:6.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
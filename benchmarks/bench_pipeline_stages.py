@@ -0,0 +1,155 @@
+"""
+run_selected: stage 파이프라인(draft → quality_gate → export → status, bounded queue) vs
+이전 방식(스레드마다 topic 하나를 draft/QA/export/commit까지 순서대로, process_topic).
+같은 stub LLM 지연에서 처리량과 메모리(tracemalloc peak, RSS 증가)를 topic 수별로 비교한다.
+stage 방식은 topic 수가 늘어도 메모리가 거의 같아야 한다(queue가 차면 앞 stage가 기다림).
+케이스마다 새 프로세스 + 임시 DB.
+
+    PYTHONPATH=src python benchmarks/bench_pipeline_stages.py --topics 200,1000 --latency-ms 50 --concurrency 4
+    PIPELINE_STAGE_WORKERS=export=4 PYTHONPATH=src python benchmarks/bench_pipeline_stages.py   # stage 워커 수 바꿔보기
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _common import compare, print_table, save_results, summarize  # noqa: E402
+
+CASES = ("unstaged", "staged")
+
+
+def _seed(n: int) -> list[str]:
+    from sqlalchemy import insert
+
+    from autodraft.db.migrations import migrate
+    from autodraft.db.models import Topic
+    from autodraft.db.session import engine
+
+    migrate(engine)
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": f"t_{i:08d}",
+            "pillar": "학습법",
+            "audience": "학생-초급",
+            "title": f"벤치마크 토픽 {i}",
+            "angle": "문제→원인→해결",
+            "score": 50,
+            "status": "SELECTED",
+            "created_at": now + timedelta(microseconds=i),
+            "updated_at": now,
+        }
+        for i in range(n)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Topic.__table__), rows)
+    return [r["id"] for r in rows]
+
+
+def _unstaged(llm, topic_ids: list[str], concurrency: int) -> None:
+    # 이전 run_selected(commit batch 1): 스레드마다 topic 하나를 처음부터 끝까지
+    from concurrent.futures import ThreadPoolExecutor
+
+    from autodraft.db.session import SessionLocal
+    from autodraft.pipelines.orchestrator import process_topic
+
+    def one(topic_id: str) -> None:
+        db = SessionLocal()
+        try:
+            process_topic(db, llm, topic_id, "use", commit=False)
+            db.commit()
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, topic_ids))
+
+
+def _measure(case: str, n: int, concurrency: int, out: mp.Queue) -> None:
+    from sqlalchemy import func, select
+
+    from autodraft.db.models import Draft
+    from autodraft.db.session import SessionLocal
+    from autodraft.integrations.llm import LLMClient
+    from autodraft.pipelines.orchestrator import run_selected
+
+    topic_ids = _seed(n)
+    llm = LLMClient()
+    db = SessionLocal()
+    rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    if case == "staged":
+        run_selected(db, llm, topic_ids, concurrency=concurrency)
+    else:
+        _unstaged(llm, topic_ids, concurrency)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    drafts = db.scalar(select(func.count()).select_from(Draft)) or 0
+    db.close()
+    out.put({"elapsed_s": elapsed, "peak_kb": peak // 1024, "rss_kb": rss1 - rss0, "drafts": drafts})
+
+
+def measure(case: str, n: int, concurrency: int, env: dict) -> dict:
+    os.environ.update(env)  # spawn한 자식이 settings를 읽을 때 보이도록
+    ctx = mp.get_context("spawn")
+    q = ctx.Queue()
+    p = ctx.Process(target=_measure, args=(case, n, concurrency, q))
+    p.start()
+    res = q.get()
+    p.join()
+    return res
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--topics", default="200,1000", help="topic 수 목록")
+    ap.add_argument("--concurrency", type=int, default=4, help="동시에 LLM을 기다리는 topic 수(draft stage 스레드)")
+    ap.add_argument("--latency-ms", type=float, default=50.0, help="stub LLM 지연")
+    ap.add_argument("--out", default=None, help="결과 JSON 경로(기본: benchmarks/results/)")
+    ap.add_argument("--compare", default=None, help="이전 결과 JSON과 비교")
+    args = ap.parse_args()
+
+    results: dict[str, dict] = {}
+    print(f"{'case':<24} {'topics/s':>9} {'heap peak':>10} {'rss Δ':>9} {'drafts':>7}")
+    for n in [int(x) for x in args.topics.split(",")]:
+        for case in CASES:
+            with tempfile.TemporaryDirectory() as tmp:
+                env = {
+                    "DB_URL": f"sqlite:///{Path(tmp) / 'bench.db'}",
+                    "EXPORT_DIR": str(Path(tmp) / "exports"),
+                    "LLM_PROVIDER": "stub",
+                    "LLM_STUB_LATENCY_MS": str(args.latency_ms),
+                    "LLM_CACHE_ENABLED": "false",
+                }
+                r = measure(case, n, args.concurrency, env)
+            name = f"{case} n={n}"
+            results[name] = summarize([r["elapsed_s"] / n] * n, wall_s=r["elapsed_s"], errors=n - r["drafts"])
+            results[name].update(heap_peak_kb=r["peak_kb"], rss_kb=r["rss_kb"])
+            print(
+                f"{name:<24} {n / r['elapsed_s']:>9.1f} {r['peak_kb'] / 1024:>8.1f}MB"
+                f" {r['rss_kb'] / 1024:>7.1f}MB {r['drafts']:>7}"
+            )
+
+    print(f"\nconcurrency={args.concurrency} latency={args.latency_ms}ms")
+    print_table(results)
+    config = {"topics": args.topics, "concurrency": args.concurrency, "latency_ms": args.latency_ms}
+    path = save_results("pipeline_stages", results, config, args.out)
+    print(f"\nsaved: {path}")
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+risk 채점: 이전 구현(룰마다 re.search) vs RiskMatcher(룰 파일, 룰별 컴파일 정규식 + 매칭 위치).
+먼저 겹치는 금칙어("합격 보장"과 "보장"처럼 한 룰의 매칭이 다른 룰의 매칭을 포함하는 경우)와
+생성한 본문에서 두 점수가 같은지 확인하고(다르면 exit 1), 본문 크기별 시간을 잰다.
+IncrementalRiskScanner(청크 단위)와 score_many(여러 본문을 이어 붙여 한 번에)도 report()와 같은 hit/점수인지 같이 본다.
+
+    PYTHONPATH=src python benchmarks/bench_risk_rules.py --repeat 200
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+
+from autodraft.pipelines.steps.risk_rules import RiskMatcher, RiskRule
+
+
+# ---- 비교 기준: 이전 구현 그대로(룰 파일 대신 같은 RiskRule 목록을 받음) ----
+def legacy_score(rules: list[RiskRule], text: str, short_min_len: int = 600, short_weight: int = 10) -> int:
+    score = 0
+    for rule in rules:
+        alts = ([rule.pattern] if rule.pattern else []) + [re.escape(p) for p in rule.phrases]
+        if alts and re.search("|".join(alts), text):
+            score += rule.weight
+    if len(text) < short_min_len:
+        score += short_weight
+    return min(100, score)
+
+
+# 기본 룰 + 서로 겹치는 금칙어 룰(같은 위치/포함 관계)
+RULES = [
+    RiskRule(id="exaggeration", weight=25, pattern=r"\b100%\b|무조건|확실"),
+    RiskRule(id="misleading_claim", weight=20, pattern=r"합격\s*보장|단기간에"),
+    RiskRule(id="personal_info", weight=40, pattern=r"010-\d{4}-\d{4}|전화번호|주민등록"),
+    RiskRule(id="guarantee", weight=30, pattern="", phrases=("보장", "100% 보장")),
+    RiskRule(id="certainty", weight=5, pattern="", phrases=("확실히", "확실")),
+]
+
+CASES = [
+    "합격 보장",
+    "합격보장 프로그램",
+    "100% 보장합니다",
+    "무조건 확실히 됩니다",
+    "단기간에 합격 보장, 전화번호 남겨주세요",
+    "010-1234-5678 로 연락",
+    "합격" + " " * 200 + "보장 합니다",  # overlap(64)보다 긴 매칭: 게이트(finish)는 전체 본문 기준이라 같아야 함
+    "아무 문제 없는 문장",
+]
+
+WORDS = ["포인터", "개념", "예시", "합격", "보장", "확실", "무조건", "단기간에", "전화번호", "100%", "공부", "정리"]
+# 시간 측정용: 실제 초안처럼 대부분 걸리지 않는 단어
+NEUTRAL = ["포인터", "개념", "예시", "공부", "정리", "문제", "원인", "해결", "메모리", "주소", "변수", "함수"]
+
+
+def gen_text(rng: random.Random, n_words: int, words: list[str] = WORDS) -> str:
+    return " ".join(rng.choice(words) for _ in range(n_words))
+
+
+def check(matcher: RiskMatcher, texts: list[str]) -> int:
+    bad = 0
+    for text in texts:
+        want = legacy_score(RULES, text)
+        report = matcher.report(text)
+        if report.score != want:
+            bad += 1
+            print(f"MISMATCH score legacy={want} matcher={report.score} rules={report.rule_ids} text={text[:60]!r}")
+        scanner = matcher.incremental()
+        for i in range(0, len(text), 7):
+            scanner.feed(text[i : i + 7])
+        inc = scanner.finish()
+        if inc.score != report.score or inc.hits != report.hits:
+            bad += 1
+            print(f"MISMATCH incremental score={inc.score} hits={len(inc.hits)}/{len(report.hits)} text={text[:60]!r}")
+        # 청크 단위(실시간) hit도 overlap보다 짧은 매칭이면 같아야 한다
+        if len(text) < 200 and scanner.hits != report.hits:
+            bad += 1
+            print(f"MISMATCH live hits={len(scanner.hits)}/{len(report.hits)} text={text[:60]!r}")
+    for text, batch in zip(texts, matcher.score_many(texts)):
+        report = matcher.report(text)
+        if batch.score != report.score or batch.hits != report.hits:
+            bad += 1
+            print(f"MISMATCH score_many score={batch.score}/{report.score} text={text[:60]!r}")
+    return bad
+
+
+def bench(fn, text: str, repeat: int) -> float:
+    xs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(text)
+        xs.append(time.perf_counter() - t0)
+    return statistics.median(xs)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=200)
+    ap.add_argument("--random", type=int, default=500, help="검증용 랜덤 본문 수")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    matcher = RiskMatcher(RULES)
+    rng = random.Random(args.seed)
+    texts = CASES + [gen_text(rng, rng.randint(1, 40)) for _ in range(args.random)]
+    bad = check(matcher, texts)
+    print(f"checked {len(texts)} texts: {bad} mismatches")
+
+    # legacy는 점수만(첫 매칭에서 멈춤), matcher는 점수 + 모든 hit 위치
+    print(f"\n{'size':>8} {'legacy':>10} {'matcher':>10}")
+    for n_words in (100, 1000, 10000):
+        text = gen_text(rng, n_words, NEUTRAL) + " 합격 보장 확실히"
+        t_legacy = bench(lambda t: legacy_score(RULES, t), text, args.repeat)
+        t_new = bench(matcher.report, text, args.repeat)
+        print(f"{len(text):>8} {t_legacy * 1e6:>8.1f}us {t_new * 1e6:>8.1f}us")
+
+    # 재채점처럼 짧은 본문 여러 개: 본문마다 report() vs score_many 한 번
+    batch = [gen_text(rng, 300, NEUTRAL) + " 합격 보장" for _ in range(500)]
+    t_each = bench(lambda b: [matcher.report(t) for t in b], batch, max(1, args.repeat // 20))
+    t_many = bench(matcher.score_many, batch, max(1, args.repeat // 20))
+    print(f"\nbatch of {len(batch)}: report each {t_each * 1e3:.2f}ms, score_many {t_many * 1e3:.2f}ms")
+    if bad:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
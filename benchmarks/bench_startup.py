@@ -0,0 +1,167 @@
+"""
+콜드 스타트 측정: `import autodraft.main`(앱 생성 포함) 시간과 uvicorn 워커 기동 → 첫 요청 지연.
+매 회 새 프로세스로 측정한다(임시 DB는 미리 migrate).
+
+    PYTHONPATH=src python benchmarks/bench_startup.py --runs 10
+    # 회귀 감시: 기준을 넘으면 exit 1
+    PYTHONPATH=src python benchmarks/bench_startup.py --max-import-ms 1500 --max-ready-ms 3000
+    PYTHONPATH=src python benchmarks/bench_startup.py --compare benchmarks/results/startup-<rev>-<ts>.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _common import compare, print_table, save_results, summarize  # noqa: E402
+
+TOKEN = "bench-token"
+# 기동 경로에서 import되면 안 되는(첫 사용 때 읽는) 무거운 모듈
+LAZY_MODULES = ("openai", "httpx")
+
+_IMPORT_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import autodraft.main
+t1 = time.perf_counter()
+print(json.dumps({"import_s": t1 - t0, "loaded": [m for m in %r if m in sys.modules]}))
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def get(url: str, timeout: float = 5.0) -> int:
+    req = urllib.request.Request(url, headers={"X-DEMO-TOKEN": TOKEN})
+    with urllib.request.urlopen(req, timeout=timeout) as r:
+        r.read()
+        return r.status
+
+
+def measure_import(env: dict) -> tuple[float, float, list[str]]:
+    t0 = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE % (LAZY_MODULES,)], env=env, capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - t0
+    doc = json.loads(out.stdout.strip().splitlines()[-1])
+    return doc["import_s"], wall, doc["loaded"]
+
+
+def measure_server(env: dict, timeout_s: float) -> tuple[float, float, float]:
+    """
+    (기동→/health 첫 200까지, 첫 DB 요청, 두 번째 같은 요청) 초.
+    """
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "autodraft.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"server exited: {proc.stderr.read().decode(errors='replace')[-2000:]}")
+            try:
+                if get(f"{base}/health", timeout=0.5) == 200:
+                    break
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                pass
+            if time.perf_counter() - t0 > timeout_s:
+                raise TimeoutError(f"server not ready in {timeout_s}s")
+            time.sleep(0.005)
+        ready = time.perf_counter() - t0
+
+        def timed_get(path: str) -> float:
+            t = time.perf_counter()
+            get(base + path)
+            return time.perf_counter() - t
+
+        first = timed_get("/topics?limit=1")
+        second = timed_get("/topics?limit=1")
+        return ready, first, second
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=10)
+    ap.add_argument("--provider", default="stub", help="LLM_PROVIDER(openai면 SDK가 기동 경로에 없는지 확인)")
+    ap.add_argument("--timeout-s", type=float, default=30.0)
+    ap.add_argument("--max-import-ms", type=float, default=None, help="import p50이 넘으면 exit 1")
+    ap.add_argument("--max-ready-ms", type=float, default=None, help="기동→첫 응답 p50이 넘으면 exit 1")
+    ap.add_argument("--out", default=None, help="결과 JSON 경로(기본: benchmarks/results/)")
+    ap.add_argument("--compare", default=None, help="이전 결과 JSON과 비교")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DB_URL": f"sqlite:///{Path(tmp) / 'bench.db'}",
+            "EXPORT_DIR": str(Path(tmp) / "exports"),
+            "DEMO_API_TOKEN": TOKEN,
+            "LLM_PROVIDER": args.provider,
+            "DB_AUTO_MIGRATE": "false",
+        }
+        subprocess.run([sys.executable, "-m", "autodraft.cli.migrate"], env=env, check=True, capture_output=True)
+
+        samples: dict[str, list[float]] = {
+            "import autodraft.main": [],
+            "process (interpreter + import)": [],
+            "spawn -> first /health": [],
+            "first GET /topics": [],
+            "second GET /topics": [],
+        }
+        loaded: set[str] = set()
+        for _ in range(args.runs):
+            imp, wall, mods = measure_import(env)
+            samples["import autodraft.main"].append(imp)
+            samples["process (interpreter + import)"].append(wall)
+            loaded.update(mods)
+            ready, first, second = measure_server(env, args.timeout_s)
+            samples["spawn -> first /health"].append(ready)
+            samples["first GET /topics"].append(first)
+            samples["second GET /topics"].append(second)
+
+    results = {name: summarize(xs) for name, xs in samples.items()}
+    print(f"runs={args.runs} provider={args.provider}")
+    print_table(results)
+    print(f"heavy modules imported at startup: {sorted(loaded) or 'none'} (expected none of {list(LAZY_MODULES)})")
+
+    config = {"runs": args.runs, "provider": args.provider}
+    path = save_results("startup", results, config, args.out)
+    print(f"\nsaved: {path}")
+    if args.compare:
+        compare(args.compare, results)
+
+    failed = []
+    if args.max_import_ms is not None and results["import autodraft.main"]["p50_ms"] > args.max_import_ms:
+        failed.append(f"import p50 {results['import autodraft.main']['p50_ms']:.0f}ms > {args.max_import_ms:.0f}ms")
+    if args.max_ready_ms is not None and results["spawn -> first /health"]["p50_ms"] > args.max_ready_ms:
+        failed.append(f"ready p50 {results['spawn -> first /health']['p50_ms']:.0f}ms > {args.max_ready_ms:.0f}ms")
+    if loaded:
+        failed.append(f"lazy modules imported at startup: {sorted(loaded)}")
+    if failed:
+        print("REGRESSION: " + "; ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+독립 워커(python -m autodraft.worker) 프로세스 수에 따른 처리량: 같은 임시 SQLite DB에 topic --topics개를 넣고
+워커 N개를 띄워 모두 폴링을 시작한 뒤 한 번에 SELECTED로 바꾸고, 전부 DONE이 될 때까지의 시간(프로세스 기동 시간 제외).
+끝나면 topic당 초안이 하나뿐인지(중복 claim 없음) 확인한다.
+
+    PYTHONPATH=src python benchmarks/bench_workers.py --topics 200 --procs 1,2,4 --latency-ms 200
+    PYTHONPATH=src python benchmarks/bench_workers.py --compare benchmarks/results/workers-<rev>-<ts>.json
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from autodraft.db.migrations import migrate
+from autodraft.db.models import Draft, Topic
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _common import compare, print_table, save_results, summarize  # noqa: E402
+
+
+def seed(db_url: str, n: int) -> None:
+    engine = create_engine(db_url, future=True)
+    migrate(engine)
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": f"t_{i:08d}",
+            "pillar": "학습법",
+            "audience": "학생-초급",
+            "title": f"벤치마크 토픽 {i}",
+            "angle": "문제→원인→해결",
+            "score": 50,
+            "status": "NEW",
+            "created_at": now + timedelta(microseconds=i),
+            "updated_at": now,
+        }
+        for i in range(n)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Topic.__table__), rows)
+    engine.dispose()
+
+
+def check(db_url: str) -> tuple[dict[str, int], int, int]:
+    """
+    (topic 상태별 수, 초안 수, 초안이 2개 이상인 topic 수)
+    """
+    engine = create_engine(db_url, future=True)
+    with Session(engine) as db:
+        statuses = dict(db.execute(select(Topic.status, func.count()).group_by(Topic.status)).all())
+        drafts = db.scalar(select(func.count()).select_from(Draft)) or 0
+        dup = select(Draft.topic_id).group_by(Draft.topic_id).having(func.count() > 1).subquery()
+        dups = db.scalar(select(func.count()).select_from(dup)) or 0
+    engine.dispose()
+    return statuses, drafts, dups
+
+
+def run_workers(env: dict, db_url: str, topics: int, procs: int, concurrency: int, timeout_s: float) -> float:
+    cmd = [sys.executable, "-m", "autodraft.worker", "--concurrency", str(concurrency), "--poll-s", "0.05"]
+    workers = [subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) for _ in range(procs)]
+    engine = create_engine(db_url, future=True)
+    try:
+        # 기동 로그("... started")가 다 나올 때까지 기다린 뒤 시작
+        for p in workers:
+            line = p.stderr.readline().decode(errors="replace")
+            if "started" not in line:
+                raise RuntimeError(f"worker failed to start: {line}{p.stderr.read().decode(errors='replace')[-2000:]}")
+        with engine.begin() as conn:
+            conn.execute(update(Topic.__table__).values(status="SELECTED"))
+        t0 = time.perf_counter()
+        while True:
+            with engine.connect() as conn:
+                done = conn.scalar(select(func.count()).select_from(Topic).where(Topic.status.in_(("DONE", "ERROR"))))
+            if done >= topics:
+                return time.perf_counter() - t0
+            if time.perf_counter() - t0 > timeout_s:
+                raise TimeoutError(f"{done}/{topics} topics finished in {timeout_s}s")
+            time.sleep(0.01)
+    finally:
+        engine.dispose()
+        for p in workers:
+            p.terminate()
+        for p in workers:
+            p.wait(timeout=30)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--topics", type=int, default=200)
+    ap.add_argument("--procs", default="1,2,4", help="워커 프로세스 수 목록")
+    ap.add_argument("--concurrency", type=int, default=4, help="프로세스당 동시 처리 topic 수")
+    ap.add_argument("--latency-ms", type=float, default=200.0, help="stub LLM 지연")
+    ap.add_argument("--timeout-s", type=float, default=300.0)
+    ap.add_argument("--out", default=None, help="결과 JSON 경로(기본: benchmarks/results/)")
+    ap.add_argument("--compare", default=None, help="이전 결과 JSON과 비교")
+    args = ap.parse_args()
+
+    results: dict[str, dict] = {}
+    failed = False
+    for procs in [int(x) for x in args.procs.split(",")]:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+            seed(db_url, args.topics)
+            env = {
+                **os.environ,
+                "DB_URL": db_url,
+                "EXPORT_DIR": str(Path(tmp) / "exports"),
+                "LLM_PROVIDER": "stub",
+                "LLM_STUB_LATENCY_MS": str(args.latency_ms),
+                "LLM_CACHE_ENABLED": "false",
+                "DB_AUTO_MIGRATE": "false",
+            }
+            wall = run_workers(env, db_url, args.topics, procs, args.concurrency, args.timeout_s)
+            statuses, drafts, dups = check(db_url)
+        name = f"procs={procs} x{args.concurrency}"
+        # topic당 샘플 = 평균 처리 간격(wall/topics). 처리량은 wall 기준
+        results[name] = summarize([wall / args.topics] * args.topics, wall_s=wall, errors=args.topics - statuses.get("DONE", 0))
+        print(f"{name}: wall={wall:.2f}s statuses={statuses} drafts={drafts} duplicated_topics={dups}")
+        failed |= dups > 0 or drafts != args.topics
+
+    print(f"\ntopics={args.topics} latency={args.latency_ms}ms")
+    print_table(results)
+    config = {"topics": args.topics, "procs": args.procs, "concurrency": args.concurrency, "latency_ms": args.latency_ms}
+    path = save_results("workers", results, config, args.out)
+    print(f"\nsaved: {path}")
+    if args.compare:
+        compare(args.compare, results)
+    if failed:
+        print("FAILED: duplicated or missing drafts")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
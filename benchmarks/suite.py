@@ -0,0 +1,240 @@
+"""
+AutoDraft 벤치마크 스위트.
+- e2e: 실제 FastAPI 앱(TestClient)으로 POST /topics/generate → POST /pipeline/run_selected 반복
+  (LLM은 stub provider + 지연/실패 주입)
+- step: 파이프라인 stage별 지연(llm 호출, draft, quality gate, export, status 저장, topic lease claim)
+- micro: md_to_basic_html, calc_risk_score, repo 쓰기
+
+결과는 p50/p95/p99 + 처리량을 출력하고 JSON으로 저장한다(커밋 간 비교용).
+
+    PYTHONPATH=src python benchmarks/suite.py --iterations 10 --topics 10 \\
+        --latency-ms 200 --jitter-ms 100 --dist lognormal --failure-rate 0.02
+    PYTHONPATH=src python benchmarks/suite.py --compare benchmarks/results/suite-<rev>-<ts>.json
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _common import compare, print_table, save_results, summarize  # noqa: E402
+
+TOKEN = "bench-token"
+
+
+class Recorder:
+    """
+    이름별 소요 시간(초)/에러 수 수집. 여러 스레드에서 불려도 됨.
+    """
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float, ok: bool = True) -> None:
+        with self._lock:
+            self.samples[name].append(seconds)
+            if not ok:
+                self.errors[name] += 1
+
+    def wrap(self, name: str, fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            t0 = time.perf_counter()
+            ok = False
+            try:
+                out = fn(*args, **kwargs)
+                ok = True
+                return out
+            finally:
+                self.add(name, time.perf_counter() - t0, ok)
+
+        return inner
+
+    def summary(self, prefix: str, wall: dict[str, float] | None = None) -> dict:
+        wall = wall or {}
+        return {
+            f"{prefix} {name}": summarize(xs, wall_s=wall.get(name), errors=self.errors[name])
+            for name, xs in self.samples.items()
+        }
+
+
+def configure_env(args, tmp: Path) -> None:
+    # autodraft는 import 시점에 settings/engine을 만들므로 import 전에 환경변수 설정
+    os.environ.update(
+        {
+            "DB_URL": f"sqlite:///{tmp / 'bench.db'}",
+            "EXPORT_DIR": str(tmp / "exports"),
+            "DEMO_API_TOKEN": TOKEN,
+            "DB_AUTO_MIGRATE": "true",  # 임시 DB라 서버 시작 시 스키마 생성
+            "LLM_PROVIDER": "stub",
+            "LLM_STUB_LATENCY_MS": str(args.latency_ms),
+            "LLM_STUB_JITTER_MS": str(args.jitter_ms),
+            "LLM_STUB_LATENCY_DIST": args.dist,
+            "LLM_STUB_FAILURE_RATE": str(args.failure_rate),
+            "LLM_STUB_SEED": str(args.seed),
+            "PIPELINE_CONCURRENCY": str(args.concurrency),
+            # stub 토픽은 템플릿 4개의 반복이라 중복 제거를 켜면 반복마다 실행할 topic이 줄어든다
+            "TOPIC_DEDUPE_ENABLED": "false",
+        }
+    )
+
+
+def instrument(rec: Recorder) -> None:
+    """
+    step 함수들을 타이밍 래퍼로 교체. run_selected는 등록된 stage(pipelines/stages.py)를 돌리므로
+    stage 함수를 같은 자리에 래퍼로 다시 등록한다(이름은 stage span: generate_draft, apply_quality_gate, ...).
+    status stage는 묶음 저장(_save_items, draft/exports/topic 상태 + commit) 한 번을 잰다.
+    """
+    from autodraft.db.repos import TopicRepo
+    from autodraft.integrations.llm import LLMClient
+    from autodraft.pipelines import orchestrator
+    from autodraft.pipelines.stages import register_stage, stages
+
+    LLMClient.generate_draft = rec.wrap("llm.generate_draft", LLMClient.generate_draft)
+    for stage in stages():
+        register_stage(stage.name, workers=stage.workers, span=stage.span)(rec.wrap(stage.span, stage.fn))
+    orchestrator._save_items = rec.wrap("status(save_items)", orchestrator._save_items)
+    TopicRepo.claim_topics = staticmethod(rec.wrap("TopicRepo.claim_topics", TopicRepo.claim_topics))
+
+
+def run_e2e(args, rec: Recorder) -> dict[str, float]:
+    from fastapi.testclient import TestClient
+
+    from autodraft.main import create_app
+
+    headers = {"X-DEMO-TOKEN": TOKEN}
+
+    def call(c: TestClient, name: str, url: str, body: dict) -> dict | None:
+        t0 = time.perf_counter()
+        r = c.post(url, json=body, headers=headers)
+        rec.add(name, time.perf_counter() - t0, ok=r.status_code == 200)
+        return r.json() if r.status_code == 200 else None
+
+    def one_iteration(c: TestClient, i: int) -> None:
+        topics = call(
+            c,
+            "POST /topics/generate",
+            "/topics/generate",
+            {"pillar": f"벤치-{i % 5}", "audience": "학생-초급", "n": args.topics, "cache": "bypass"},
+        )
+        if not topics:
+            return
+        ids = [x["topic_id"] for x in topics["items"]]
+        call(c, "POST /pipeline/run_selected", "/pipeline/run_selected", {"topic_ids": ids, "cache": "bypass"})
+
+    t0 = time.perf_counter()
+    # 주입된 stub 실패는 500으로 받아 에러 카운트에 반영
+    with TestClient(create_app(), raise_server_exceptions=False) as c:
+        with ThreadPoolExecutor(max_workers=args.clients) as pool:
+            list(pool.map(lambda i: one_iteration(c, i), range(args.iterations)))
+    wall = time.perf_counter() - t0
+    return {"POST /topics/generate": wall, "POST /pipeline/run_selected": wall}
+
+
+def run_micro(args) -> dict:
+    from autodraft.db.models import Draft, Topic
+    from autodraft.db.repos import DraftRepo, TopicRepo
+    from autodraft.db.session import SessionLocal
+    from autodraft.integrations.llm import LLMClient
+    from autodraft.pipelines.steps.export import md_to_basic_html
+    from autodraft.pipelines.steps.quality_gate import calc_risk_score
+    from autodraft.pipelines.steps.topic_index import TopicIndex
+
+    rec = Recorder()
+    stub = LLMClient()._stub_draft("벤치마크 제목", "문제→원인→해결", "학습법", "학생-초급").content_md
+    large = stub * 200
+
+    def loop(name: str, fn, n: int) -> None:
+        for _ in range(n):
+            t0 = time.perf_counter()
+            fn()
+            rec.add(name, time.perf_counter() - t0)
+
+    loop("md_to_basic_html(stub)", lambda: md_to_basic_html(stub), args.micro_repeat * 10)
+    loop("md_to_basic_html(large)", lambda: md_to_basic_html(large), args.micro_repeat)
+    loop("calc_risk_score(stub)", lambda: calc_risk_score(stub), args.micro_repeat * 10)
+    loop("calc_risk_score(large)", lambda: calc_risk_score(large), args.micro_repeat)
+
+    def new_topic() -> Topic:
+        return Topic(
+            id=f"t_{uuid.uuid4().hex[:10]}", pillar="벤치", audience="학생", title="micro",
+            angle="-", score=50, status="NEW", created_at=datetime.utcnow(),
+        )
+
+    def new_draft(topic_id: str) -> Draft:
+        return Draft(
+            id=f"d_{uuid.uuid4().hex[:10]}", topic_id=topic_id, title="micro", content_md=stub,
+            summary="-", risk_score=0, status="DRAFTED", export_html_ref="", last_error=None,
+            updated_at=datetime.utcnow(),
+        )
+
+    # 근사 중복 인덱스: 토픽 10k개 기준 조회(서명 계산 + LSH 후보 비교)
+    index = TopicIndex()
+    for i in range(10_000):
+        index.add(f"t_{i}", f"{i}번째 주제로 알아보는 학습 루틴 {i * 7919 % 10007}")
+    loop("TopicIndex.query(10k)", lambda: index.query("포인터가 헷갈리는 진짜 이유 3가지", 0.7),
+         args.micro_repeat * 10)
+
+    with SessionLocal() as db:
+        loop("TopicRepo.create", lambda: TopicRepo.create(db, new_topic()), args.micro_repeat)
+        loop("TopicRepo.bulk_create(50)", lambda: TopicRepo.bulk_create(db, [new_topic() for _ in range(50)]),
+             args.micro_repeat)
+        loop("DraftRepo.create", lambda: DraftRepo.create(db, new_draft("t_micro")), args.micro_repeat)
+
+    return rec.summary("micro")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="AutoDraft benchmark suite")
+    ap.add_argument("--iterations", type=int, default=10, help="generate→run_selected 반복 횟수")
+    ap.add_argument("--topics", type=int, default=10, help="반복마다 생성/실행할 topic 수")
+    ap.add_argument("--clients", type=int, default=1, help="동시 요청 클라이언트 수")
+    ap.add_argument("--concurrency", type=int, default=4, help="PIPELINE_CONCURRENCY")
+    ap.add_argument("--latency-ms", type=float, default=50.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--dist", choices=("fixed", "uniform", "exp", "lognormal"), default="fixed")
+    ap.add_argument("--failure-rate", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=1234)
+    ap.add_argument("--micro-repeat", type=int, default=50)
+    ap.add_argument("--skip-e2e", action="store_true")
+    ap.add_argument("--skip-micro", action="store_true")
+    ap.add_argument("--out", help="결과 JSON 경로(기본: benchmarks/results/suite-<rev>-<ts>.json)")
+    ap.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        configure_env(args, Path(tmp))
+        results: dict = {}
+
+        if not args.skip_e2e:
+            http, steps = Recorder(), Recorder()
+            instrument(steps)
+            wall = run_e2e(args, http)
+            results.update(http.summary("e2e", wall))
+            results.update(steps.summary("step"))
+
+        if not args.skip_micro:
+            results.update(run_micro(args))
+
+    print_table(results)
+    config = {k: v for k, v in vars(args).items() if k not in ("out", "compare")}
+    path = save_results("suite", results, config, args.out)
+    print(f"\nsaved: {path}")
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
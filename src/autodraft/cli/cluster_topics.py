@@ -0,0 +1,85 @@
+"""
+topics 테이블 전체를 제목 근사 중복(MinHash/LSH) 기준으로 묶어서 출력.
+
+    python -m autodraft.cli.cluster_topics                  # 중복 묶음만 출력(dry-run)
+    python -m autodraft.cli.cluster_topics --threshold 0.6  # 더 느슨하게
+    python -m autodraft.cli.cluster_topics --apply          # 대표가 아닌 NEW 토픽을 DUPLICATE로 표시
+
+묶음마다 대표(score 높은 순, 같으면 먼저 만든 것)를 남기고 나머지는 대표의 중복으로 본다.
+"""
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import select
+
+from autodraft.db.models import Topic
+from autodraft.db.repos import TopicRepo
+from autodraft.db.session import SessionLocal
+from autodraft.pipelines.steps.topic_index import build_index
+from autodraft.settings import settings
+
+# 이미 선택/처리된 토픽은 중복이어도 건드리지 않음
+MARKABLE = ("NEW",)
+
+
+def _find(parent: dict[str, str], x: str) -> str:
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Cluster near-duplicate topics")
+    ap.add_argument("--threshold", type=float, default=settings.topic_dedupe_threshold)
+    ap.add_argument("--apply", action="store_true", help="대표가 아닌 NEW 토픽의 status를 DUPLICATE로 변경")
+    ap.add_argument("--show", type=int, default=20, help="출력할 묶음 수(큰 순)")
+    args = ap.parse_args()
+
+    db = SessionLocal()
+    try:
+        rows = {r.id: r for r in db.execute(select(Topic.id, Topic.title, Topic.score, Topic.status, Topic.created_at))}
+        index = build_index(db)
+
+        # LSH 후보 중 threshold 이상인 쌍을 union-find로 묶음(전이적으로 이어진 것도 한 묶음)
+        parent = {topic_id: topic_id for topic_id in rows}
+        for topic_id, r in rows.items():
+            for m in index.query(r.title, args.threshold):
+                if m.topic_id != topic_id and m.topic_id in parent:
+                    a, b = _find(parent, topic_id), _find(parent, m.topic_id)
+                    if a != b:
+                        parent[b] = a
+
+        clusters: dict[str, list] = {}
+        for topic_id in rows:
+            clusters.setdefault(_find(parent, topic_id), []).append(rows[topic_id])
+        groups = [
+            sorted(members, key=lambda r: (-r.score, r.created_at, r.id))
+            for members in clusters.values()
+            if len(members) > 1
+        ]
+        groups.sort(key=len, reverse=True)
+
+        dup_ids = [r.id for g in groups for r in g[1:] if r.status in MARKABLE]
+        if args.apply and dup_ids:
+            TopicRepo.set_status_many(db, dup_ids, "DUPLICATE")
+            db.commit()
+    finally:
+        db.close()
+
+    for g in groups[: args.show]:
+        head = g[0]
+        print(f"[{len(g)}] {head.id} {head.title}")
+        for r in g[1:]:
+            print(f"      {r.id} ({r.status}) {r.title}")
+
+    mode = "applied" if args.apply else "dry-run"
+    print(
+        f"topics={len(rows)} clusters={len(groups)} duplicates={sum(len(g) - 1 for g in groups)} "
+        f"marked={len(dup_ids)} threshold={args.threshold} ({mode})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+DB 스키마를 최신 버전으로 올린다(배포/첫 실행 전에 한 번). 서버는 시작할 때 버전만 확인한다.
+
+    python -m autodraft.cli.migrate            # 아직 적용 안 된 migration 적용
+    python -m autodraft.cli.migrate --check    # 적용 없이 현재/최신 버전만 출력(뒤처져 있으면 exit 1)
+    python -m autodraft.cli.migrate --dry-run  # SQLite 파일 사본에 적용해보고 모델과 다른 곳이 있으면 exit 1(원본은 그대로)
+"""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+
+from autodraft.db.migrations import LATEST_VERSION, MIGRATIONS, current_version, migrate, schema_drift
+from autodraft.db.session import engine
+from autodraft.settings import settings
+
+
+def _apply(target: Engine) -> None:
+    with target.connect() as conn:
+        before = current_version(conn)
+    applied = migrate(target)
+    descriptions = {m.version: m.description for m in MIGRATIONS}
+    for version in applied:
+        print(f"applied {version}: {descriptions[version]}")
+    print(f"schema version {before} -> {max([before, *applied])} (latest {LATEST_VERSION})")
+
+
+def dry_run(db_url: str) -> list[str]:
+    """
+    SQLite DB 파일을 임시 사본으로 떠서 migrate하고 schema_drift 결과를 돌려준다.
+    """
+    url = make_url(db_url)
+    if url.get_backend_name() != "sqlite" or not url.database or url.database == ":memory:":
+        raise SystemExit("--dry-run needs a SQLite file DB_URL")
+    with tempfile.TemporaryDirectory() as tmp:
+        copy = Path(tmp) / "dry_run.db"
+        src, dst = sqlite3.connect(url.database), sqlite3.connect(copy)
+        try:
+            src.backup(dst)  # WAL에 남은 내용까지 일관된 사본
+        finally:
+            src.close()
+            dst.close()
+        target = create_engine(f"sqlite:///{copy}", future=True)
+        try:
+            _apply(target)
+            with target.connect() as conn:
+                return schema_drift(conn)
+        finally:
+            target.dispose()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Apply pending schema migrations")
+    ap.add_argument("--check", action="store_true", help="적용하지 않고 버전만 확인")
+    ap.add_argument("--dry-run", action="store_true", help="SQLite 사본에 적용해보고 모델과 비교(원본은 그대로)")
+    args = ap.parse_args()
+
+    if args.dry_run:
+        missing = dry_run(settings.db_url)
+        for item in missing:
+            print(f"missing {item}")
+        sys.exit(1 if missing else 0)
+
+    with engine.connect() as conn:
+        before = current_version(conn)
+    if args.check:
+        print(f"schema version {before} (latest {LATEST_VERSION})")
+        sys.exit(0 if before >= LATEST_VERSION else 1)
+
+    _apply(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+exports 디렉토리를 한 번 훑어 exports 인덱스 테이블을 다시 맞춘다.
+- 디스크에 있는 .html 파일을 가리키는 인덱스 행 갱신(크기/해시/mtime, path 인덱스로 조회)
+- 인덱스 행이 없는 draft 중 디스크에 있는 파일을 가리키는 것은 행 추가(drafts를 PK 순으로 한 번 훑음)
+- 디스크에 없는 파일을 가리키는 인덱스 행 삭제
+
+    python -m autodraft.cli.reconcile_exports            # 결과만 출력(dry-run)
+    python -m autodraft.cli.reconcile_exports --apply
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+from datetime import datetime
+from pathlib import Path
+
+from autodraft.db.models import ExportEntry
+from autodraft.db.repos import ExportRepo
+from autodraft.db.session import SessionLocal
+from autodraft.settings import settings
+
+_CHUNK = 500
+
+
+def _file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Rebuild the exports index from the export directory")
+    ap.add_argument("--apply", action="store_true", help="인덱스 테이블에 반영")
+    args = ap.parse_args()
+
+    export_dir = Path(settings.export_dir)
+    on_disk: dict[str, os.DirEntry] = {}
+    if export_dir.exists():
+        with os.scandir(export_dir) as it:
+            for e in it:
+                if e.is_file() and e.name.endswith(".html") and not e.name.startswith("."):
+                    on_disk[f"/exports/{e.name}"] = e
+
+    db = SessionLocal()
+    upserted = 0
+    hashes: dict[str, str] = {}
+
+    def entry_for(draft_id: str, ref: str) -> ExportEntry:
+        e = on_disk[ref]
+        if ref not in hashes:
+            hashes[ref] = _file_sha256(e.path)
+        st = e.stat()
+        return ExportEntry(
+            draft_id=draft_id,
+            path=ref,
+            size_bytes=st.st_size,
+            content_hash=hashes[ref],
+            created_at=datetime.utcfromtimestamp(st.st_mtime),
+        )
+
+    try:
+        # 1) 이미 있는 인덱스 행 갱신: 파일 경로로 exports 조회(ix_exports_path)
+        refs = list(on_disk)
+        for i in range(0, len(refs), _CHUNK):
+            for row in ExportRepo.by_paths(db, refs[i : i + _CHUNK]):
+                ExportRepo.upsert(db, entry_for(row.draft_id, row.path))
+                upserted += 1
+        # 2) 인덱스 행이 없는 draft(인덱스 도입 전 등) 채우기: drafts를 PK 순으로 한 번만 훑는다
+        after = ""
+        while True:
+            rows = ExportRepo.unindexed_drafts(db, after, _CHUNK)
+            if not rows:
+                break
+            after = rows[-1][0]
+            for draft_id, ref in rows:
+                if ref in on_disk:
+                    ExportRepo.upsert(db, entry_for(draft_id, ref))
+                    upserted += 1
+        removed = ExportRepo.delete_missing(db, set(on_disk))
+
+        if args.apply:
+            db.commit()
+        else:
+            db.rollback()
+    finally:
+        db.close()
+
+    mode = "applied" if args.apply else "dry-run"
+    print(f"files={len(on_disk)} upserted={upserted} removed={removed} ({mode})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+drafts 테이블 전체를 현재 룰 파일로 다시 채점.
+
+    python -m autodraft.cli.rescore_drafts            # 바뀔 건수만 출력(dry-run)
+    python -m autodraft.cli.rescore_drafts --apply    # risk_score/status 갱신
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+
+from sqlalchemy import select, update
+
+from autodraft.db.codec import decode_body
+from autodraft.db.models import Draft
+from autodraft.db.session import SessionLocal
+from autodraft.pipelines.steps.quality_gate import review_status, rule_set, score_many
+
+# 채점 대상(FAILED/DRAFTED 등 중간 상태는 건드리지 않음)
+RESCORABLE = ("EXPORTED", "NEEDS_REVIEW")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Re-score drafts with the current risk rules")
+    ap.add_argument("--apply", action="store_true", help="변경 사항을 DB에 기록")
+    ap.add_argument("--batch", type=int, default=500)
+    ap.add_argument("--threshold", type=int, default=30)
+    args = ap.parse_args()
+
+    matcher = rule_set.get()
+    scanned = changed = 0
+    db = SessionLocal()
+    try:
+        # id 기준 keyset 페이지마다 읽고 → 채점 → 갱신 → commit. 열린 커서 아래에서 UPDATE하지 않고
+        # 배치마다 트랜잭션을 끝내므로 긴 실행 중에도 쓰기 잠금을 오래 잡지 않는다
+        last = ""
+        while True:
+            rows = db.execute(
+                select(Draft.id, Draft.content_blob, Draft.risk_score, Draft.status)
+                .where(Draft.status.in_(RESCORABLE), Draft.id > last)
+                .order_by(Draft.id)
+                .limit(args.batch)
+            ).all()
+            if not rows:
+                break
+            last = rows[-1].id
+            reports = score_many([decode_body(r.content_blob) for r in rows])
+            now = datetime.utcnow()
+            updates = []
+            for r, rep in zip(rows, reports):
+                status = review_status(rep.score, args.threshold)
+                if rep.score != r.risk_score or status != r.status:
+                    updates.append({"id": r.id, "risk_score": rep.score, "status": status, "updated_at": now})
+            scanned += len(rows)
+            changed += len(updates)
+            if args.apply and updates:
+                # PK 기준 ORM bulk UPDATE(executemany)
+                db.execute(update(Draft), updates)
+                db.commit()
+            else:
+                db.rollback()  # 읽기 트랜잭션도 배치마다 끝낸다
+    finally:
+        db.close()
+
+    mode = "applied" if args.apply else "dry-run"
+    print(f"rules v{matcher.version}: scanned={scanned} changed={changed} ({mode})")
+
+
+if __name__ == "__main__":
+    main()
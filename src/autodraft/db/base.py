@@ -1,7 +1,25 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import DeclarativeBase
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.orm import DeclarativeBase, Session
 
 
 class Base(DeclarativeBase):
     pass
+
+
+@event.listens_for(Session, "before_flush")
+def _touch_updated_at(session: Session, flush_context, instances) -> None:
+    """
+    updated_at 컬럼이 있는 객체는 새로 추가되거나 바뀐 경우 flush 시점(≈ commit 직전)으로 맞춘다.
+    step 중간에 찍은 시각이 아니라 commit 시각에 가까워야 /sync/changes 커서가 늦게 commit된 행을 건너뛰지 않는다.
+    """
+    now = datetime.utcnow()
+    for obj in session.new:
+        if "updated_at" in type(obj).__mapper__.columns:
+            obj.updated_at = now
+    for obj in session.dirty:
+        if "updated_at" in type(obj).__mapper__.columns and session.is_modified(obj, include_collections=False):
+            obj.updated_at = now
@@ -0,0 +1,57 @@
+"""
+drafts.content_blob 본문 인코딩. 첫 바이트가 형식 표시(marker)이고 나머지가 payload다.
+
+    b"R" + utf-8 원문        (짧거나 압축해도 줄지 않는 본문)
+    b"Z" + zlib
+    b"S" + zstd              (zstandard 설치 시)
+
+marker가 행마다 붙어 있어서 DRAFT_BODY_CODEC을 바꿔도 기존 행은 그대로 읽힌다.
+"""
+from __future__ import annotations
+
+import zlib
+
+from autodraft.settings import settings
+
+try:  # zstandard는 선택 의존성(없으면 zstd 설정이어도 zlib으로 저장)
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+RAW = b"R"
+ZLIB = b"Z"
+ZSTD = b"S"
+
+
+def _compress(data: bytes, codec: str, level: int) -> bytes | None:
+    if codec == "zstd" and zstandard is not None:
+        return ZSTD + zstandard.ZstdCompressor(level=level).compress(data)
+    if codec in ("zstd", "zlib"):
+        return ZLIB + zlib.compress(data, min(level, 9))
+    return None
+
+
+def encode_body(text: str, codec: str | None = None, level: int | None = None) -> bytes:
+    """
+    본문 → marker + payload. 압축해도 줄지 않거나 draft_body_min_bytes보다 짧으면 원문(R).
+    """
+    data = text.encode("utf-8")
+    codec = codec or settings.draft_body_codec
+    if len(data) >= settings.draft_body_min_bytes:
+        packed = _compress(data, codec, settings.draft_body_level if level is None else level)
+        if packed is not None and len(packed) < len(data) + 1:
+            return packed
+    return RAW + data
+
+
+def decode_body(blob: bytes) -> str:
+    marker, payload = blob[:1], blob[1:]
+    if marker == RAW:
+        return payload.decode("utf-8")
+    if marker == ZLIB:
+        return zlib.decompress(payload).decode("utf-8")
+    if marker == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("draft body is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload).decode("utf-8")
+    raise ValueError(f"Unknown draft body format: {marker!r}")
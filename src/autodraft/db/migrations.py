@@ -0,0 +1,204 @@
+"""
+스키마 버전 관리(가벼운 자체 migration). schema_version 테이블에 적용한 버전을 기록하고,
+migrate()가 아직 적용하지 않은 것만 순서대로 실행한다.
+
+- 1번(baseline)은 현재 모델 기준 create_all이라 새 DB에는 이후 변경이 이미 들어가 있다.
+  그래서 2번부터는 "없으면 추가" 형태로 쓴다(기존 DB/새 DB 모두에서 같은 결과).
+- 새 변경은 MIGRATIONS 끝에 버전을 하나 올려서 추가한다(적용된 것은 고치지 않음).
+- 인덱스는 모델에서 읽지 않고 migration마다 이름/컬럼을 그대로 적는다. 모델의 최신 인덱스가
+  아직 없는 컬럼(이후 migration에서 추가)을 가리킬 수 있어서.
+- 적용은 배포 단계에서 `python -m autodraft.cli.migrate`로 한 번. 서버는 시작할 때 check_version()으로 버전만 확인한다.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, MetaData, String, Table, bindparam, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from autodraft.db import models  # noqa: F401  (baseline create_all이 모든 테이블을 보도록 등록)
+from autodraft.db.base import Base
+from autodraft.db.codec import encode_body
+
+_meta = MetaData()
+schema_version = Table(
+    "schema_version",
+    _meta,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+
+
+def _has_column(conn: Connection, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(conn).get_columns(table))
+
+
+def _create_index(conn: Connection, name: str, table: str, *columns: str) -> None:
+    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
+
+
+def _baseline(conn: Connection) -> None:
+    Base.metadata.create_all(conn)
+
+
+def _draft_topic_index(conn: Connection) -> None:
+    _create_index(conn, "ix_drafts_topic_id_updated_at", "drafts", "topic_id", "updated_at")
+
+
+def _topic_updated_at(conn: Connection) -> None:
+    if not _has_column(conn, "topics", "updated_at"):
+        # 기존 행은 created_at으로 채움(NOT NULL은 모델/ORM에서 보장)
+        conn.execute(text("ALTER TABLE topics ADD COLUMN updated_at DATETIME"))
+        conn.execute(text("UPDATE topics SET updated_at = created_at WHERE updated_at IS NULL"))
+    _create_index(conn, "ix_topics_updated_at_id", "topics", "updated_at", "id")
+    _create_index(conn, "ix_drafts_updated_at_id", "drafts", "updated_at", "id")
+
+
+def _listing_indexes(conn: Connection) -> None:
+    _create_index(conn, "ix_topics_created_at_id", "topics", "created_at", "id")
+    _create_index(conn, "ix_topics_status_created_at_id", "topics", "status", "created_at", "id")
+    _create_index(conn, "ix_topics_pillar_audience_created_at_id", "topics", "pillar", "audience", "created_at", "id")
+    _create_index(conn, "ix_drafts_status_updated_at_id", "drafts", "status", "updated_at", "id")
+
+
+def _draft_body_blob(conn: Connection, batch: int = 500) -> None:
+    # drafts.content_md(Text) → content_blob(압축 + 형식 marker). id 순으로 batch씩 옮긴 뒤 원래 컬럼 삭제
+    if not _has_column(conn, "drafts", "content_md"):
+        return
+    if not _has_column(conn, "drafts", "content_blob"):
+        blob_type = LargeBinary().compile(dialect=conn.dialect)
+        conn.execute(text(f"ALTER TABLE drafts ADD COLUMN content_blob {blob_type}"))
+    read = text("SELECT id, content_md FROM drafts WHERE id > :after ORDER BY id LIMIT :n")
+    write = text("UPDATE drafts SET content_blob = :blob WHERE id = :id").bindparams(
+        bindparam("blob", type_=LargeBinary)
+    )
+    after = ""
+    while True:
+        rows = conn.execute(read, {"after": after, "n": batch}).all()
+        if not rows:
+            break
+        conn.execute(write, [{"id": r.id, "blob": encode_body(r.content_md or "")} for r in rows])
+        after = rows[-1].id
+    conn.execute(text("ALTER TABLE drafts DROP COLUMN content_md"))  # SQLite 3.35+
+
+
+def _topic_lease(conn: Connection) -> None:
+    if not _has_column(conn, "topics", "lease_owner"):
+        conn.execute(text("ALTER TABLE topics ADD COLUMN lease_owner VARCHAR(64)"))
+    if not _has_column(conn, "topics", "lease_expires_at"):
+        conn.execute(text("ALTER TABLE topics ADD COLUMN lease_expires_at DATETIME"))
+    if not _has_column(conn, "topics", "attempts"):
+        conn.execute(text("ALTER TABLE topics ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0"))
+    _create_index(conn, "ix_topics_status_lease_expires_at", "topics", "status", "lease_expires_at")
+
+
+def _job_lease(conn: Connection) -> None:
+    if not _has_column(conn, "jobs", "lease_owner"):
+        conn.execute(text("ALTER TABLE jobs ADD COLUMN lease_owner VARCHAR(64)"))
+    if not _has_column(conn, "jobs", "lease_expires_at"):
+        conn.execute(text("ALTER TABLE jobs ADD COLUMN lease_expires_at DATETIME"))
+    _create_index(conn, "ix_jobs_status_lease_expires_at", "jobs", "status", "lease_expires_at")
+
+
+def _export_path_index(conn: Connection) -> None:
+    _create_index(conn, "ix_exports_path", "exports", "path")
+
+
+def _idempotency_lease(conn: Connection) -> None:
+    if not _has_column(conn, "idempotency_keys", "lease_owner"):
+        conn.execute(text("ALTER TABLE idempotency_keys ADD COLUMN lease_owner VARCHAR(64)"))
+    if not _has_column(conn, "idempotency_keys", "lease_expires_at"):
+        conn.execute(text("ALTER TABLE idempotency_keys ADD COLUMN lease_expires_at DATETIME"))
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "baseline tables", _baseline),
+    Migration(2, "drafts(topic_id, updated_at) index", _draft_topic_index),
+    Migration(3, "topics.updated_at + (updated_at, id) sync indexes", _topic_updated_at),
+    Migration(4, "topics/drafts listing indexes (status/pillar/audience + time, id)", _listing_indexes),
+    Migration(5, "drafts.content_md -> compressed content_blob", _draft_body_blob),
+    Migration(6, "topics worker lease (lease_owner, lease_expires_at, attempts)", _topic_lease),
+    Migration(7, "jobs runner lease (lease_owner, lease_expires_at)", _job_lease),
+    Migration(8, "exports(path) index", _export_path_index),
+    Migration(9, "idempotency_keys pending lease (lease_owner, lease_expires_at)", _idempotency_lease),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def current_version(conn: Connection) -> int:
+    """
+    적용된 최신 버전(schema_version 테이블이 없으면 0).
+    """
+    if not inspect(conn).has_table(schema_version.name):
+        return 0
+    return conn.execute(select(schema_version.c.version).order_by(schema_version.c.version.desc())).scalar() or 0
+
+
+def schema_drift(conn: Connection) -> list[str]:
+    """
+    현재 모델에 있는데 DB에 없는 테이블/컬럼/인덱스 목록(다 있으면 빈 리스트). migrate 결과 확인용.
+    """
+    insp = inspect(conn)
+    missing: list[str] = []
+    for table in Base.metadata.sorted_tables:
+        if not insp.has_table(table.name):
+            missing.append(f"table {table.name}")
+            continue
+        columns = {c["name"] for c in insp.get_columns(table.name)}
+        missing += [f"column {table.name}.{c.name}" for c in table.columns if c.name not in columns]
+        indexes = {i["name"] for i in insp.get_indexes(table.name)}
+        missing += [f"index {i.name}" for i in table.indexes if i.name not in indexes]
+    return missing
+
+
+class SchemaOutdatedError(RuntimeError):
+    """
+    DB 스키마 버전이 코드가 기대하는 LATEST_VERSION보다 낮음(migration을 먼저 돌려야 함).
+    """
+
+
+def check_version(engine: Engine) -> int:
+    """
+    서버 시작 시 확인용: schema_version 한 번만 읽는다(테이블 reflection/DDL 없음).
+    낮으면 SchemaOutdatedError. 코드보다 높은 버전(새 버전 배포 후 롤백 등)은 그대로 둔다.
+    """
+    with engine.connect() as conn:
+        version = current_version(conn)
+    if version < LATEST_VERSION:
+        raise SchemaOutdatedError(
+            f"DB schema is at version {version}, this build needs {LATEST_VERSION}: "
+            "run `python -m autodraft.cli.migrate` first (or set DB_AUTO_MIGRATE=true)"
+        )
+    return version
+
+
+def migrate(engine: Engine) -> list[int]:
+    """
+    아직 적용 안 된 migration을 버전 순으로 하나씩 트랜잭션으로 적용. 적용한 버전 목록을 돌려준다.
+    """
+    applied: list[int] = []
+    with engine.begin() as conn:
+        _meta.create_all(conn)
+    for m in MIGRATIONS:
+        with engine.begin() as conn:
+            if current_version(conn) >= m.version:
+                continue
+            m.apply(conn)
+            conn.execute(
+                schema_version.insert().values(
+                    version=m.version, description=m.description, applied_at=datetime.utcnow()
+                )
+            )
+        applied.append(m.version)
+    return applied
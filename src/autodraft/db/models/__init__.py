@@ -1,4 +1,7 @@
 from .topic import Topic
 from .draft import Draft
+from .job import Job
+from .export import ExportEntry
+from .idempotency import IdempotencyKey
 
-__all__ = ["Topic", "Draft"]
+__all__ = ["Topic", "Draft", "Job", "ExportEntry", "IdempotencyKey"]
@@ -2,21 +2,28 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import String, Integer, DateTime, Text, ForeignKey, Index, LargeBinary
 from sqlalchemy.orm import Mapped, mapped_column
 
 from autodraft.db.base import Base
+from autodraft.db.codec import decode_body, encode_body
 
 
 class Draft(Base):
     __tablename__ = "drafts"
+    __table_args__ = (
+        Index("ix_drafts_topic_id_updated_at", "topic_id", "updated_at"),
+        Index("ix_drafts_updated_at_id", "updated_at", "id"),  # /sync/changes keyset
+        Index("ix_drafts_status_updated_at_id", "status", "updated_at", "id"),  # GET /drafts?status=
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)  # e.g., d_xxxxx
     topic_id: Mapped[str] = mapped_column(String(64), ForeignKey("topics.id"), nullable=False)
 
     title: Mapped[str] = mapped_column(String(200), nullable=False)
 
-    content_md: Mapped[str] = mapped_column(Text, nullable=False)
+    # 본문은 압축해서 저장(db/codec.py)하고 접근할 때만 읽는다(deferred). 코드에서는 content_md로 쓴다
+    content_blob: Mapped[bytes] = mapped_column(LargeBinary, nullable=False, deferred=True)
     summary: Mapped[str] = mapped_column(Text, nullable=False)
 
     risk_score: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -25,4 +32,19 @@ class Draft(Base):
     export_html_ref: Mapped[str] = mapped_column(Text, nullable=False, default="")  # 다음 단계에서 채움
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    @property
+    def content_md(self) -> str:
+        blob = self.content_blob
+        cached = self.__dict__.get("_content_md_cache")
+        if cached is None or cached[0] is not blob:
+            cached = self.__dict__["_content_md_cache"] = (blob, decode_body(blob))
+        return cached[1]
+
+    @content_md.setter
+    def content_md(self, value: str) -> None:
+        blob = self.content_blob = encode_body(value)
+        self.__dict__["_content_md_cache"] = (blob, value)
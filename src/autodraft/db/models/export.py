@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import String, Integer, DateTime, Text, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from autodraft.db.base import Base
+
+
+class ExportEntry(Base):
+    """
+    export 파일 인덱스(draft 1개당 1행). 디렉토리 glob 대신 이 테이블로 목록/건수를 본다.
+    """
+
+    __tablename__ = "exports"
+    __table_args__ = (
+        Index("ix_exports_created_at_draft_id", "created_at", "draft_id"),
+        Index("ix_exports_path", "path"),  # 파일(path)별 조회/건수(같은 내용이면 여러 draft가 한 파일)
+    )
+
+    draft_id: Mapped[str] = mapped_column(String(64), ForeignKey("drafts.id"), primary_key=True)
+    path: Mapped[str] = mapped_column(Text, nullable=False)  # export_html_ref와 같은 값(/exports/xxx.html)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)  # sha256 hex
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
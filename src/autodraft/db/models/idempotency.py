@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import String, Integer, DateTime, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from autodraft.db.base import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Idempotency-Key 헤더로 들어온 요청 1건. 같은 키로 다시 오면 저장된 응답을 그대로 돌려준다.
+    response_json이 NULL이면 아직 처리 중: 처리하는 프로세스가 lease를 잡고 연장한다(멈추면 만료되어 재시도가 가져감).
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(64), nullable=False)  # 엔드포인트(e.g., pipeline.run_selected)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)  # sha256 hex(요청 바디)
+
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    response_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    # 처리 중 lease(LeaseKeeper heartbeat). 이전 버전이 만든 행은 NULL
+    lease_owner: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
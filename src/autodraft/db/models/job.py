@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import String, Integer, DateTime, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from autodraft.db.base import Base
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # JobRunner 재시작 복구: QUEUED 또는 lease가 만료된 RUNNING 찾기
+        Index("ix_jobs_status_lease_expires_at", "status", "lease_expires_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True)  # e.g., j_xxxxx
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)  # RUN_SELECTED | GENERATE_TOPICS
+    status: Mapped[str] = mapped_column(String(32), nullable=False, default="QUEUED")  # QUEUED | RUNNING | DONE | FAILED
+
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False)  # 요청 바디(JSON)
+    result_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")  # 부분/최종 결과(JSON)
+
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    done: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # 실행 중인 JobRunner(프로세스) id와 lease 만료 시각. 만료된 RUNNING job은 다른 프로세스가 이어서 돌린다
+    lease_owner: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
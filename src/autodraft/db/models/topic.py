@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import String, Integer, DateTime
+from sqlalchemy import String, Integer, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from autodraft.db.base import Base
@@ -10,6 +10,15 @@ from autodraft.db.base import Base
 
 class Topic(Base):
     __tablename__ = "topics"
+    __table_args__ = (
+        Index("ix_topics_updated_at_id", "updated_at", "id"),  # /sync/changes keyset
+        # GET /topics: 최신순 (created_at, id) keyset + 자주 쓰는 필터를 앞에 둔 복합 인덱스
+        Index("ix_topics_created_at_id", "created_at", "id"),
+        Index("ix_topics_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_topics_pillar_audience_created_at_id", "pillar", "audience", "created_at", "id"),
+        # autodraft.worker: 만료된 PROCESSING lease 찾기
+        Index("ix_topics_status_lease_expires_at", "status", "lease_expires_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)  # e.g., t_xxxxx
     pillar: Mapped[str] = mapped_column(String(64), nullable=False)
@@ -21,3 +30,12 @@ class Topic(Base):
 
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="NEW")
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    # 행이 바뀔 때마다 갱신(ORM은 flush 시점, Core UPDATE는 onupdate)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    # 워커 lease(autodraft.worker): PROCESSING 동안 잡고 있는 워커 id와 만료 시각, claim 횟수
+    lease_owner: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
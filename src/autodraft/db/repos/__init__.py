@@ -1,4 +1,7 @@
 from .topic_repo import TopicRepo
 from .draft_repo import DraftRepo
+from .job_repo import JobRepo
+from .export_repo import ExportRepo
+from .idempotency_repo import IdempotencyRepo
 
-__all__ = ["TopicRepo", "DraftRepo"]
+__all__ = ["TopicRepo", "DraftRepo", "JobRepo", "ExportRepo", "IdempotencyRepo"]
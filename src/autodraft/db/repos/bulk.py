@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from sqlalchemy import inspect, insert
+from sqlalchemy.orm import Session
+
+from autodraft.db.base import Base
+
+# SQLite 바인드 변수 한도(구버전 999) 안에서 multi-row VALUES를 자른다
+_MAX_BIND_PARAMS = 900
+
+
+def _row(obj: Base) -> dict:
+    """
+    ORM 객체 → 테이블 컬럼 dict. 비어 있는 값은 컬럼 default로 채운다
+    (multi-row INSERT는 모든 행의 키가 같아야 함).
+    """
+    row = {}
+    for attr in inspect(type(obj)).column_attrs:
+        col = attr.columns[0]
+        value = getattr(obj, attr.key)
+        if value is None and col.default is not None:
+            value = col.default.arg(None) if col.default.is_callable else col.default.arg
+        row[col.key] = value
+    return row
+
+
+def bulk_insert(db: Session, objs: list[Base]) -> None:
+    """
+    같은 타입 객체 여러 개를 multi-row INSERT로 넣는다.
+    - 행마다 INSERT/refresh 하지 않음(세션에도 올리지 않음)
+    - commit은 호출자가 결정
+    """
+    if not objs:
+        return
+    table = type(objs[0]).__table__
+    rows = [_row(o) for o in objs]
+    chunk = max(1, _MAX_BIND_PARAMS // len(rows[0]))
+    for i in range(0, len(rows), chunk):
+        db.execute(insert(table).values(rows[i : i + chunk]))
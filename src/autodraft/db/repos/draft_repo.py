@@ -1,8 +1,53 @@
 from __future__ import annotations
 
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
 
 from autodraft.db.models import Draft
+from autodraft.db.repos.bulk import bulk_insert
+
+if TYPE_CHECKING:  # sqlalchemy.ext.asyncio는 DB_ASYNC일 때만 import(기동 시간)
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# run_selected가 끝까지 처리한 초안 상태(FAILED/DRAFTED는 재생성 대상)
+COMPLETED_STATUSES = ("EXPORTED", "NEEDS_REVIEW")
+
+
+def _changed_since_stmt(after: tuple[datetime, str] | None, until: datetime, limit: int):
+    stmt = select(Draft).where(Draft.updated_at <= until)
+    if after is not None:
+        stmt = stmt.where(tuple_(Draft.updated_at, Draft.id) > tuple_(*after))
+    return stmt.order_by(Draft.updated_at, Draft.id).limit(limit)
+
+
+def _page_stmt(
+    limit: int,
+    after: tuple[datetime, str] | None = None,
+    *,
+    status: str | None = None,
+    topic_id: str | None = None,
+    updated_from: datetime | None = None,
+    updated_to: datetime | None = None,
+):
+    """
+    updated_from <= updated_at < updated_to.
+    """
+    stmt = select(Draft)
+    if status is not None:
+        stmt = stmt.where(Draft.status == status)
+    if topic_id is not None:
+        stmt = stmt.where(Draft.topic_id == topic_id)
+    if updated_from is not None:
+        stmt = stmt.where(Draft.updated_at >= updated_from)
+    if updated_to is not None and after is None:
+        # 커서가 있으면 그 위치가 이미 상한(< updated_to)이라 빼야 인덱스가 커서 위치부터 바로 읽는다
+        stmt = stmt.where(Draft.updated_at < updated_to)
+    if after is not None:
+        stmt = stmt.where(tuple_(Draft.updated_at, Draft.id) < tuple_(*after))
+    return stmt.order_by(Draft.updated_at.desc(), Draft.id.desc()).limit(limit)
 
 
 class DraftRepo:
@@ -13,10 +58,46 @@ class DraftRepo:
         db.refresh(draft)
         return draft
 
+    @staticmethod
+    def bulk_create(db: Session, drafts: list[Draft], commit: bool = True) -> list[Draft]:
+        """
+        여러 draft를 multi-row INSERT로 저장(대량 import/backfill용). 행별 refresh 없음.
+        """
+        bulk_insert(db, drafts)
+        if commit:
+            db.commit()
+        return drafts
+
+    @staticmethod
+    def add(db: Session, draft: Draft) -> Draft:
+        """
+        commit/refresh 없이 세션에만 올림(unit-of-work용).
+        실제 INSERT/UPDATE는 호출자가 commit할 때 한 번에 나간다.
+        """
+        db.add(draft)
+        return draft
+
     @staticmethod
     def get(db: Session, draft_id: str) -> Draft | None:
         return db.get(Draft, draft_id)
 
+    @staticmethod
+    def latest_completed(db: Session, topic_id: str) -> Draft | None:
+        """
+        topic의 가장 최근 완료 초안(QA + export까지 끝난 EXPORTED/NEEDS_REVIEW). 없으면 None.
+        """
+        stmt = (
+            select(Draft)
+            .where(
+                Draft.topic_id == topic_id,
+                Draft.status.in_(COMPLETED_STATUSES),
+                Draft.export_html_ref != "",
+            )
+            .order_by(Draft.updated_at.desc())
+            .limit(1)
+        )
+        return db.scalars(stmt).first()
+
     @staticmethod
     def save(db: Session, draft: Draft) -> Draft:
         """
@@ -26,3 +107,31 @@ class DraftRepo:
         db.commit()
         db.refresh(draft)
         return draft
+
+    @staticmethod
+    def changed_since(
+        db: Session, after: tuple[datetime, str] | None, until: datetime, limit: int
+    ) -> list[Draft]:
+        """
+        (updated_at, id) > after 이고 updated_at <= until 인 행을 오래된 순으로 limit개(/sync/changes).
+        ix_drafts_updated_at_id 범위 스캔이라 바뀐 게 없으면 거의 비용이 없다.
+        """
+        return list(db.scalars(_changed_since_stmt(after, until, limit)))
+
+    @staticmethod
+    async def achanged_since(
+        db: AsyncSession, after: tuple[datetime, str] | None, until: datetime, limit: int
+    ) -> list[Draft]:
+        return list(await db.scalars(_changed_since_stmt(after, until, limit)))
+
+    @staticmethod
+    def page(db: Session, limit: int, after: tuple[datetime, str] | None = None, **filters) -> list[Draft]:
+        """
+        최근 수정순 keyset 페이지(GET /drafts): 필터(_page_stmt)에 맞고 (updated_at, id) < after 인 행에서 limit개.
+        본문(content_blob)은 deferred라 읽지 않는다.
+        """
+        return list(db.scalars(_page_stmt(limit, after, **filters)))
+
+    @staticmethod
+    async def apage(db: AsyncSession, limit: int, after: tuple[datetime, str] | None = None, **filters) -> list[Draft]:
+        return list(await db.scalars(_page_stmt(limit, after, **filters)))
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from autodraft.db.models import Draft, ExportEntry
+
+if TYPE_CHECKING:  # sqlalchemy.ext.asyncio는 DB_ASYNC일 때만 import(기동 시간)
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _count_files_stmt():
+    return select(func.count(ExportEntry.path.distinct()))
+
+
+def _page_stmt(limit: int, after: tuple[datetime, str] | None):
+    stmt = select(ExportEntry)
+    if after is not None:
+        stmt = stmt.where(tuple_(ExportEntry.created_at, ExportEntry.draft_id) < tuple_(*after))
+    return stmt.order_by(ExportEntry.created_at.desc(), ExportEntry.draft_id.desc()).limit(limit)
+
+
+class ExportRepo:
+    @staticmethod
+    def upsert(db: Session, entry: ExportEntry) -> ExportEntry:
+        """
+        draft_id 기준 insert-or-update. commit은 호출자가 한다(draft 저장과 같은 트랜잭션).
+        """
+        return db.merge(entry)
+
+    @staticmethod
+    def count(db: Session) -> int:
+        return db.scalar(select(func.count()).select_from(ExportEntry)) or 0
+
+    @staticmethod
+    def count_files(db: Session) -> int:
+        """
+        서로 다른 export 파일 수(내용이 같은 draft는 한 파일을 같이 가리킨다). ix_exports_path만 읽는다.
+        """
+        return db.scalar(_count_files_stmt()) or 0
+
+    @staticmethod
+    async def acount_files(db: AsyncSession) -> int:
+        return await db.scalar(_count_files_stmt()) or 0
+
+    @staticmethod
+    def by_paths(db: Session, paths: list[str]) -> list[ExportEntry]:
+        """
+        path가 paths 중 하나인 행(ix_exports_path 조회).
+        """
+        if not paths:
+            return []
+        return list(db.scalars(select(ExportEntry).where(ExportEntry.path.in_(paths))))
+
+    @staticmethod
+    def unindexed_drafts(db: Session, after: str, limit: int) -> list[tuple[str, str]]:
+        """
+        인덱스 행이 없는 draft의 (id, export_html_ref)를 id > after 순으로 limit개(인덱스 도입 전 draft 채우기용).
+        drafts PK 순서로 이어 읽고 exports는 PK로만 확인하므로 전체를 한 번 훑는 비용.
+        """
+        stmt = (
+            select(Draft.id, Draft.export_html_ref)
+            .where(Draft.id > after, ~select(ExportEntry.draft_id).where(ExportEntry.draft_id == Draft.id).exists())
+            .order_by(Draft.id)
+            .limit(limit)
+        )
+        return [(r.id, r.export_html_ref) for r in db.execute(stmt)]
+
+    @staticmethod
+    def page(
+        db: Session, limit: int, after: tuple[datetime, str] | None = None
+    ) -> list[ExportEntry]:
+        """
+        최신순 keyset 페이지: (created_at, draft_id) < after 인 행에서 limit개.
+        OFFSET 없이 인덱스(ix_exports_created_at_draft_id)만 따라가므로 전체 크기와 무관.
+        """
+        return list(db.scalars(_page_stmt(limit, after)))
+
+    @staticmethod
+    async def apage(db: AsyncSession, limit: int, after: tuple[datetime, str] | None = None) -> list[ExportEntry]:
+        return list(await db.scalars(_page_stmt(limit, after)))
+
+    @staticmethod
+    def delete_missing(db: Session, keep_paths: set[str]) -> int:
+        """
+        keep_paths에 없는 path를 가리키는 행 삭제(reconcile용). commit은 호출자가.
+        """
+        stale = [p for p in db.scalars(select(ExportEntry.path).distinct()) if p not in keep_paths]
+        if not stale:
+            return 0
+        res = db.execute(delete(ExportEntry).where(ExportEntry.path.in_(stale)))
+        return res.rowcount or 0
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from autodraft.db.models import IdempotencyKey
+
+
+class IdempotencyRepo:
+    @staticmethod
+    def get(db: Session, key: str) -> IdempotencyKey | None:
+        return db.get(IdempotencyKey, key)
+
+    @staticmethod
+    def begin(db: Session, row: IdempotencyKey) -> bool:
+        """
+        처리 중(response 없음) 행을 INSERT+commit. 같은 키가 이미 있으면(동시 요청) False.
+        """
+        db.add(row)
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return False
+        return True
+
+    @staticmethod
+    def complete(db: Session, key: str, owner: str, status_code: int, response_json: str) -> bool:
+        """
+        owner가 잡고 있는 처리 중 키에 응답 저장 + commit. lease를 잃었으면(다른 요청이 가져감) False.
+        """
+        res = db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == key, IdempotencyKey.lease_owner == owner)
+            .values(status_code=status_code, response_json=response_json, completed_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return bool(res.rowcount)
+
+    @staticmethod
+    def delete(db: Session, key: str, owner: str | None = None) -> None:
+        """
+        키 삭제 + commit. owner를 주면 그 owner가 잡고 있을 때만.
+        """
+        stmt = delete(IdempotencyKey).where(IdempotencyKey.key == key)
+        if owner is not None:
+            stmt = stmt.where(IdempotencyKey.lease_owner == owner)
+        db.execute(stmt)
+        db.commit()
+
+    @staticmethod
+    def take_over_stale(db: Session, key: str, now: datetime, legacy_before: datetime) -> bool:
+        """
+        처리 중인데 owner가 멈춘(lease 만료) 키를 지우고 commit. 지웠으면 True(재시도가 새로 begin).
+        lease가 없는 이전 버전 행은 created_at < legacy_before일 때만.
+        """
+        res = db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.key == key,
+                IdempotencyKey.response_json.is_(None),
+                or_(
+                    IdempotencyKey.lease_expires_at < now,
+                    and_(IdempotencyKey.lease_expires_at.is_(None), IdempotencyKey.created_at < legacy_before),
+                ),
+            )
+        )
+        db.commit()
+        return bool(res.rowcount)
+
+    @staticmethod
+    def renew_leases(db: Session, keys: list[str], owner: str, lease_s: float) -> list[str]:
+        """
+        heartbeat(LeaseKeeper): owner가 처리 중인 키의 lease를 지금부터 lease_s로 연장하고 commit. 연장된 키 목록.
+        """
+        if not keys:
+            return []
+        stmt = (
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.key.in_(keys),
+                IdempotencyKey.lease_owner == owner,
+                IdempotencyKey.response_json.is_(None),
+            )
+            .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_s))
+            .returning(IdempotencyKey.key)
+            .execution_options(synchronize_session=False)
+        )
+        renewed = list(db.scalars(stmt))
+        db.commit()
+        return renewed
+
+    @staticmethod
+    def purge_before(db: Session, cutoff: datetime) -> int:
+        """
+        cutoff 이전에 만들어진 키 삭제(만료 정리). 아직 lease가 살아 있는 처리 중 키는 남긴다.
+        """
+        res = db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.created_at < cutoff,
+                or_(IdempotencyKey.lease_expires_at.is_(None), IdempotencyKey.lease_expires_at < datetime.utcnow()),
+            )
+        )
+        db.commit()
+        return res.rowcount or 0
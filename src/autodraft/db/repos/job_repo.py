@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from autodraft.db.models import Job
+
+if TYPE_CHECKING:  # sqlalchemy.ext.asyncio는 DB_ASYNC일 때만 import(기동 시간)
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _claimable(now: datetime):
+    # 아직 안 돌린 job, 또는 돌리던 프로세스가 죽어 lease가 만료된(lease 도입 전이면 없는) RUNNING job
+    return or_(
+        Job.status == "QUEUED",
+        and_(Job.status == "RUNNING", or_(Job.lease_expires_at.is_(None), Job.lease_expires_at < now)),
+    )
+
+
+class JobRepo:
+    @staticmethod
+    def create(db: Session, job: Job) -> Job:
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+
+    @staticmethod
+    def get(db: Session, job_id: str) -> Job | None:
+        return db.get(Job, job_id)
+
+    @staticmethod
+    async def aget(db: AsyncSession, job_id: str) -> Job | None:
+        return await db.get(Job, job_id)
+
+    @staticmethod
+    def save(db: Session, job: Job) -> Job:
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+
+    @staticmethod
+    def list_unfinished(db: Session) -> list[Job]:
+        """
+        다시 돌릴 job 목록(QUEUED, 또는 lease가 없거나 만료된 RUNNING), 오래된 순.
+        다른 프로세스가 lease를 잡고 돌리는 중인 RUNNING job은 빼고.
+        """
+        stmt = select(Job).where(_claimable(datetime.utcnow())).order_by(Job.created_at)
+        return list(db.scalars(stmt))
+
+    @staticmethod
+    def claim(db: Session, job_id: str, owner: str, lease_s: float) -> Job | None:
+        """
+        job을 RUNNING + owner lease로 바꾸고 commit(UPDATE 한 문장이라 여러 프로세스 중 하나만 성공).
+        QUEUED이거나 lease가 만료된 RUNNING일 때만. 성공하면 세션에서 뗀 Job(이후 쓰기는 save_owned로), 아니면 None.
+        """
+        now = datetime.utcnow()
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id, _claimable(now))
+            .values(status="RUNNING", lease_owner=owner, lease_expires_at=now + timedelta(seconds=lease_s), updated_at=now)
+            .returning(Job.id)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = db.scalar(stmt)
+        db.commit()
+        if claimed is None:
+            return None
+        job = db.get(Job, job_id)
+        db.expunge(job)
+        return job
+
+    @staticmethod
+    def save_owned(db: Session, job: Job, owner: str) -> bool:
+        """
+        claim한 job의 진행/결과를 owner lease를 아직 갖고 있을 때만 기록하고 commit.
+        False면 lease가 만료되어 다른 프로세스가 가져간 것(호출자는 실행을 멈춘다).
+        """
+        stmt = (
+            update(Job)
+            .where(Job.id == job.id, Job.lease_owner == owner)
+            .values(
+                status=job.status,
+                result_json=job.result_json,
+                total=job.total,
+                done=job.done,
+                last_error=job.last_error,
+                lease_owner=job.lease_owner,
+                lease_expires_at=job.lease_expires_at,
+                updated_at=job.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        saved = db.execute(stmt).rowcount == 1
+        db.commit()
+        return saved
+
+    @staticmethod
+    def renew_leases(db: Session, job_ids: list[str], owner: str, lease_s: float) -> list[str]:
+        """
+        heartbeat: owner가 잡고 있는 RUNNING job의 lease를 지금부터 lease_s로 연장하고 commit. 연장된 id 목록.
+        """
+        if not job_ids:
+            return []
+        stmt = (
+            update(Job)
+            .where(Job.id.in_(job_ids), Job.lease_owner == owner, Job.status == "RUNNING")
+            .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_s))
+            .returning(Job.id)
+            .execution_options(synchronize_session=False)
+        )
+        renewed = list(db.scalars(stmt))
+        db.commit()
+        return renewed
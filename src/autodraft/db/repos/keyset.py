@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(*values) -> str:
+    """
+    keyset 페이지네이션 커서(불투명 문자열). datetime은 ISO 문자열로.
+    """
+    raw = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(raw, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> list:
+    """
+    encode_cursor의 역. 형식이 틀리면 ValueError.
+    """
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(raw, list):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return raw
@@ -1,8 +1,75 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import and_, or_, select, tuple_, update
 from sqlalchemy.orm import Session
 
 from autodraft.db.models import Topic
+from autodraft.db.repos.bulk import _MAX_BIND_PARAMS, bulk_insert
+
+if TYPE_CHECKING:  # sqlalchemy.ext.asyncio는 DB_ASYNC일 때만 import(기동 시간)
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# 시트/API가 워커 큐에 넣을 수 있는 상태(PROCESSING/DONE/DUPLICATE는 그대로 둔다)
+SELECTABLE_STATUSES = ("NEW", "ERROR", "SELECTED")
+
+
+def _claimable(now: datetime):
+    # 새로 고른 topic, 또는 lease가 만료된(워커가 죽거나 멈춘) PROCESSING topic
+    return or_(
+        Topic.status == "SELECTED",
+        and_(Topic.status == "PROCESSING", Topic.lease_expires_at < now),
+    )
+
+
+def _unleased(now: datetime):
+    # 다른 owner의 살아 있는 lease가 없음(PROCESSING이 아니거나 lease가 없거나 만료)
+    return or_(
+        Topic.status != "PROCESSING",
+        Topic.lease_expires_at.is_(None),
+        Topic.lease_expires_at < now,
+    )
+
+
+def _changed_since_stmt(after: tuple[datetime, str] | None, until: datetime, limit: int):
+    stmt = select(Topic).where(Topic.updated_at <= until)
+    if after is not None:
+        stmt = stmt.where(tuple_(Topic.updated_at, Topic.id) > tuple_(*after))
+    return stmt.order_by(Topic.updated_at, Topic.id).limit(limit)
+
+
+def _page_stmt(
+    limit: int,
+    after: tuple[datetime, str] | None = None,
+    *,
+    status: str | None = None,
+    pillar: str | None = None,
+    audience: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+):
+    """
+    created_from <= created_at < created_to. 필터는 등호 조건이라 복합 인덱스
+    (status|pillar,audience, created_at, id) 앞부분으로 좁힌 뒤 그대로 순서대로 읽는다(OFFSET 없음).
+    """
+    stmt = select(Topic)
+    if status is not None:
+        stmt = stmt.where(Topic.status == status)
+    if pillar is not None:
+        stmt = stmt.where(Topic.pillar == pillar)
+    if audience is not None:
+        stmt = stmt.where(Topic.audience == audience)
+    if created_from is not None:
+        stmt = stmt.where(Topic.created_at >= created_from)
+    if created_to is not None and after is None:
+        # 커서가 있으면 그 위치가 이미 상한(< created_to)이라 빼야 인덱스가 커서 위치부터 바로 읽는다
+        stmt = stmt.where(Topic.created_at < created_to)
+    if after is not None:
+        stmt = stmt.where(tuple_(Topic.created_at, Topic.id) < tuple_(*after))
+    return stmt.order_by(Topic.created_at.desc(), Topic.id.desc()).limit(limit)
 
 
 class TopicRepo:
@@ -13,14 +80,233 @@ class TopicRepo:
         db.refresh(topic)
         return topic
 
+    @staticmethod
+    def bulk_create(db: Session, topics: list[Topic], commit: bool = True) -> list[Topic]:
+        """
+        여러 topic을 multi-row INSERT 한 번(+commit 1회)으로 저장. 행별 refresh 없음.
+        반환되는 객체는 세션에 붙지 않은 상태(필드는 넣은 값 그대로).
+        """
+        bulk_insert(db, topics)
+        if commit:
+            db.commit()
+        return topics
+
+    @staticmethod
+    def add(db: Session, topic: Topic) -> Topic:
+        """
+        commit/refresh 없이 세션에만 올림(unit-of-work용).
+        """
+        db.add(topic)
+        return topic
+
     @staticmethod
     def get(db: Session, topic_id: str) -> Topic | None:
         return db.get(Topic, topic_id)
 
     @staticmethod
-    def update_status(db: Session, topic_id: str, status: str) -> None:
+    def snapshot(db: Session, topic_id: str) -> Topic | None:
+        """
+        세션에 붙지 않은 Topic 사본(초안 생성에 쓰는 컬럼만). 다른 스레드에 넘겨도 lazy load/expire가 없다.
+        """
+        row = db.execute(
+            select(Topic.id, Topic.pillar, Topic.audience, Topic.title, Topic.angle, Topic.status).where(
+                Topic.id == topic_id
+            )
+        ).first()
+        return Topic(**row._mapping) if row else None
+
+    @staticmethod
+    def set_status(db: Session, topic_id: str, status: str) -> bool:
+        """
+        commit 없이 상태만 변경(unit-of-work용). topic이 없으면 False.
+        """
         t = db.get(Topic, topic_id)
         if not t:
-            return
+            return False
         t.status = status
+        return True
+
+    @staticmethod
+    def set_status_many(db: Session, topic_ids: list[str], status: str) -> int:
+        """
+        여러 topic 상태를 UPDATE로(commit 없음). 바뀐 행 수(없는 id는 무시).
+        IN (...) bind 수 제한(SQLite 999)에 걸리지 않게 _MAX_BIND_PARAMS개씩 나눈다.
+        """
+        changed = 0
+        for i in range(0, len(topic_ids), _MAX_BIND_PARAMS):
+            stmt = (
+                update(Topic)
+                .where(Topic.id.in_(topic_ids[i : i + _MAX_BIND_PARAMS]))
+                .values(status=status)
+                .execution_options(synchronize_session=False)
+            )
+            changed += db.execute(stmt).rowcount
+        return changed
+
+    @staticmethod
+    def update_status(db: Session, topic_id: str, status: str) -> None:
+        if TopicRepo.set_status(db, topic_id, status):
+            db.commit()
+
+    @staticmethod
+    def changed_since(
+        db: Session, after: tuple[datetime, str] | None, until: datetime, limit: int
+    ) -> list[Topic]:
+        """
+        (updated_at, id) > after 이고 updated_at <= until 인 행을 오래된 순으로 limit개(/sync/changes).
+        ix_topics_updated_at_id 범위 스캔이라 바뀐 게 없으면 거의 비용이 없다.
+        """
+        return list(db.scalars(_changed_since_stmt(after, until, limit)))
+
+    @staticmethod
+    async def achanged_since(
+        db: AsyncSession, after: tuple[datetime, str] | None, until: datetime, limit: int
+    ) -> list[Topic]:
+        return list(await db.scalars(_changed_since_stmt(after, until, limit)))
+
+    @staticmethod
+    def page(db: Session, limit: int, after: tuple[datetime, str] | None = None, **filters) -> list[Topic]:
+        """
+        최신순 keyset 페이지(GET /topics): 필터(_page_stmt)에 맞고 (created_at, id) < after 인 행에서 limit개.
+        """
+        return list(db.scalars(_page_stmt(limit, after, **filters)))
+
+    @staticmethod
+    async def apage(db: AsyncSession, limit: int, after: tuple[datetime, str] | None = None, **filters) -> list[Topic]:
+        return list(await db.scalars(_page_stmt(limit, after, **filters)))
+
+    @staticmethod
+    def mark_selected(db: Session, topic_ids: list[str]) -> list[str]:
+        """
+        topic_ids 중 SELECTABLE_STATUSES인 것을 SELECTED로(워커가 가져가도록) 바꾸고 commit. 바뀐 id 목록.
+        다시 고른 topic은 claim 횟수도 0부터.
+        """
+        if not topic_ids:
+            return []
+        stmt = (
+            update(Topic)
+            .where(Topic.id.in_(topic_ids), Topic.status.in_(SELECTABLE_STATUSES))
+            .values(status="SELECTED", attempts=0, lease_owner=None, lease_expires_at=None)
+            .returning(Topic.id)
+            .execution_options(synchronize_session=False)
+        )
+        selected = list(db.scalars(stmt))
+        db.commit()
+        return selected
+
+    @staticmethod
+    def claim(db: Session, owner: str, limit: int, lease_s: float, max_attempts: int) -> list[str]:
+        """
+        SELECTED(또는 lease 만료된 PROCESSING) topic을 오래된 순으로 최대 limit개 PROCESSING으로 바꾸고
+        owner lease를 건다. UPDATE 한 문장(조건 재확인 포함)이라 여러 프로세스가 동시에 불러도
+        한 topic은 한 워커만 가져간다. commit까지 하고 가져간 id 목록을 돌려준다.
+        claim 횟수가 max_attempts에 이른 topic은 다시 가져가지 않는다(fail_exhausted가 ERROR로).
+        """
+        now = datetime.utcnow()
+        candidates = (
+            select(Topic.id)
+            .where(_claimable(now), Topic.attempts < max_attempts)
+            .order_by(Topic.created_at, Topic.id)
+            .limit(limit)
+        )
+        stmt = (
+            update(Topic)
+            .where(Topic.id.in_(candidates), _claimable(now), Topic.attempts < max_attempts)
+            .values(
+                status="PROCESSING",
+                lease_owner=owner,
+                lease_expires_at=now + timedelta(seconds=lease_s),
+                attempts=Topic.attempts + 1,
+            )
+            .returning(Topic.id)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = list(db.scalars(stmt))
+        db.commit()
+        return claimed
+
+    @staticmethod
+    def claim_topics(db: Session, topic_ids: list[str], owner: str, lease_s: float) -> list[str]:
+        """
+        지정한 topic을 상태와 관계없이 PROCESSING + owner lease로(run_selected/SSE처럼 id를 골라 바로 처리하는 경로).
+        다른 owner가 lease를 잡고 있는 topic은 건너뛴다. UPDATE 한 문장 + commit, 가져간 id 목록.
+        claim 횟수(attempts)는 워커 재시도용이라 건드리지 않는다.
+        """
+        if not topic_ids:
+            return []
+        now = datetime.utcnow()
+        stmt = (
+            update(Topic)
+            .where(Topic.id.in_(topic_ids), _unleased(now))
+            .values(status="PROCESSING", lease_owner=owner, lease_expires_at=now + timedelta(seconds=lease_s))
+            .returning(Topic.id)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = list(db.scalars(stmt))
+        db.commit()
+        return claimed
+
+    @staticmethod
+    def renew_leases(db: Session, topic_ids: list[str], owner: str, lease_s: float) -> list[str]:
+        """
+        heartbeat: owner가 아직 잡고 있는 topic의 lease를 지금부터 lease_s로 연장하고 commit.
+        연장된 id 목록(빠진 것은 만료되어 다른 워커가 가져간 것). updated_at은 건드리지 않는다(/sync/changes에 안 뜨게).
+        """
+        if not topic_ids:
+            return []
+        stmt = (
+            update(Topic)
+            .where(Topic.id.in_(topic_ids), Topic.lease_owner == owner, Topic.status == "PROCESSING")
+            .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_s), updated_at=Topic.updated_at)
+            .returning(Topic.id)
+            .execution_options(synchronize_session=False)
+        )
+        renewed = list(db.scalars(stmt))
+        db.commit()
+        return renewed
+
+    @staticmethod
+    def release_lease(db: Session, topic_id: str, owner: str, status: str | None = None) -> bool:
+        """
+        owner lease를 푼다(commit 없음, 호출자의 트랜잭션에 포함). status를 주면 상태도 같이 바꾼다.
+        그 사이 lease가 만료되어 다른 워커가 가져갔으면 False → 호출자는 자기 결과를 rollback해야 한다.
+        """
+        return TopicRepo.release_leases(db, [topic_id], owner, status) == [topic_id]
+
+    @staticmethod
+    def release_leases(db: Session, topic_ids: list[str], owner: str, status: str | None = None) -> list[str]:
+        """
+        release_lease의 여러 topic 버전(UPDATE 한 문장, commit 없음). owner가 아직 잡고 있어서 풀린 id 목록.
+        """
+        if not topic_ids:
+            return []
+        values: dict = {"lease_owner": None, "lease_expires_at": None}
+        if status is not None:
+            values["status"] = status
+        stmt = (
+            update(Topic)
+            .where(Topic.id.in_(topic_ids), Topic.lease_owner == owner, Topic.status == "PROCESSING")
+            .values(**values)
+            .returning(Topic.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(db.scalars(stmt))
+
+    @staticmethod
+    def fail_exhausted(db: Session, max_attempts: int) -> int:
+        """
+        lease가 만료됐는데 claim을 max_attempts번 다 쓴 topic(처리 중 워커가 계속 죽는 경우)을 ERROR로. 바꾼 수.
+        """
+        stmt = (
+            update(Topic)
+            .where(
+                Topic.status == "PROCESSING",
+                Topic.lease_expires_at < datetime.utcnow(),
+                Topic.attempts >= max_attempts,
+            )
+            .values(status="ERROR", lease_owner=None, lease_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        n = db.execute(stmt).rowcount
         db.commit()
+        return n
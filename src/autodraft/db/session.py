@@ -1,26 +1,140 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+import asyncio
+from collections.abc import AsyncIterator
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
 
 from autodraft.settings import settings
 
-# SQLite를 쓸 때 멀티스레드 이슈 방지 옵션 필요
-connect_args = {}
-if settings.db_url.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
 
-engine = create_engine(settings.db_url, echo=False, future=True, connect_args=connect_args)
+def _is_sqlite(db_url: str) -> bool:
+    return make_url(db_url).get_backend_name() == "sqlite"
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    SQLite 연결마다 적용하는 PRAGMA.
+    - WAL: 읽기와 쓰기가 서로 막지 않음(동시 요청이 DB 락에서 줄 서지 않게)
+    - synchronous=NORMAL: WAL에서는 commit마다 fsync 하지 않아도 안전
+    - busy_timeout: 락이 걸리면 바로 실패하지 않고 기다림
+    - mmap_size: 읽기를 mmap으로
+    """
+    cur = dbapi_connection.cursor()
+    cur.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+    cur.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+    cur.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+    cur.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    cur.close()
+
+
+def _engine_kwargs(db_url: str) -> dict:
+    if _is_sqlite(db_url):
+        # SQLite를 쓸 때 멀티스레드 이슈 방지 옵션 필요
+        return {"connect_args": {"check_same_thread": False}}
+    # Postgres 등 서버형 DB: 커넥션 풀 설정
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle_s,
+    }
+
+
+def build_engine(db_url: str, tune_sqlite: bool = True) -> Engine:
+    """
+    db_url 백엔드에 맞춘 sync 엔진. (벤치마크에서 tune_sqlite=False로 기본 설정과 비교)
+    """
+    engine = create_engine(db_url, echo=False, future=True, **_engine_kwargs(db_url))
+    if tune_sqlite and _is_sqlite(db_url):
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+engine = build_engine(settings.db_url)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
 
 def get_db():
     """
     FastAPI Depends에서 사용할 세션 공급자.
-    (엔드포인트는 다음 단계에서)
     """
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+# ---------- async ----------
+# 드라이버(aiosqlite/asyncpg)는 선택 의존성이라 처음 쓸 때 엔진을 만든다.
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def async_db_url(db_url: str) -> str:
+    """
+    sync URL → async 드라이버 URL. (이미 async 드라이버면 그대로)
+    예: sqlite:///./autodraft.db → sqlite+aiosqlite:///./autodraft.db
+    """
+    url = make_url(db_url)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for backend: {url.get_backend_name()}")
+    if url.get_driver_name() in ("aiosqlite", "asyncpg", "psycopg"):
+        return db_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def build_async_engine(db_url: str, tune_sqlite: bool = True):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = async_db_url(db_url)
+    kwargs = {} if _is_sqlite(db_url) else _engine_kwargs(db_url)
+    engine = create_async_engine(url, echo=False, **kwargs)
+    if tune_sqlite and _is_sqlite(db_url):
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def get_async_sessionmaker():
+    global _async_engine, _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        _async_engine = build_async_engine(settings.db_url)
+        _AsyncSessionLocal = async_sessionmaker(bind=_async_engine, autoflush=False, expire_on_commit=False)
+    return _AsyncSessionLocal
+
+
+async def get_read_db() -> AsyncIterator:
+    """
+    조회 엔드포인트용 세션 공급자: DB_ASYNC=true면 AsyncSession, 아니면 sync Session
+    (핸들러가 스레드풀에서 쓴다. autodraft.main._read).
+    """
+    if settings.db_async:
+        async with get_async_sessionmaker()() as db:
+            yield db
+        return
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        # 연결 반환(rollback)이 이벤트 루프를 막지 않게
+        await asyncio.to_thread(db.close)
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _AsyncSessionLocal = None
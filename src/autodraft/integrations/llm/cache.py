@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Literal
+
+from autodraft.settings import settings
+
+# 호출 단위 캐시 제어
+# - use: 읽고/쓰기(기본)
+# - refresh: 읽지 않고 새로 호출한 결과로 덮어쓰기
+# - bypass: 캐시를 전혀 건드리지 않음
+CacheMode = Literal["use", "refresh", "bypass"]
+
+
+def make_cache_key(provider: str, model: str, prompt: str) -> str:
+    h = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return f"{provider}:{model}:{h}"
+
+
+class LLMCache:
+    """
+    LLM 응답 캐시: 메모리 LRU(1차) + SQLite 파일(2차).
+    - 두 계층 모두 TTL 적용
+    - SQLite 계층은 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 삭제
+    - 전체 크기는 파일 안의 llm_cache_size 행(트리거로 유지)에서 읽는다. 같은 파일을 쓰는 여러 프로세스(API, 워커)가
+      같은 값을 보고 한도를 지키도록(프로세스별 합계는 서로의 쓰기를 모름)
+    """
+
+    def __init__(self, path: str, ttl_s: int, max_bytes: int, mem_items: int):
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self.mem_items = mem_items
+
+        self._lock = threading.Lock()
+        self._mem: OrderedDict[str, tuple[float, str]] = OrderedDict()  # key -> (expires_at, value)
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed_at ON llm_cache (accessed_at)")
+        self._init_size()
+
+        self.hits_mem = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_settings(cls) -> "LLMCache":
+        return cls(
+            path=settings.llm_cache_path,
+            ttl_s=settings.llm_cache_ttl_s,
+            max_bytes=settings.llm_cache_max_bytes,
+            mem_items=settings.llm_cache_mem_items,
+        )
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            hit = self._mem.get(key)
+            if hit is not None:
+                expires_at, value = hit
+                if expires_at > now:
+                    self._mem.move_to_end(key)
+                    self.hits_mem += 1
+                    return value
+                del self._mem[key]
+
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                if row is not None:
+                    self._delete(key)
+                self.misses += 1
+                return None
+
+            value, expires_at = row
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._mem_put(key, expires_at, value)
+            self.hits_disk += 1
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        expires_at = now + self.ttl_s
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._mem_put(key, expires_at, value)
+            if size > self.max_bytes:
+                return  # 한 항목이 전체 한도보다 크면 메모리에만 둔다
+
+            # 쓰기와 정리를 한 트랜잭션으로: 다른 프로세스와 크기 확인/삭제가 엇갈리지 않게
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # INSERT OR REPLACE는 삭제 트리거가 돌지 않으므로 upsert(UPDATE 트리거)
+                self._conn.execute(
+                    "INSERT INTO llm_cache (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                    "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                    (key, value, size, expires_at, now),
+                )
+                self._evict(now)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.writes += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits_mem": self.hits_mem,
+                "hits_disk": self.hits_disk,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "mem_items": len(self._mem),
+                "disk_bytes": self._size(),
+                "max_bytes": self.max_bytes,
+            }
+
+    # ---------- internal (lock 보유 상태에서 호출) ----------
+    def _init_size(self) -> None:
+        # 처음 한 번 현재 합계로 채우고 이후는 트리거가 유지(이미 있으면 그대로)
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache_size (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO llm_cache_size (id, bytes) SELECT 0, COALESCE(SUM(size), 0) FROM llm_cache"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS tr_llm_cache_ins AFTER INSERT ON llm_cache BEGIN "
+                "UPDATE llm_cache_size SET bytes = bytes + NEW.size WHERE id = 0; END"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS tr_llm_cache_del AFTER DELETE ON llm_cache BEGIN "
+                "UPDATE llm_cache_size SET bytes = bytes - OLD.size WHERE id = 0; END"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS tr_llm_cache_upd AFTER UPDATE OF size ON llm_cache BEGIN "
+                "UPDATE llm_cache_size SET bytes = bytes - OLD.size + NEW.size WHERE id = 0; END"
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _size(self) -> int:
+        return self._conn.execute("SELECT bytes FROM llm_cache_size WHERE id = 0").fetchone()[0]
+
+    def _mem_put(self, key: str, expires_at: float, value: str) -> None:
+        self._mem[key] = (expires_at, value)
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.mem_items:
+            self._mem.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+
+    def _evict(self, now: float) -> None:
+        # set()의 트랜잭션 안에서 호출: 크기는 파일 기준(다른 프로세스가 쓴 것 포함)
+        size = self._size()
+        # 만료 항목 먼저 정리
+        if size > self.max_bytes:
+            freed = self._conn.execute(
+                "DELETE FROM llm_cache WHERE expires_at <= ? RETURNING size", (now,)
+            ).fetchall()
+            size -= sum(r[0] for r in freed)
+            self.evictions += len(freed)
+
+        # 그래도 넘치면 LRU 순으로 삭제
+        while size > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM llm_cache ORDER BY accessed_at LIMIT 32"
+            ).fetchall()
+            if not rows:
+                break
+            for key, n in rows:
+                if size <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._mem.pop(key, None)
+                size -= n
+                self.evictions += 1
@@ -2,10 +2,22 @@ from __future__ import annotations
 
 import json
 import re
-from dataclasses import dataclass
-
+import time
+from collections.abc import Callable, Iterator
+from contextlib import closing
+from dataclasses import asdict, dataclass
+
+from autodraft.integrations.llm.cache import CacheMode, LLMCache, make_cache_key
+from autodraft.integrations.llm.jsonstream import JsonArrayParser
+from autodraft.integrations.llm.stub import StubProfile
+from autodraft.integrations.llm.routing import Route, Router, build_routes
+from autodraft.integrations.llm.streaming import DraftStream, chunk_text, format_stream_text
+from autodraft.integrations.llm.transport import LLMTransportError, estimate_tokens
+from autodraft.observability import span, traced
+from autodraft.observability.metrics import LLM_CACHE, LLM_PROMPT_TOKENS, LLM_TOKENS
+from autodraft.prompts import RenderedPrompt, prompts
 from autodraft.settings import settings
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 @dataclass
 class TopicCandidate:
@@ -19,29 +31,24 @@ class DraftCandidate:
     summary: str
 
 
-from pydantic import BaseModel, Field
-
 class TopicItemOut(BaseModel):
     title: str
     angle: str
     score: int = Field(ge=0, le=100)
 
-class TopicListOut(BaseModel):
-    items: list[TopicItemOut]
-
-class DraftOut(BaseModel):
-    summary: str
-    content_md: str
 
-def _openai_parse(self, prompt: str, out_model):
-    return self._openai.responses.parse(
-        model=self.model,
-        input=[
-            {"role": "system", "content": "You are a helpful assistant."},
-            {"role": "user", "content": prompt},
-        ],
-        text_format=out_model,
-    ).output_parsed
+def _topic_candidate(obj: object) -> TopicCandidate | None:
+    """
+    JSON 배열 원소 1개 → 검증된 TopicCandidate(형식이 틀리면 None). score는 없으면 70, 범위 밖이면 잘라냄.
+    """
+    if not isinstance(obj, dict):
+        return None
+    try:
+        score = max(0, min(100, int(obj.get("score", 70))))
+        item = TopicItemOut.model_validate({**obj, "score": score})
+    except (ValidationError, TypeError, ValueError):
+        return None
+    return TopicCandidate(title=item.title, angle=item.angle, score=item.score)
 
 
 def _extract_json(text: str) -> str | None:
@@ -57,17 +64,28 @@ def _extract_json(text: str) -> str | None:
 
 class LLMClient:
     def __init__(self):
-        self.provider = (settings.llm_provider or "stub").lower()
-        self.model = settings.llm_model
-
-        self._openai = None
-        if self.provider == "openai":
-            from openai import OpenAI
-            # OpenAI()는 OPENAI_API_KEY 환경변수를 사용(또는 api_key 인자로 직접 전달)
-            if settings.openai_api_key:
-                self._openai = OpenAI(api_key=settings.openai_api_key)
-            else:
-                self._openai = OpenAI()
+        # LLM_ROUTES가 있으면 그 순서대로(1순위가 provider/model), 없으면 LLM_PROVIDER/LLM_MODEL 하나
+        self.routes = build_routes((settings.llm_provider or "stub").lower(), settings.llm_model)
+        self.router = Router.from_settings(self.routes)
+        # 캐시 키와 provider/model 표시는 1순위 route 기준. 호출은 route마다 자기 provider 클라이언트로(route.client)
+        self.provider = self.router.primary.provider
+        self.model = self.router.primary.model
+        # route가 전부 stub이면 프롬프트/파싱/캐시 없이 stub 결과를 바로 낸다
+        self.live = any(not r.client.is_stub for r in self.routes)
+        if self.live:
+            # 깨진 프롬프트 템플릿은 첫 호출이 아니라 시작할 때 드러나게
+            prompts.load_all()
+
+        # 캐시는 실제 provider 호출에만 의미가 있으므로 stub이면 만들지 않음
+        self.cache: LLMCache | None = None
+        if self.live and settings.llm_cache_enabled:
+            self.cache = LLMCache.from_settings()
+
+        # stub 호출 지연/실패 주입(기본은 없음)
+        self.stub_profile = StubProfile.from_settings()
+
+        # 1순위 route의 타임아웃/재시도/RPM·TPM 제한/회로 차단(route마다 따로 있음)
+        self.transport = self.router.primary.transport
 
     # ---------- stub ----------
     def _stub_topics(self, pillar: str, audience: str, n: int) -> list[TopicCandidate]:
@@ -113,85 +131,269 @@ class LLMClient:
 """
         return DraftCandidate(content_md=content_md, summary=summary)
 
-    # ---------- openai ----------
-    def _openai_output_text(self, prompt: str) -> str:
-        # Responses API 사용 (OpenAI 권장 인터페이스) :contentReference[oaicite:2]{index=2}
-        r = self._openai.responses.create(model=self.model, input=prompt)
+    def _stub_topics_text(self, pillar: str, audience: str, n: int) -> str:
+        return json.dumps([asdict(c) for c in self._stub_topics(pillar, audience, n)], ensure_ascii=False)
+
+    def _stub_draft_text(self, title: str, angle: str, pillar: str, audience: str) -> str:
+        return json.dumps(asdict(self._stub_draft(title, angle, pillar, audience)), ensure_ascii=False)
+
+    # ---------- provider ----------
+    def _output_text(
+        self, prompt: RenderedPrompt, expected_output: int, stub_text: Callable[[], str]
+    ) -> tuple[str, Route]:
+        """
+        (응답 텍스트, 답한 route). route 목록에 stub이 섞여 있으면 그 route는 stub_text()로 답한다.
+        """
+        return self.router.call(lambda route: (self._route_text(route, prompt, expected_output, stub_text), route))
+
+    @staticmethod
+    def _request_kwargs(prompt: RenderedPrompt) -> dict:
+        # 고정 prefix가 앞에 오도록 prefix + suffix 한 문자열로 보낸다(provider는 앞부분 일치로 캐시)
+        kwargs: dict = {"input": prompt.text}
+        if settings.llm_prompt_cache_key:
+            # SDK 버전과 무관하게 보내도록 extra_body로
+            kwargs["extra_body"] = {"prompt_cache_key": prompt.cache_key}
+        return kwargs
+
+    def _route_text(
+        self, route: Route, prompt: RenderedPrompt, expected_output: int, stub_text: Callable[[], str]
+    ) -> str:
+        if route.client.is_stub:
+            route.transport.call(lambda _timeout: self.stub_profile.simulate())
+            return stub_text()
+        # Responses API 사용 (OpenAI 권장 인터페이스, OpenAI 호환 provider도 같은 SDK) :contentReference[oaicite:2]{index=2}
+        with span("llm.request", provider=route.provider, model=route.model, prompt=prompt.name) as attrs:
+            r = route.transport.call(
+                lambda timeout: route.client.sdk.responses.create(
+                    model=route.model, timeout=timeout, **self._request_kwargs(prompt)
+                ),
+                est_tokens=estimate_tokens(prompt.text, expected_output),
+                usage_of=lambda r: getattr(getattr(r, "usage", None), "total_tokens", None),
+            )
+            self._record_usage(r, attrs, route, prompt)
         return r.output_text
 
-    def generate_topics(self, pillar: str, audience: str, n: int) -> list[TopicCandidate]:
-        if self.provider != "openai" or not self._openai:
-            return self._stub_topics(pillar, audience, n)
-
-        prompt = f"""
-너는 한국어 블로그 글 기획자다.
-주제 영역(pillar)과 대상(audience)을 보고, 블로그 글 제목 후보 {n}개를 만들어라.
-
-반드시 JSON 배열만 출력:
-[
-  {{"title":"...","angle":"...","score":0-100}},
-  ...
-]
-
-조건:
-- title은 40자 이내
-- angle은 한 문장(구성/전개 요약)
-- score는 실전 유용도 점수(0~100)
-pillar={pillar}
-audience={audience}
-"""
-        text = self._openai_output_text(prompt)
-        j = _extract_json(text)
-        if not j:
-            return self._stub_topics(pillar, audience, n)
-
-        try:
-            arr = json.loads(j)
-            out = []
-            for x in arr[:n]:
-                out.append(TopicCandidate(
-                    title=str(x["title"]),
-                    angle=str(x["angle"]),
-                    score=int(x.get("score", 70)),
-                ))
-            return out
-        except Exception:
-            return self._stub_topics(pillar, audience, n)
-
-    def generate_draft(self, title: str, angle: str, pillar: str, audience: str) -> DraftCandidate:
-        if self.provider != "openai" or not self._openai:
+    def _record_usage(self, response, attrs: dict, route: Route, prompt: RenderedPrompt) -> None:
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        for kind in ("input_tokens", "output_tokens"):
+            n = getattr(usage, kind, None) or 0
+            if n:
+                LLM_TOKENS.inc(n, provider=route.provider, model=route.model, kind=kind.removesuffix("_tokens"))
+                attrs[kind] = n
+
+        # provider prompt cache 적중분(input_tokens 중 캐시에서 읽은 토큰)
+        details = getattr(usage, "input_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) or 0
+        total_in = getattr(usage, "input_tokens", None) or 0
+        attrs["cached_tokens"] = cached
+        if cached:
+            LLM_TOKENS.inc(cached, provider=route.provider, model=route.model, kind="cached_input")
+            LLM_PROMPT_TOKENS.inc(cached, prompt=prompt.name, cached="true")
+        if total_in > cached:
+            LLM_PROMPT_TOKENS.inc(total_in - cached, prompt=prompt.name, cached="false")
+
+    def _stub_call(self) -> None:
+        self.router.call(lambda route: route.transport.call(lambda _timeout: self.stub_profile.simulate()))
+
+    # ---------- cache ----------
+    def _cache_get(self, prompt: RenderedPrompt, cache: CacheMode) -> str | None:
+        # 캐시 키는 1순위 route 기준(hedge/fallback으로 다른 route가 답해도 같은 키)
+        if self.cache is None or cache != "use":
+            return None
+        hit = self.cache.get(make_cache_key(self.provider, self.model, prompt.text))
+        LLM_CACHE.inc(result="hit" if hit is not None else "miss")
+        return hit
+
+    def _cached_output_text(
+        self, prompt: RenderedPrompt, cache: CacheMode, expected_output: int, stub_text: Callable[[], str]
+    ) -> tuple[str, bool]:
+        """
+        (응답 텍스트, 캐시에 넣을지). 새로 받은 실제 provider 응답만 넣는다(캐시 적중/stub route 응답은 아님).
+        캐시 저장은 파싱 성공 후 _cache_put에서.
+        """
+        hit = self._cache_get(prompt, cache)
+        if hit is not None:
+            return hit, False
+        text, route = self._output_text(prompt, expected_output, stub_text)
+        return text, not route.client.is_stub
+
+    def _cache_put(self, prompt: RenderedPrompt, text: str, cache: CacheMode) -> None:
+        if self.cache is not None and cache != "bypass":
+            self.cache.set(make_cache_key(self.provider, self.model, prompt.text), text)
+
+    @traced("llm.generate_topics")
+    def generate_topics(self, pillar: str, audience: str, n: int, cache: CacheMode = "use") -> list[TopicCandidate]:
+        return list(self.stream_topics(pillar, audience, n, cache=cache))
+
+    def stream_topics(
+        self, pillar: str, audience: str, n: int, cache: CacheMode = "use"
+    ) -> Iterator[TopicCandidate]:
+        """
+        토픽 후보를 응답 스트림에서 JSON 배열 원소가 닫히는 대로 하나씩 내준다(검증 통과분만, 최대 n개).
+        - 깨진 원소/끊긴 꼬리는 그 원소만 버린다
+        - 하나도 못 건졌으면 예전처럼 stub 후보로 대체
+        """
+        if not self.live:
+            self._stub_call()
+            yield from self._stub_topics(pillar, audience, n)
+            return
+
+        prompt = prompts.render("topic_factory", n=n, pillar=pillar, audience=audience)
+        hit = self._cache_get(prompt, cache)
+        answered: list[Route] = []
+        chunks = (
+            chunk_text(hit, 256)
+            if hit is not None
+            else self._provider_stream(
+                prompt, 60 * n, lambda: chunk_text(self._stub_topics_text(pillar, audience, n), 256), answered
+            )
+        )
+
+        parser = JsonArrayParser()
+        raw: list[str] = []
+        count = 0
+        with closing(chunks):
+            for chunk in chunks:
+                raw.append(chunk)
+                for obj in parser.feed(chunk):
+                    c = _topic_candidate(obj)
+                    if c is None:
+                        continue
+                    yield c
+                    count += 1
+                    if count >= n:
+                        break
+                if count >= n or parser.done:
+                    break
+        for obj in parser.finish():
+            c = _topic_candidate(obj)
+            if c is not None and count < n:
+                yield c
+                count += 1
+
+        if count == 0:
+            yield from self._stub_topics(pillar, audience, n)
+            return
+        if hit is None and not answered[0].client.is_stub:
+            self._cache_put(prompt, "".join(raw), cache)
+
+    @traced("llm.generate_draft")
+    def generate_draft(
+        self, title: str, angle: str, pillar: str, audience: str, cache: CacheMode = "use"
+    ) -> DraftCandidate:
+        if not self.live:
+            self._stub_call()
             return self._stub_draft(title, angle, pillar, audience)
 
-        prompt = f"""
-너는 한국어 블로그 글 작성자다.
-아래 정보를 바탕으로 '네이버 블로그에 붙여넣기 쉬운' 마크다운 초안을 작성해라.
-
-반드시 JSON 객체만 출력:
-{{
-  "summary": "한 문장 요약",
-  "content_md": "마크다운 전체"
-}}
-
-작성 규칙:
-- 과장/보장 표현(100%, 무조건, 합격보장 등) 금지
-- H1 1개, H2 3~6개
-- 목록(ul/ol), 인용문(> ) 포함
-- 마지막에 짧은 CTA(상담 유도는 과장 없이)
-title={title}
-angle={angle}
-pillar={pillar}
-audience={audience}
-"""
-        text = self._openai_output_text(prompt)
+        prompt = prompts.render("draft", title=title, angle=angle, pillar=pillar, audience=audience)
+        text, fresh = self._cached_output_text(
+            prompt, cache, 2000, lambda: self._stub_draft_text(title, angle, pillar, audience)
+        )
         j = _extract_json(text)
         if not j:
             return self._stub_draft(title, angle, pillar, audience)
 
         try:
             obj = json.loads(j)
-            return DraftCandidate(
+            out = DraftCandidate(
                 summary=str(obj["summary"]),
                 content_md=str(obj["content_md"]),
             )
         except Exception:
             return self._stub_draft(title, angle, pillar, audience)
+
+        if fresh:
+            self._cache_put(prompt, text, cache)
+        return out
+
+    # ---------- streaming ----------
+    def stream_draft(
+        self, title: str, angle: str, pillar: str, audience: str, cache: CacheMode = "use"
+    ) -> DraftStream:
+        """
+        본문(content_md) 조각을 도착하는 대로 내주는 초안 생성. summary는 다 읽은 뒤 확정.
+        provider 실패(스트림 중간 포함)는 예외로 올라온다(stub으로 대체하지 않음).
+        """
+        if not self.live:
+            return DraftStream(self._stub_stream(title, angle, pillar, audience))
+
+        prompt = prompts.render("draft_stream", title=title, angle=angle, pillar=pillar, audience=audience)
+        hit = self._cache_get(prompt, cache)
+        if hit is not None:
+            return DraftStream(chunk_text(hit))
+
+        def stub_chunks() -> Iterator[str]:
+            out = self._stub_draft(title, angle, pillar, audience)
+            return chunk_text(format_stream_text(out.summary, out.content_md))
+
+        answered: list[Route] = []
+
+        def on_complete(text: str) -> None:
+            if not answered[0].client.is_stub:
+                self._cache_put(prompt, text, cache)
+
+        return DraftStream(self._provider_stream(prompt, 2000, stub_chunks, answered), on_complete=on_complete)
+
+    def _provider_stream(
+        self,
+        prompt: RenderedPrompt,
+        expected_output: int,
+        stub_chunks: Callable[[], Iterator[str]],
+        answered: list[Route],
+    ) -> Iterator[str]:
+        """
+        응답 텍스트 조각 스트림. 스트림을 연 route를 answered에 넣는다(stub route가 답했으면 캐시하지 않게).
+        """
+        est = estimate_tokens(prompt.text, expected_output)
+
+        def open_stream(route: Route):
+            if route.client.is_stub:
+                route.transport.call(lambda _timeout: self.stub_profile.simulate(0.1))
+                return route, None
+            events = route.transport.call(
+                lambda timeout: route.client.sdk.responses.create(
+                    model=route.model, stream=True, timeout=timeout, **self._request_kwargs(prompt)
+                ),
+                est_tokens=est,
+            )
+            return route, events
+
+        # 스트림은 hedge하지 않는다(진 쪽 스트림을 끝까지 붙잡게 됨). 열기 실패만 다음 route로
+        route, events = self.router.call(open_stream, hedge=False)
+        answered.append(route)
+        if events is None:
+            yield from stub_chunks()
+            return
+        with span("llm.stream", provider=route.provider, model=route.model, prompt=prompt.name) as attrs:
+            try:
+                for ev in events:
+                    kind = getattr(ev, "type", "")
+                    if kind == "response.output_text.delta":
+                        yield ev.delta
+                    elif kind == "response.completed":
+                        self._record_usage(ev.response, attrs, route, prompt)
+                        usage = getattr(ev.response, "usage", None)
+                        route.transport.limiter.settle(est, getattr(usage, "total_tokens", None))
+                    elif kind in ("response.failed", "response.incomplete", "error"):
+                        raise LLMTransportError(f"LLM stream ended with {kind}")
+            finally:
+                close = getattr(events, "close", None)
+                if close is not None:
+                    close()
+
+    def _stub_stream(self, title: str, angle: str, pillar: str, audience: str) -> Iterator[str]:
+        with span("llm.stream", provider=self.provider, model=self.model):
+            # 첫 조각까지 지연의 10%, 나머지 90%는 조각마다 나눠서(실제 스트림 흉내)
+            self.router.call(
+                lambda route: route.transport.call(lambda _timeout: self.stub_profile.simulate(0.1)),
+                hedge=False,
+            )
+            out = self._stub_draft(title, angle, pillar, audience)
+            pieces = list(chunk_text(format_stream_text(out.summary, out.content_md)))
+            per_piece_s = self.stub_profile.sample_ms() * 0.9 / len(pieces) / 1000
+            for piece in pieces:
+                if per_piece_s > 0:
+                    time.sleep(per_piece_s)
+                yield piece
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+# 객체 배열의 시작: '[' 다음(공백 무시)이 '{' 또는 ']'
+# (앞쪽 설명문에 섞인 "[참고]" 같은 괄호에 속지 않게)
+_ARRAY_START = re.compile(r"\[\s*[{\]]")
+
+
+class JsonArrayParser:
+    """
+    스트리밍 텍스트에서 JSON 객체 배열의 원소를 닫히는 즉시 꺼내는 증분 파서.
+    - 배열 시작('[' 뒤에 '{') 앞의 설명/코드펜스 등은 무시하고, 배열이 닫히면 그 뒤도 무시
+      ({"items": [...]}처럼 감싸져 와도 첫 배열을 쓰므로 동작)
+    - 원소 하나가 깨져 있으면(json.loads 실패) 그 원소만 버리고 errors를 센다
+    - 스트림이 중간에 끊기면 finish()에서 마지막 미완성 원소만 버려진다
+    """
+
+    def __init__(self):
+        self.errors = 0
+        self.done = False
+        self._started = False
+        self._in_elem = False
+        self._depth = 0
+        self._in_str = False
+        self._esc = False
+        self._buf: list[str] = []
+        self._pre = ""  # 배열 시작 전 텍스트(청크 경계에 걸친 "[ {" 판정용)
+
+    def feed(self, chunk: str) -> list[Any]:
+        items: list[Any] = []
+        if self.done or not chunk:
+            return items
+
+        i = 0
+        if not self._started:
+            pre = self._pre + chunk
+            m = _ARRAY_START.search(pre)
+            if m is None:
+                self._pre = pre[-64:]
+                return items
+            self._started = True
+            self._pre = ""
+            chunk = pre
+            i = m.start() + 1
+
+        n = len(chunk)
+
+        seg = i if self._in_elem else -1  # 현재 원소가 이 청크에서 시작된 위치
+        while i < n:
+            ch = chunk[i]
+            if not self._in_elem:
+                if ch == "]":
+                    self.done = True
+                    return items
+                if ch in " \t\r\n,":
+                    i += 1
+                    continue
+                self._in_elem = True
+                self._depth = 0
+                seg = i
+
+            if self._in_str:
+                if self._esc:
+                    self._esc = False
+                elif ch == "\\":
+                    self._esc = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._buf.append(chunk[seg : i + 1])
+                    seg = -1
+                    self._emit(items)
+            elif self._depth == 0 and ch in ",]":
+                # 숫자/문자열 같은 스칼라 원소의 끝
+                self._buf.append(chunk[seg:i])
+                seg = -1
+                self._emit(items)
+                if ch == "]":
+                    self.done = True
+                    return items
+            i += 1
+
+        if seg >= 0 and self._in_elem:
+            self._buf.append(chunk[seg:])
+        return items
+
+    def finish(self) -> list[Any]:
+        """
+        스트림 끝. 닫히지 않은 원소가 남아 있으면 파싱을 시도(대개 실패해서 버려짐).
+        """
+        items: list[Any] = []
+        if self._in_elem and self._depth == 0 and not self._in_str:
+            self._emit(items)  # 끝에 붙은 스칼라
+        elif self._in_elem:
+            self._buf.clear()
+            self._in_elem = False
+            self.errors += 1
+        self.done = True
+        return items
+
+    def _emit(self, items: list[Any]) -> None:
+        text = "".join(self._buf).strip()
+        self._buf.clear()
+        self._in_elem = False
+        self._in_str = False
+        self._esc = False
+        if not text:
+            return
+        try:
+            items.append(json.loads(text))
+        except ValueError:
+            self.errors += 1
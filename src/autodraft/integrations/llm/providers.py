@@ -0,0 +1,92 @@
+"""
+LLM provider 클라이언트. Route마다 자기 provider 클라이언트를 들고 있어서 LLM_ROUTES에
+서로 다른 provider를 섞을 수 있다(한 provider가 죽거나 느리면 다른 provider로 hedge/fallback).
+- openai: OpenAI(OPENAI_API_KEY)
+- LLM_PROVIDERS에 적은 이름: OpenAI 호환 API(base_url). 키는 <NAME>_API_KEY 환경변수
+- stub: 실제 호출 없음(개발/벤치마크용)
+"""
+from __future__ import annotations
+
+import os
+import threading
+
+from autodraft.integrations.llm.transport import get_http_client
+from autodraft.settings import settings
+
+STUB = "stub"
+
+
+def parse_providers(spec: str) -> dict[str, str]:
+    """
+    "azure=https://x.openai.azure.com/openai/v1, local=http://localhost:8000/v1" → {name: base_url}
+    """
+    out: dict[str, str] = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, sep, url = part.partition("=")
+        if not sep or not name.strip() or not url.strip():
+            raise ValueError(f"Invalid LLM provider (expected name=base_url): {part!r}")
+        out[name.strip().lower()] = url.strip()
+    return out
+
+
+class ProviderClient:
+    """
+    provider 1개. SDK 클라이언트는 처음 쓸 때 만든다(openai import가 무거워서 워커 기동/오토스케일을 늦추지 않게).
+    같은 provider의 route끼리 공유한다(get_provider).
+    """
+
+    def __init__(self, name: str, base_url: str | None = None, api_key: str | None = None):
+        self.name = name
+        self.base_url = base_url
+        self.api_key = api_key
+        self._sdk = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_stub(self) -> bool:
+        return self.name == STUB
+
+    @property
+    def sdk(self):
+        """
+        OpenAI SDK 클라이언트(OpenAI 호환 API면 base_url만 다름). api_key가 없으면 SDK가 OPENAI_API_KEY를 읽는다.
+        재시도는 transport가 하므로 SDK 자체 재시도는 끈다. 커넥션 풀은 공유 httpx 클라이언트.
+        """
+        if self._sdk is None:
+            with self._lock:
+                if self._sdk is None:
+                    from openai import OpenAI
+
+                    kwargs = {"http_client": get_http_client(), "max_retries": 0}
+                    if self.base_url:
+                        kwargs["base_url"] = self.base_url
+                    if self.api_key:
+                        kwargs["api_key"] = self.api_key
+                    self._sdk = OpenAI(**kwargs)
+        return self._sdk
+
+
+_clients: dict[str, ProviderClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_provider(name: str) -> ProviderClient:
+    """
+    이름 → provider 클라이언트(프로세스당 하나). 모르는 이름이면 ValueError(LLM_PROVIDERS에 추가).
+    """
+    name = name.lower()
+    with _clients_lock:
+        client = _clients.get(name)
+        if client is None:
+            if name in (STUB, "openai"):
+                client = ProviderClient(name, api_key=settings.openai_api_key if name == "openai" else None)
+            else:
+                base_url = parse_providers(settings.llm_providers).get(name)
+                if base_url is None:
+                    raise ValueError(f"Unknown LLM provider {name!r}: add it to LLM_PROVIDERS (name=base_url)")
+                client = ProviderClient(name, base_url=base_url, api_key=os.environ.get(f"{name.upper()}_API_KEY"))
+            _clients[name] = client
+        return client
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from autodraft.integrations.llm.providers import ProviderClient, get_provider
+from autodraft.integrations.llm.transport import LLMTransport
+from autodraft.observability import registry, span
+from autodraft.settings import settings
+
+T = TypeVar("T")
+
+ROUTE_CALLS = registry.counter(
+    "autodraft_llm_route_calls_total", "LLM route attempts by outcome (win/error/lost).", ("route", "outcome")
+)
+HEDGES = registry.counter("autodraft_llm_hedges_total", "Hedged requests fired, by target route.", ("route",))
+
+
+def parse_routes(spec: str) -> list[tuple[str, str]]:
+    """
+    "openai:gpt-4.1-mini, azure:gpt-4.1-mini" → [(provider, model), ...]
+    """
+    out: list[tuple[str, str]] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        provider, sep, model = part.partition(":")
+        if not sep or not provider.strip() or not model.strip():
+            raise ValueError(f"Invalid LLM route (expected provider:model): {part!r}")
+        out.append((provider.strip().lower(), model.strip()))
+    return out
+
+
+class LatencyStats:
+    """
+    최근 성공 호출 지연(초) window개로 percentile 계산.
+    """
+
+    def __init__(self, window: int = 200):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, p: float) -> float | None:
+        with self._lock:
+            xs = sorted(self._samples)
+        if not xs:
+            return None
+        k = max(0, min(len(xs) - 1, math.ceil(p / 100 * len(xs)) - 1))
+        return xs[k]
+
+
+@dataclass
+class Route:
+    provider: str
+    model: str
+    transport: LLMTransport
+    client: ProviderClient  # 이 route의 provider(route마다 다를 수 있음)
+    stats: LatencyStats = field(default_factory=LatencyStats)
+
+    @property
+    def name(self) -> str:
+        return f"{self.provider}:{self.model}"
+
+    def available(self) -> bool:
+        # 회로가 열린 route는 건너뜀(reset 시간이 지나면 다시 후보)
+        return not self.transport.breaker.is_open()
+
+    def snapshot(self, p: float) -> dict:
+        q = self.stats.percentile(p)
+        return {
+            "route": self.name,
+            "circuit": self.transport.breaker.state,
+            "samples": self.stats.count,
+            f"p{p:g}_ms": round(q * 1000, 1) if q is not None else None,
+        }
+
+
+class Router:
+    """
+    순서 있는 route 목록으로 호출.
+    - hedge 켜짐 + route 2개 이상: 1순위 호출이 hedge 지연(그 route의 최근 p{percentile})까지 안 끝나면
+      다음 route로 hedged 요청을 추가로 보내고 먼저 성공한 쪽을 쓴다(늦은 쪽 결과는 버림)
+    - 실패하면 바로 다음 route로 fallback, 회로가 열린 route는 건너뜀
+    - hedge 꺼짐: 실패 시에만 순서대로 fallback
+    """
+
+    def __init__(
+        self,
+        routes: list[Route],
+        hedge: bool = True,
+        percentile: float = 95.0,
+        hedge_after_s: float = 20.0,
+        min_samples: int = 20,
+        min_delay_s: float = 0.05,
+        max_workers: int = 32,
+    ):
+        if not routes:
+            raise ValueError("at least one LLM route is required")
+        self.routes = routes
+        self.hedge = hedge and len(routes) > 1
+        self.percentile = percentile
+        self.hedge_after_s = hedge_after_s
+        self.min_samples = min_samples
+        self.min_delay_s = min_delay_s
+        self._max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, routes: list[Route]) -> "Router":
+        return cls(
+            routes,
+            hedge=settings.llm_hedge_enabled,
+            percentile=settings.llm_hedge_percentile,
+            hedge_after_s=settings.llm_hedge_after_s,
+            min_samples=settings.llm_hedge_min_samples,
+            min_delay_s=settings.llm_hedge_min_delay_s,
+        )
+
+    @property
+    def primary(self) -> Route:
+        return self.routes[0]
+
+    def hedge_delay(self, route: Route) -> float:
+        if route.stats.count < self.min_samples:
+            return self.hedge_after_s
+        q = route.stats.percentile(self.percentile)
+        return max(self.min_delay_s, q if q is not None else self.hedge_after_s)
+
+    def candidates(self) -> list[Route]:
+        routes = [r for r in self.routes if r.available()]
+        # 전부 차단 상태면 그대로 시도해서 CircuitOpenError로 빨리 실패
+        return routes or list(self.routes)
+
+    def call(self, fn: Callable[[Route], T], hedge: bool = True) -> T:
+        """
+        hedge=False: fallback만(스트림 열기처럼 늦게 진 쪽을 버리기 곤란한 호출).
+        """
+        routes = self.candidates()
+        with span("llm.route", hedged=False) as attrs:
+            if not (hedge and self.hedge) or len(routes) == 1:
+                return self._sequential(routes, fn, attrs)
+            return self._hedged(routes, fn, attrs)
+
+    def close(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    # ---------- internal ----------
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="llm_route")
+            return self._pool
+
+    @staticmethod
+    def _attempt(route: Route, fn: Callable[[Route], T]) -> T:
+        t0 = time.perf_counter()
+        out = fn(route)
+        route.stats.add(time.perf_counter() - t0)
+        return out
+
+    def _sequential(self, routes: list[Route], fn: Callable[[Route], T], attrs: dict) -> T:
+        last: Exception | None = None
+        for route in routes:
+            try:
+                out = self._attempt(route, fn)
+            except Exception as e:
+                ROUTE_CALLS.inc(route=route.name, outcome="error")
+                last = e
+                continue
+            ROUTE_CALLS.inc(route=route.name, outcome="win")
+            attrs["route"] = route.name
+            return out
+        assert last is not None
+        raise last
+
+    def _hedged(self, routes: list[Route], fn: Callable[[Route], T], attrs: dict) -> T:
+        pool = self._get_pool()
+        queue = list(routes)
+        pending: dict[Future, Route] = {}
+        last_launched: Route | None = None
+        last: Exception | None = None
+
+        def launch() -> None:
+            nonlocal last_launched
+            route = queue.pop(0)
+            pending[pool.submit(copy_context().run, self._attempt, route, fn)] = route
+            last_launched = route
+
+        launch()
+        while pending:
+            timeout = self.hedge_delay(last_launched) if queue else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                # 지연 임계값 초과 → 다음 route로 hedge
+                HEDGES.inc(route=queue[0].name)
+                attrs["hedged"] = True
+                launch()
+                continue
+
+            for fut in done:
+                route = pending.pop(fut)
+                try:
+                    out = fut.result()
+                except Exception as e:
+                    ROUTE_CALLS.inc(route=route.name, outcome="error")
+                    last = e
+                    continue
+                ROUTE_CALLS.inc(route=route.name, outcome="win")
+                for other in pending.values():
+                    ROUTE_CALLS.inc(route=other.name, outcome="lost")
+                attrs["route"] = route.name
+                return out
+
+            # 실패한 만큼 다음 route로 fallback
+            if queue:
+                launch()
+
+        assert last is not None
+        raise last
+
+
+def build_routes(default_provider: str, default_model: str) -> list[Route]:
+    specs = parse_routes(settings.llm_routes) if settings.llm_routes else [(default_provider, default_model)]
+    # route마다 회로/속도 제한을 따로 둔다(RPM/TPM도 모델 단위로 매겨짐). provider 클라이언트는 provider별로 공유
+    return [
+        Route(provider=p, model=m, transport=LLMTransport.from_settings(), client=get_provider(p)) for p, m in specs
+    ]
+
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Iterator
+
+# 스트리밍 초안 응답 형식(프롬프트에서 요구):
+#   SUMMARY: 한 문장 요약
+#   ---
+#   (마크다운 본문)
+# JSON으로 감싸면 본문을 다 받기 전까지 보여줄 수 없어서 헤더 + 본문 형식을 쓴다.
+_HEADER = re.compile(r"\A\s*SUMMARY:[ \t]*(?P<summary>[^\n]*)\n(?P<sep>[ \t]*-{3,}[ \t]*\n)?")
+_HEADER_PREFIX = "SUMMARY:"
+# 헤더 구분선이 이만큼 안에 안 나오면 헤더 없이 본문으로 본다
+_HEADER_MAX = 2000
+_MD_MARKUP = re.compile(r"^[#>\-*+\d.)\s]+|[*_`]")
+
+
+def format_stream_text(summary: str, content_md: str) -> str:
+    return f"{_HEADER_PREFIX} {summary}\n---\n{content_md}"
+
+
+def fallback_summary(content_md: str, limit: int = 120) -> str:
+    """
+    헤더가 없을 때: 제목이 아닌 첫 문장을 요약으로.
+    """
+    for line in content_md.splitlines():
+        s = line.strip()
+        if not s or s.startswith("#"):
+            continue
+        s = _MD_MARKUP.sub("", s).strip()
+        if s:
+            return s[:limit]
+    return ""
+
+
+class DraftStream:
+    """
+    스트리밍 초안. 이터레이션하면 본문(content_md) 조각이 도착하는 대로 나온다.
+    다 읽은 뒤에 summary/content_md/raw_text가 확정된다.
+    - on_complete(raw_text): 끝까지 정상 수신했을 때 1회 호출(캐시 저장 등)
+    """
+
+    def __init__(self, raw_chunks: Iterable[str], on_complete: Callable[[str], None] | None = None):
+        self._raw_chunks = raw_chunks
+        self._on_complete = on_complete
+        self._raw: list[str] = []
+        self._content: list[str] = []
+        self.summary = ""
+        self.completed = False
+
+    @property
+    def raw_text(self) -> str:
+        return "".join(self._raw)
+
+    @property
+    def content_md(self) -> str:
+        return "".join(self._content)
+
+    def __iter__(self) -> Iterator[str]:
+        head: str | None = ""  # None이면 헤더 처리 끝
+        for piece in self._raw_chunks:
+            if not piece:
+                continue
+            self._raw.append(piece)
+            if head is None:
+                self._content.append(piece)
+                yield piece
+                continue
+
+            head += piece
+            body = self._split_header(head, final=False)
+            if body is None:
+                continue
+            head = None
+            if body:
+                self._content.append(body)
+                yield body
+
+        if head:
+            body = self._split_header(head, final=True) or ""
+            if body:
+                self._content.append(body)
+                yield body
+
+        if not self.summary:
+            self.summary = fallback_summary(self.content_md)
+        self.completed = True
+        if self._on_complete is not None and self._content:
+            self._on_complete(self.raw_text)
+
+    def _split_header(self, head: str, final: bool) -> str | None:
+        """
+        헤더를 떼어낸 본문 앞부분. 아직 판단할 수 없으면 None.
+        """
+        stripped = head.lstrip()
+        if not stripped.startswith(_HEADER_PREFIX[: len(stripped)]):
+            return head  # 헤더 없음 → 전부 본문
+
+        m = _HEADER.match(head)
+        # 구분선까지 왔거나, 구분선 없이 본문이 시작됐거나, 스트림이 끝났으면 확정
+        if m and (m.group("sep") or head[m.end():].strip(" \t-") or final):
+            self.summary = m.group("summary").strip()
+            return head[m.end():]
+        if final:
+            summary, _, rest = stripped[len(_HEADER_PREFIX):].partition("\n")
+            self.summary = summary.strip()
+            return rest
+        if len(head) > _HEADER_MAX:
+            return head
+        return None
+
+
+def chunk_text(text: str, size: int = 48) -> Iterator[str]:
+    for i in range(0, len(text), size):
+        yield text[i : i + size]
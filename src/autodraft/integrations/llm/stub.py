@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+
+from autodraft.settings import settings
+
+
+class StubFailure(RuntimeError):
+    """
+    stub provider가 주입한 실패(벤치마크/장애 연습용).
+    """
+
+
+@dataclass
+class StubProfile:
+    """
+    stub 호출에 지연/실패를 주입하는 설정.
+    - dist: fixed | uniform | exp | lognormal
+      fixed: latency_ms 고정 / uniform: latency_ms ± jitter_ms
+      exp: 평균 latency_ms 지수분포 / lognormal: 중앙값 latency_ms, sigma = jitter_ms / latency_ms
+    - failure_rate: 0~1 확률로 StubFailure
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    dist: str = "fixed"
+    failure_rate: float = 0.0
+    seed: int | None = None
+    _rng: random.Random = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+
+    @classmethod
+    def from_settings(cls) -> "StubProfile":
+        return cls(
+            latency_ms=settings.llm_stub_latency_ms,
+            jitter_ms=settings.llm_stub_jitter_ms,
+            dist=settings.llm_stub_latency_dist,
+            failure_rate=settings.llm_stub_failure_rate,
+            seed=settings.llm_stub_seed,
+        )
+
+    def sample_ms(self) -> float:
+        with self._lock:
+            rng = self._rng
+            if self.latency_ms <= 0:
+                return 0.0
+            if self.dist == "uniform":
+                return max(0.0, rng.uniform(self.latency_ms - self.jitter_ms, self.latency_ms + self.jitter_ms))
+            if self.dist == "exp":
+                return rng.expovariate(1.0 / self.latency_ms)
+            if self.dist == "lognormal":
+                sigma = self.jitter_ms / self.latency_ms if self.jitter_ms > 0 else 0.5
+                return rng.lognormvariate(math.log(self.latency_ms), sigma)
+            return self.latency_ms
+
+    def should_fail(self) -> bool:
+        if self.failure_rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < self.failure_rate
+
+    def simulate(self, fraction: float = 1.0) -> None:
+        """
+        fraction: 지연 중 이번에 쓸 비율(스트리밍 stub은 첫 응답까지 일부만 기다린다).
+        """
+        delay = self.sample_ms() * fraction
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if self.should_fail():
+            raise StubFailure("stub provider injected failure")
@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+from autodraft.integrations.llm.stub import StubFailure
+from autodraft.observability import registry, span
+from autodraft.settings import settings
+
+if TYPE_CHECKING:  # httpx는 실제로 HTTP를 쓸 때 import(stub만 쓰는 워커 기동을 늦추지 않게)
+    import httpx
+
+T = TypeVar("T")
+
+RETRIES = registry.counter("autodraft_llm_retries_total", "LLM calls retried by the transport.", ("reason",))
+BREAKER_REJECTS = registry.counter(
+    "autodraft_llm_circuit_rejected_total", "LLM calls rejected while the circuit breaker was open."
+)
+LIMITER_WAIT = registry.histogram(
+    "autodraft_llm_ratelimit_wait_seconds", "Time spent waiting for the RPM/TPM limiter."
+)
+
+
+class LLMTransportError(RuntimeError):
+    """
+    transport 계층에서 호출을 포기한 경우(재시도 소진/회로 차단).
+    stub 초안으로 대체하지 않고 그대로 올려 topic을 ERROR로 남긴다.
+    """
+
+
+class CircuitOpenError(LLMTransportError):
+    pass
+
+
+# ---------- 공유 HTTP 클라이언트 ----------
+_http_client: httpx.Client | None = None
+_http_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    provider SDK들이 함께 쓰는 커넥션 풀(keep-alive 재사용). 타임아웃은 호출마다 따로 준다.
+    """
+    global _http_client
+    with _http_lock:
+        if _http_client is None:
+            import httpx
+
+            _http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=settings.llm_http_max_connections,
+                    max_keepalive_connections=settings.llm_http_max_connections,
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(settings.llm_timeout_s, connect=settings.llm_connect_timeout_s),
+            )
+        return _http_client
+
+
+def close_http_client() -> None:
+    global _http_client
+    with _http_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+def call_timeout() -> httpx.Timeout:
+    import httpx
+
+    return httpx.Timeout(settings.llm_timeout_s, connect=settings.llm_connect_timeout_s)
+
+
+# ---------- rate limit ----------
+class TokenBucket:
+    """
+    capacity만큼 모아둘 수 있고 초당 rate씩 채워지는 버킷. rate <= 0이면 제한 없음.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate <= 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, n: float, now: float) -> float:
+        """
+        n개를 꺼내려면 몇 초 기다려야 하는지(0이면 바로 가능). 요청이 capacity보다 크면 가득 찰 때까지.
+        """
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        need = min(n, self.capacity) - self._tokens
+        return 0.0 if need <= 0 else need / self.rate
+
+    def take(self, n: float) -> None:
+        if not self.unlimited:
+            self._tokens -= n  # 음수 허용: 실제 사용량이 추정보다 크면 다음 호출이 그만큼 기다림
+
+    def give(self, n: float) -> None:
+        if not self.unlimited:
+            self._tokens = min(self.capacity, self._tokens + n)
+
+
+class RateLimiter:
+    """
+    RPM(요청 수) + TPM(토큰 수) 두 버킷을 동시에 만족할 때만 통과.
+    TPM은 호출 전 추정치로 먼저 차감하고, 응답의 실제 사용량으로 settle()에서 보정.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.requests = TokenBucket(rpm, rpm / 60.0)
+        self.tokens = TokenBucket(tpm, tpm / 60.0)
+        self._cond = threading.Condition()
+
+    def acquire(self, est_tokens: int) -> float:
+        waited = 0.0
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                delay = max(self.requests.wait_time(1, now), self.tokens.wait_time(est_tokens, now))
+                if delay <= 0:
+                    self.requests.take(1)
+                    self.tokens.take(est_tokens)
+                    return waited
+                t0 = time.monotonic()
+                self._cond.wait(delay)
+                waited += time.monotonic() - t0
+
+    def settle(self, est_tokens: int, actual_tokens: int | None) -> None:
+        if actual_tokens is None:
+            return
+        with self._cond:
+            diff = actual_tokens - est_tokens
+            if diff > 0:
+                self.tokens.take(diff)
+            elif diff < 0:
+                self.tokens.give(-diff)
+                self._cond.notify_all()
+
+
+# ---------- circuit breaker ----------
+class CircuitBreaker:
+    """
+    연속 실패 failure_threshold회면 OPEN → reset_timeout_s 동안 바로 실패.
+    이후 HALF_OPEN에서 probe 1건만 통과시켜 성공하면 CLOSED, 실패하면 다시 OPEN.
+    failure_threshold <= 0이면 꺼짐(항상 통과, 상태는 DISABLED 고정).
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    DISABLED = "disabled"
+
+    def __init__(self, failure_threshold: int, reset_timeout_s: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.state = self.CLOSED if self.enabled else self.DISABLED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    def is_open(self) -> bool:
+        """
+        지금 호출하면 바로 거절될 상태인지(상태는 바꾸지 않음).
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            return self.state == self.OPEN and time.monotonic() - self._opened_at < self.reset_timeout_s
+
+    def allow(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout_s:
+                    BREAKER_REJECTS.inc()
+                    raise CircuitOpenError("LLM provider circuit is open")
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    BREAKER_REJECTS.inc()
+                    raise CircuitOpenError("LLM provider circuit is half-open (probe in flight)")
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+# ---------- retry ----------
+def _status_code(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after_s(exc: BaseException) -> float | None:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    raw = headers.get("retry-after-ms")
+    if raw:
+        try:
+            return float(raw) / 1000
+        except ValueError:
+            pass
+    raw = headers.get("retry-after")
+    try:
+        return float(raw) if raw else None
+    except ValueError:
+        return None  # HTTP-date 형식은 무시하고 backoff 사용
+
+
+def retry_reason(exc: BaseException) -> str | None:
+    """
+    재시도할 예외면 사유 문자열, 아니면 None.
+    - 429 / 408 / 409 / 5xx 응답
+    - 연결 실패/타임아웃(httpx, openai SDK의 APIConnectionError/APITimeoutError)
+    - stub 주입 실패(5xx 흉내)
+    """
+    status = _status_code(exc)
+    if status is not None:
+        if status == 429:
+            return "429"
+        if status in (408, 409) or status >= 500:
+            return "5xx" if status >= 500 else str(status)
+        return None
+    if isinstance(exc, StubFailure):
+        return "5xx"
+    import httpx
+
+    if isinstance(exc, httpx.TimeoutException) or type(exc).__name__ == "APITimeoutError":
+        return "timeout"
+    if isinstance(exc, httpx.TransportError) or type(exc).__name__ == "APIConnectionError":
+        return "connection"
+    return None
+
+
+@dataclass
+class RetryPolicy:
+    max_retries: int = 4
+    base_s: float = 0.5
+    max_s: float = 20.0
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        # full jitter: [0, min(max, base * 2^attempt))
+        return rng.uniform(0, min(self.max_s, self.base_s * (2**attempt)))
+
+
+class LLMTransport:
+    """
+    provider 호출 1건을 감싸는 정책 묶음: 회로 차단 → RPM/TPM 대기 → 호출 → 실패 시 jitter backoff 재시도.
+    send(timeout)은 실제 호출(SDK 등), 반환값에서 usage(tokens)는 usage_of로 꺼낸다.
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        breaker: CircuitBreaker,
+        retry: RetryPolicy,
+        sleep: Callable[[float], None] = time.sleep,
+        seed: int | None = None,
+    ):
+        self.limiter = limiter
+        self.breaker = breaker
+        self.retry = retry
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def from_settings(cls) -> "LLMTransport":
+        return cls(
+            limiter=RateLimiter(settings.llm_rpm, settings.llm_tpm),
+            breaker=CircuitBreaker(settings.llm_breaker_failures, settings.llm_breaker_reset_s),
+            retry=RetryPolicy(settings.llm_max_retries, settings.llm_backoff_base_s, settings.llm_backoff_max_s),
+        )
+
+    def call(
+        self,
+        send: Callable[[httpx.Timeout], T],
+        est_tokens: int = 0,
+        usage_of: Callable[[T], int | None] | None = None,
+    ) -> T:
+        attempt = 0
+        while True:
+            self.breaker.allow()
+
+            waited = self.limiter.acquire(est_tokens)
+            if waited > 0:
+                LIMITER_WAIT.observe(waited)
+
+            try:
+                with span("llm.attempt", attempt=attempt):
+                    out = send(call_timeout())
+            except Exception as e:
+                reason = retry_reason(e)
+                # 재시도 대상이 아닌 오류(400/401 등)는 provider 장애가 아니므로 breaker에 반영하지 않음
+                if reason is None:
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                if attempt >= self.retry.max_retries:
+                    raise LLMTransportError(f"LLM call failed after {attempt + 1} attempts: {e}") from e
+                RETRIES.inc(reason=reason)
+                delay = self.retry.backoff(attempt, self._rng)
+                retry_after = _retry_after_s(e)
+                if retry_after is not None:
+                    delay = max(delay, min(retry_after, self.retry.max_s))
+                self._sleep(delay)
+                attempt += 1
+                continue
+
+            self.breaker.record_success()
+            if usage_of is not None:
+                self.limiter.settle(est_tokens, usage_of(out))
+            return out
+
+
+def estimate_tokens(prompt: str, expected_output: int) -> int:
+    # 한국어 위주 프롬프트 기준 대략 2자당 1토큰으로 잡는다(정확할 필요 없음, settle에서 보정)
+    return len(prompt) // 2 + expected_output
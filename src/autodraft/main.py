@@ -2,21 +2,45 @@ from __future__ import annotations
 
 import hashlib
 import os
+from datetime import datetime, timedelta
 from pathlib import Path
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
 from fastapi.security import APIKeyHeader
-from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from autodraft.db.base import Base
-from autodraft.db.session import engine, get_db
+from autodraft.db.migrations import check_version, migrate
+from autodraft.db.session import SessionLocal, dispose_async_engine, engine, get_db, get_read_db
+from autodraft.db.repos import ExportRepo, IdempotencyRepo, JobRepo, TopicRepo
+from autodraft.db.repos.keyset import decode_cursor, encode_cursor
 from autodraft.integrations.llm import LLMClient
+from autodraft.integrations.llm.transport import close_http_client
+from autodraft.observability import CONTENT_TYPE, registry
+from autodraft.pipelines.jobs import JobRunner, job_status
 from autodraft.pipelines.orchestrator import run_selected
+from autodraft.pipelines.streaming import stream_topic_draft
 from autodraft.pipelines.steps.topic_factory import generate_topics
-from autodraft.schemas.draft import RunSelectedRequest, RunSelectedResponse
-from autodraft.schemas.topic import GenerateTopicsRequest, GenerateTopicsResponse
+from autodraft.schemas.draft import DraftPage, RunSelectedRequest, RunSelectedResponse, StreamDraftRequest
+from autodraft.schemas.export import ExportIndexItem, ExportIndexPage
+from autodraft.schemas.job import JobStatus, JobSubmitted
+from autodraft.schemas.sync import SyncChanges
+from autodraft.schemas.topic import (
+    GenerateTopicsRequest,
+    GenerateTopicsResponse,
+    SelectTopicsRequest,
+    SelectTopicsResponse,
+    TopicPage,
+)
 from autodraft.settings import settings
+from autodraft.web.idempotency import IDEMPOTENCY_HEADER, run_idempotent
+from autodraft.web.listing import alist_drafts, alist_topics, list_drafts, list_topics
+from autodraft.web.sse import sse_response
+from autodraft.web.static import PrecompressedStaticFiles
+from autodraft.web.sync import achanges_since, changes_etag, changes_since, etag_matches
+from autodraft.web.tracing import TraceMiddleware
 
 
 api_key_header = APIKeyHeader(name="X-DEMO-TOKEN", auto_error=False)
@@ -32,19 +56,42 @@ def verify_demo_token(api_key: str | None = Depends(api_key_header)) -> None:
         raise HTTPException(status_code=401, detail="Invalid X-DEMO-TOKEN")
 
 
+async def _read(db, fn, afn, *args, **kwargs):
+    """
+    조회 핸들러 공통: get_read_db가 준 세션에 맞춰 DB_ASYNC면 afn(AsyncSession)을 바로 await,
+    아니면 fn(sync Session)을 스레드풀에서(sync def 핸들러와 같은 방식).
+    """
+    if isinstance(db, Session):
+        return await run_in_threadpool(fn, db, *args, **kwargs)
+    return await afn(db, *args, **kwargs)
+
+
 def create_app() -> FastAPI:
     app = FastAPI(title="AutoDraft Demo", version="0.3.0")
-
-    # exports 디렉토리 보장 + 정적 서빙
-    export_dir = Path(settings.export_dir).resolve()
-    export_dir.mkdir(parents=True, exist_ok=True)
-    app.mount("/exports", StaticFiles(directory=str(export_dir)), name="exports")
+    app.add_middleware(TraceMiddleware, log_traces=settings.trace_log_enabled)
 
     llm = LLMClient()
+    jobs = JobRunner(llm)
 
     @app.on_event("startup")
     def _startup() -> None:
-        Base.metadata.create_all(bind=engine)
+        # 기본은 schema_version 한 번 읽고 끝(뒤처져 있으면 시작 실패). 적용은 cli.migrate에서
+        if settings.db_auto_migrate:
+            migrate(engine)
+        check_version(engine)
+        db = SessionLocal()
+        try:
+            IdempotencyRepo.purge_before(db, datetime.utcnow() - timedelta(seconds=settings.idempotency_ttl_s))
+        finally:
+            db.close()
+        jobs.start()
+
+    @app.on_event("shutdown")
+    async def _shutdown() -> None:
+        jobs.shutdown()
+        llm.router.close()
+        close_http_client()
+        await dispose_async_engine()
 
     @app.get("/health")
     def health():
@@ -53,8 +100,15 @@ def create_app() -> FastAPI:
             "demo_token_configured": settings.demo_api_token != "change-me",
             "llm_provider": settings.llm_provider,
             "llm_model": settings.llm_model,
+            "llm_cache": llm.cache.stats() if llm.cache else None,
+            "llm_routes": [r.snapshot(settings.llm_hedge_percentile) for r in llm.routes],
         }
 
+    if settings.metrics_enabled:
+        @app.get("/metrics", include_in_schema=False)
+        def metrics() -> Response:
+            return Response(registry.render(), media_type=CONTENT_TYPE)
+
     # ---- debug ----
     @app.get("/debug/auth", dependencies=[Depends(verify_demo_token)])
     def debug_auth():
@@ -89,35 +143,255 @@ def create_app() -> FastAPI:
             "os_env_fp": fp(env_token),
         }
 
+    # ---- 조회: DB_ASYNC=true면 AsyncSession으로 끝까지 async(스레드풀 안 씀), 아니면 sync 세션 ----
     @app.get("/debug/exports")
-    def debug_exports():
+    async def debug_exports(db=Depends(get_read_db)):
+        # 디렉토리 glob 대신 exports 인덱스 테이블 사용
         p = Path(settings.export_dir).resolve()
-        files = [x.name for x in p.glob("*.html")][:20] if p.exists() else []
+        html_count = await _read(db, ExportRepo.count_files, ExportRepo.acount_files)
+        sample = await _read(db, ExportRepo.page, ExportRepo.apage, limit=20)
         return {
             "export_dir": str(p),
             "exists": p.exists(),
-            "html_count": len(list(p.glob("*.html"))) if p.exists() else 0,
-            "sample": files,
+            "html_count": html_count,
+            "sample": [e.path.rsplit("/", 1)[-1] for e in sample],
         }
 
+    @app.get(
+        "/exports/index",
+        response_model=ExportIndexPage,
+        dependencies=[Depends(verify_demo_token)],
+    )
+    async def api_exports_index(
+        limit: int = Query(50, ge=1, le=500),
+        cursor: str | None = None,
+        db=Depends(get_read_db),
+    ) -> ExportIndexPage:
+        after = None
+        if cursor:
+            try:
+                created_at, draft_id = decode_cursor(cursor)
+                after = (datetime.fromisoformat(created_at), str(draft_id))
+            except (ValueError, TypeError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        rows = await _read(db, ExportRepo.page, ExportRepo.apage, limit=limit, after=after)
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].draft_id) if len(rows) == limit else None
+        return ExportIndexPage(
+            items=[
+                ExportIndexItem(
+                    draft_id=e.draft_id,
+                    path=e.path,
+                    size_bytes=e.size_bytes,
+                    content_hash=e.content_hash,
+                    created_at=e.created_at,
+                )
+                for e in rows
+            ],
+            next_cursor=next_cursor,
+        )
+
+    # ---- 목록(최신순 keyset 페이지, cursor는 이전 응답의 next_cursor) ----
+    @app.get(
+        "/topics",
+        response_model=TopicPage,
+        dependencies=[Depends(verify_demo_token)],
+    )
+    async def api_list_topics(
+        limit: int = Query(50, ge=1, le=500),
+        cursor: str | None = None,
+        status: str | None = None,
+        pillar: str | None = None,
+        audience: str | None = None,
+        created_from: datetime | None = Query(None, description="created_at >= (포함)"),
+        created_to: datetime | None = Query(None, description="created_at < (제외)"),
+        db=Depends(get_read_db),
+    ) -> TopicPage:
+        try:
+            return await _read(
+                db,
+                list_topics,
+                alist_topics,
+                limit,
+                cursor,
+                status=status,
+                pillar=pillar,
+                audience=audience,
+                created_from=created_from,
+                created_to=created_to,
+            )
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    @app.get(
+        "/drafts",
+        response_model=DraftPage,
+        dependencies=[Depends(verify_demo_token)],
+    )
+    async def api_list_drafts(
+        limit: int = Query(50, ge=1, le=500),
+        cursor: str | None = None,
+        status: str | None = None,
+        topic_id: str | None = None,
+        updated_from: datetime | None = Query(None, description="updated_at >= (포함)"),
+        updated_to: datetime | None = Query(None, description="updated_at < (제외)"),
+        db=Depends(get_read_db),
+    ) -> DraftPage:
+        try:
+            return await _read(
+                db,
+                list_drafts,
+                alist_drafts,
+                limit,
+                cursor,
+                status=status,
+                topic_id=topic_id,
+                updated_from=updated_from,
+                updated_to=updated_to,
+            )
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # ---- sync (시트 폴링: since 이후 바뀐 topics/drafts) ----
+    @app.get(
+        "/sync/changes",
+        response_model=SyncChanges,
+        dependencies=[Depends(verify_demo_token)],
+    )
+    async def api_sync_changes(
+        since: str | None = None,
+        limit: int = Query(settings.sync_page_limit, ge=1, le=1000),
+        if_none_match: str | None = Header(None),
+        db=Depends(get_read_db),
+    ):
+        try:
+            page = await _read(db, changes_since, achanges_since, since, limit)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        etag = changes_etag(since, page)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        return JSONResponse(page.model_dump(mode="json"), headers=headers)
+
     # ---- api ----
     @app.post(
         "/topics/generate",
         response_model=GenerateTopicsResponse,
         dependencies=[Depends(verify_demo_token)],
     )
-    def api_generate_topics(req: GenerateTopicsRequest, db: Session = Depends(get_db)) -> GenerateTopicsResponse:
-        items = generate_topics(db=db, llm=llm, pillar=req.pillar, audience=req.audience, n=req.n)
-        return GenerateTopicsResponse(items=items)
+    def api_generate_topics(
+        req: GenerateTopicsRequest,
+        db: Session = Depends(get_db),
+        idempotency_key: str | None = Header(None, alias=IDEMPOTENCY_HEADER),
+    ):
+        def run() -> GenerateTopicsResponse:
+            items = generate_topics(
+                db=db, llm=llm, pillar=req.pillar, audience=req.audience, n=req.n, cache=req.cache
+            )
+            return GenerateTopicsResponse(items=items)
+
+        return run_idempotent(db, idempotency_key, "topics.generate", req, run)
+
+    @app.post(
+        "/topics/select",
+        response_model=SelectTopicsResponse,
+        dependencies=[Depends(verify_demo_token)],
+    )
+    def api_select_topics(req: SelectTopicsRequest, db: Session = Depends(get_db)) -> SelectTopicsResponse:
+        # 워커(python -m autodraft.worker) 큐에 넣기: NEW/ERROR → SELECTED. 다시 보내도 결과가 같다
+        selected = TopicRepo.mark_selected(db, req.topic_ids)
+        chosen = set(selected)
+        return SelectTopicsResponse(
+            selected=selected, skipped=[t for t in dict.fromkeys(req.topic_ids) if t not in chosen]
+        )
 
     @app.post(
         "/pipeline/run_selected",
         response_model=RunSelectedResponse,
         dependencies=[Depends(verify_demo_token)],
     )
-    def api_run_selected(req: RunSelectedRequest, db: Session = Depends(get_db)) -> RunSelectedResponse:
-        drafts = run_selected(db=db, llm=llm, topic_ids=req.topic_ids)
-        return RunSelectedResponse(drafts=drafts)
+    def api_run_selected(
+        req: RunSelectedRequest,
+        db: Session = Depends(get_db),
+        idempotency_key: str | None = Header(None, alias=IDEMPOTENCY_HEADER),
+    ):
+        # 재시도(타임아웃 후 Apps Script 재호출, 버튼 두 번 클릭)는 Idempotency-Key로 첫 응답을 그대로 재생
+        def run() -> RunSelectedResponse:
+            drafts = run_selected(
+                db=db,
+                llm=llm,
+                topic_ids=req.topic_ids,
+                concurrency=req.concurrency,
+                cache=req.cache,
+                force=req.force,
+            )
+            return RunSelectedResponse(drafts=drafts)
+
+        return run_idempotent(db, idempotency_key, "pipeline.run_selected", req, run)
+
+    @app.post(
+        "/pipeline/stream",
+        response_class=StreamingResponse,
+        dependencies=[Depends(verify_demo_token)],
+    )
+    def api_stream_draft(req: StreamDraftRequest) -> StreamingResponse:
+        # SSE: start → delta(본문 MD 조각)* / risk* → done(DraftResult) | error
+        return sse_response(stream_topic_draft(llm, req.topic_id, cache=req.cache, force=req.force))
+
+    # ---- jobs (비동기: 바로 job_id 반환 → GET /jobs/{id}로 폴링) ----
+    @app.post(
+        "/jobs/topics/generate",
+        status_code=202,
+        response_model=JobSubmitted,
+        dependencies=[Depends(verify_demo_token)],
+    )
+    def api_submit_generate_topics(
+        req: GenerateTopicsRequest,
+        db: Session = Depends(get_db),
+        idempotency_key: str | None = Header(None, alias=IDEMPOTENCY_HEADER),
+    ):
+        def run() -> JobSubmitted:
+            job = jobs.submit_generate_topics(db, req)
+            return JobSubmitted(job_id=job.id, kind=job.kind, status=job.status)
+
+        return run_idempotent(db, idempotency_key, "jobs.topics.generate", req, run, status_code=202)
+
+    @app.post(
+        "/jobs/run_selected",
+        status_code=202,
+        response_model=JobSubmitted,
+        dependencies=[Depends(verify_demo_token)],
+    )
+    def api_submit_run_selected(
+        req: RunSelectedRequest,
+        db: Session = Depends(get_db),
+        idempotency_key: str | None = Header(None, alias=IDEMPOTENCY_HEADER),
+    ):
+        # 같은 키로 다시 제출하면 새 job을 만들지 않고 처음 job_id를 돌려준다
+        def run() -> JobSubmitted:
+            job = jobs.submit_run_selected(db, req)
+            return JobSubmitted(job_id=job.id, kind=job.kind, status=job.status)
+
+        return run_idempotent(db, idempotency_key, "jobs.run_selected", req, run, status_code=202)
+
+    def _job_or_404(job_id: str, job) -> JobStatus:
+        if not job:
+            raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+        return job_status(job)
+
+    @app.get(
+        "/jobs/{job_id}",
+        response_model=JobStatus,
+        dependencies=[Depends(verify_demo_token)],
+    )
+    async def api_get_job(job_id: str, db=Depends(get_read_db)) -> JobStatus:
+        return _job_or_404(job_id, await _read(db, JobRepo.get, JobRepo.aget, job_id))
+
+    # exports 디렉토리 보장 + 정적 서빙(.br/.gz 압축본 + ETag/Cache-Control/304)
+    # mount는 /exports 하위를 모두 가져가므로 /exports/index 등 라우트 뒤에 등록
+    export_dir = Path(settings.export_dir).resolve()
+    export_dir.mkdir(parents=True, exist_ok=True)
+    app.mount("/exports", PrecompressedStaticFiles(directory=str(export_dir)), name="exports")
 
     return app
 
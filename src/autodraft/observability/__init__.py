@@ -0,0 +1,17 @@
+from .metrics import CONTENT_TYPE, Counter, Histogram, Registry, registry
+from .tracing import Trace, current_trace, end_trace, log_trace, span, start_trace, traced
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Counter",
+    "Histogram",
+    "Registry",
+    "registry",
+    "Trace",
+    "current_trace",
+    "end_trace",
+    "log_trace",
+    "span",
+    "start_trace",
+    "traced",
+]
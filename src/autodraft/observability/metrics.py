@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Iterable, Iterator
+
+# 초 단위 기본 버킷(LLM 호출 수십 초까지)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(v: float) -> str:
+    if v == math.inf:
+        return "+Inf"
+    if float(v).is_integer():
+        return str(int(v))
+    return repr(float(v))
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, object]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: labels must be {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self._samples()
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if amount < 0:
+            raise ValueError("counter can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, v in items:
+            yield f"{self.name}{_labels(self.labelnames, key)} {_fmt(v)}"
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # key -> [bucket별 개수(비누적)..., sum, count]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        n = len(self.buckets)
+        i = next(i for i, b in enumerate(self.buckets) if value <= b)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0.0] * (n + 2)
+            row[i] += 1
+            row[n] += value
+            row[n + 1] += 1
+
+    def count(self, **labels: object) -> int:
+        row = self._values.get(self._key(labels))
+        return int(row[-1]) if row else 0
+
+    def _samples(self) -> Iterator[str]:
+        n = len(self.buckets)
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        for key, row in items:
+            acc = 0.0
+            for b, c in zip(self.buckets, row[:n]):
+                acc += c
+                le = 'le="' + _fmt(b) + '"'
+                yield f"{self.name}_bucket{_labels(self.labelnames, key, le)} {_fmt(acc)}"
+            yield f"{self.name}_sum{_labels(self.labelnames, key)} {_fmt(row[n])}"
+            yield f"{self.name}_count{_labels(self.labelnames, key)} {_fmt(row[n + 1])}"
+
+
+class Registry:
+    """
+    프로세스 내 메트릭 모음. render()는 Prometheus text exposition(0.0.4) 형식.
+    (prometheus_client 의존성 없이 필요한 Counter/Histogram만)
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"metric already registered with a different shape: {metric.name}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self, name: str, help: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for m in metrics:
+            lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# ---- 공용 메트릭 ----
+SPAN_SECONDS = registry.histogram(
+    "autodraft_span_duration_seconds", "Duration of instrumented steps and LLM calls.", ("span",)
+)
+SPAN_ERRORS = registry.counter(
+    "autodraft_span_errors_total", "Instrumented steps and LLM calls that raised.", ("span",)
+)
+LLM_TOKENS = registry.counter(
+    "autodraft_llm_tokens_total", "Tokens reported by the LLM provider.", ("provider", "model", "kind")
+)
+LLM_PROMPT_TOKENS = registry.counter(
+    "autodraft_llm_prompt_tokens_total",
+    "Input tokens per prompt template, split by provider prompt-cache hit (cached=true|false).",
+    ("prompt", "cached"),
+)
+LLM_CACHE = registry.counter(
+    "autodraft_llm_cache_lookups_total", "LLM response cache lookups.", ("result",)
+)
+HTTP_SECONDS = registry.histogram(
+    "autodraft_http_request_duration_seconds", "HTTP request latency.", ("method", "route", "status")
+)
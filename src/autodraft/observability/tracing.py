@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from autodraft.observability.metrics import SPAN_ERRORS, SPAN_SECONDS
+
+logger = logging.getLogger("autodraft.trace")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Trace:
+    """
+    요청 1건 동안의 span 기록(구조화 로그용). 워커 스레드에서도 add될 수 있어 lock 사용.
+    """
+
+    def __init__(self, trace_id: str | None = None):
+        self.id = trace_id or uuid.uuid4().hex[:16]
+        self.started = time.perf_counter()
+        self.spans: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, start: float, duration: float, ok: bool, attrs: dict[str, Any]) -> None:
+        rec = {
+            "span": name,
+            "start_ms": round((start - self.started) * 1000, 3),
+            "ms": round(duration * 1000, 3),
+            "ok": ok,
+            "thread": threading.current_thread().name,
+        }
+        if attrs:
+            rec.update(attrs)
+        with self._lock:
+            self.spans.append(rec)
+
+    def to_dict(self, **fields: Any) -> dict[str, Any]:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s["start_ms"])
+        return {"trace_id": self.id, **fields, "spans": spans}
+
+
+_current: ContextVar[Trace | None] = ContextVar("autodraft_trace", default=None)
+
+
+def current_trace() -> Trace | None:
+    return _current.get()
+
+
+def start_trace(trace_id: str | None = None):
+    """
+    현재 context에 Trace를 건다. 반환값(token)은 end_trace에 넘긴다.
+    """
+    trace = Trace(trace_id)
+    return trace, _current.set(trace)
+
+
+def end_trace(token) -> None:
+    _current.reset(token)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[dict[str, Any]]:
+    """
+    구간 타이밍: 히스토그램/에러 카운터에 기록하고, 진행 중인 Trace가 있으면 거기에도 남긴다.
+    yield되는 dict에 값을 넣으면 trace 로그의 속성으로 붙는다(예: cached, tokens).
+    """
+    t0 = time.perf_counter()
+    ok = False
+    try:
+        yield attrs
+        ok = True
+    except GeneratorExit:
+        ok = True  # 소비자가 스트림을 일찍 닫은 것(오류 아님)
+        raise
+    finally:
+        dt = time.perf_counter() - t0
+        SPAN_SECONDS.observe(dt, span=name)
+        if not ok:
+            SPAN_ERRORS.inc(span=name)
+        trace = _current.get()
+        if trace is not None:
+            trace.add(name, t0, dt, ok, attrs)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    def deco(fn: F) -> F:
+        @functools.wraps(fn)
+        def inner(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return inner  # type: ignore[return-value]
+
+    return deco
+
+
+def log_trace(trace: Trace, **fields: Any) -> None:
+    logger.info(json.dumps(trace.to_dict(**fields), ensure_ascii=False, default=str))
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class InFlight(Generic[T]):
+    """
+    같은 key 작업이 동시에 여러 번 들어오면 하나(leader)만 실행하고 나머지는 그 결과를 기다린다(single-flight).
+    - claim(key) → (future, leader). leader면 실행 후 반드시 release()
+    - leader가 아니면 future.result()로 leader 결과를 받는다
+    프로세스 내부 기준(uvicorn 워커가 여러 개면 워커끼리는 DB의 완료 초안 확인으로 건너뜀).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[T]] = {}
+
+    def claim(self, key: str) -> tuple[Future[T], bool]:
+        with self._lock:
+            fut = self._calls.get(key)
+            if fut is not None:
+                return fut, False
+            fut = Future()
+            fut.set_running_or_notify_cancel()
+            self._calls[key] = fut
+            return fut, True
+
+    def release(self, key: str, fut: Future[T], result: T | None = None, exc: BaseException | None = None) -> None:
+        with self._lock:
+            if self._calls.get(key) is fut:
+                del self._calls[key]
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from autodraft.db.models import Job
+from autodraft.db.repos import JobRepo
+from autodraft.db.session import SessionLocal
+from autodraft.integrations.llm import LLMClient
+from autodraft.pipelines.leases import LeaseKeeper, default_owner
+from autodraft.pipelines.orchestrator import run_selected
+from autodraft.pipelines.steps.topic_factory import generate_topics
+from autodraft.schemas.draft import DraftResult, RunSelectedRequest
+from autodraft.schemas.job import JobStatus, JobTopicProgress
+from autodraft.schemas.topic import GenerateTopicsRequest, TopicIdea
+from autodraft.settings import settings
+
+RUN_SELECTED = "RUN_SELECTED"
+GENERATE_TOPICS = "GENERATE_TOPICS"
+
+logger = logging.getLogger("autodraft.jobs")
+
+
+class JobLeaseLost(RuntimeError):
+    """
+    실행 중 job lease가 만료되어 다른 프로세스가 가져감(이쪽은 더 기록하지 않고 멈춘다).
+    """
+
+
+def job_status(job: Job) -> JobStatus:
+    """
+    Job row → API 응답(JobStatus).
+    """
+    result = json.loads(job.result_json or "{}")
+    return JobStatus(
+        job_id=job.id,
+        kind=job.kind,
+        status=job.status,
+        total=job.total,
+        done=job.done,
+        topics=[JobTopicProgress(**x) for x in result.get("topics", [])],
+        items=[TopicIdea(**x) for x in result.get("items", [])],
+        last_error=job.last_error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
+
+
+class JobRunner:
+    """
+    앱 프로세스 안에서 도는 백그라운드 job 실행기.
+    - submit_*: jobs 테이블에 QUEUED로 기록하고 바로 반환
+    - 워커 풀이 job을 claim(QUEUED/만료된 RUNNING → RUNNING + 이 프로세스 lease, UPDATE 한 문장)한 뒤 실행하면서
+      topic 단위 진행/부분 결과를 계속 기록(lease를 아직 갖고 있을 때만). 실행 중에는 heartbeat로 lease 연장
+    - start() 시, 그리고 job_lease_s마다 QUEUED/lease가 만료된 RUNNING job을 다시 돌린다
+      (재시작 복구, 여러 프로세스가 같은 DB를 봐도 한 job은 한 프로세스만 실행)
+    """
+
+    def __init__(self, llm: LLMClient, max_workers: int | None = None, lease_s: float | None = None):
+        self.llm = llm
+        self.max_workers = max_workers or settings.job_workers
+        self.lease_s = lease_s or settings.job_lease_s
+        self.owner = default_owner()
+        self._pool: ThreadPoolExecutor | None = None
+        self._leases: LeaseKeeper | None = None
+        self._queued: set[str] = set()  # 풀에 넣었지만 아직 끝나지 않은 job(복구 스캔이 중복으로 넣지 않게)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    # ---------- lifecycle ----------
+    def start(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                return
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+            self._leases = LeaseKeeper(self.owner, self.lease_s, renew=JobRepo.renew_leases).start()
+            self._stop.clear()
+        self._recover()
+        threading.Thread(target=self._recover_loop, name="job-recover", daemon=True).start()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+            leases, self._leases = self._leases, None
+            self._queued.clear()  # 취소된 job은 다음 start()에서 다시
+            self._stop.set()
+        if pool is not None:
+            # 실행 중인 job은 RUNNING으로 남고 lease가 만료되면 다음 start()(또는 다른 프로세스)가 이어서 처리한다
+            pool.shutdown(wait=False, cancel_futures=True)
+        if leases is not None:
+            leases.stop()
+
+    def _recover(self) -> None:
+        db = SessionLocal()
+        try:
+            pending = [j.id for j in JobRepo.list_unfinished(db)]
+        except Exception:
+            logger.exception("listing unfinished jobs failed")
+            return
+        finally:
+            db.close()
+        for job_id in pending:
+            self._enqueue(job_id)
+
+    def _recover_loop(self) -> None:
+        # 다른 프로세스가 돌리다 죽은 job은 lease가 만료된 뒤에야 보이므로 주기적으로 다시 확인
+        while not self._stop.wait(self.lease_s):
+            self._recover()
+
+    # ---------- submit ----------
+    def submit_run_selected(self, db: Session, req: RunSelectedRequest) -> Job:
+        topics = [JobTopicProgress(topic_id=tid, state="PENDING").model_dump() for tid in req.topic_ids]
+        return self._submit(
+            db,
+            kind=RUN_SELECTED,
+            payload=req.model_dump(),
+            total=len(req.topic_ids),
+            result={"topics": topics},
+        )
+
+    def submit_generate_topics(self, db: Session, req: GenerateTopicsRequest) -> Job:
+        return self._submit(db, kind=GENERATE_TOPICS, payload=req.model_dump(), total=req.n, result={"items": []})
+
+    def _submit(self, db: Session, kind: str, payload: dict, total: int, result: dict) -> Job:
+        now = datetime.utcnow()
+        job = Job(
+            id=f"j_{uuid.uuid4().hex[:10]}",
+            kind=kind,
+            status="QUEUED",
+            payload_json=json.dumps(payload, ensure_ascii=False),
+            result_json=json.dumps(result, ensure_ascii=False),
+            total=total,
+            done=0,
+            last_error=None,
+            created_at=now,
+            updated_at=now,
+        )
+        job = JobRepo.create(db, job)
+        self._enqueue(job.id)
+        return job
+
+    def _enqueue(self, job_id: str) -> None:
+        with self._lock:
+            if self._pool is None or job_id in self._queued:
+                # 아직 start 전이면 QUEUED로 남겨두고 start()에서 집어간다
+                return
+            self._queued.add(job_id)
+            self._pool.submit(self._execute, job_id)
+
+    # ---------- execute ----------
+    def _execute(self, job_id: str) -> None:
+        leases = self._leases
+        db = SessionLocal()
+        try:
+            job = JobRepo.claim(db, job_id, self.owner, self.lease_s) if leases is not None else None
+            if job is None:
+                # 이미 끝났거나 다른 프로세스가 실행 중(또는 shutdown 뒤)
+                return
+            leases.add(job_id)
+            try:
+                if job.kind == RUN_SELECTED:
+                    self._execute_run_selected(db, job)
+                elif job.kind == GENERATE_TOPICS:
+                    self._execute_generate_topics(db, job)
+                else:
+                    raise ValueError(f"Unknown job kind: {job.kind}")
+                job.status = "DONE"
+            except JobLeaseLost:
+                db.rollback()
+                logger.warning("job %s lease lost, leaving it to the new owner", job_id)
+                return
+            except Exception as e:
+                db.rollback()
+                job.status = "FAILED"
+                job.last_error = f"{type(e).__name__}: {e}"
+
+            job.lease_owner = None
+            job.lease_expires_at = None
+            job.updated_at = datetime.utcnow()
+            if not JobRepo.save_owned(db, job, self.owner):
+                logger.warning("job %s lease lost before saving its final status", job_id)
+        finally:
+            db.close()
+            if leases is not None:
+                leases.discard(job_id)
+            with self._lock:
+                self._queued.discard(job_id)
+
+    def _save_progress(self, db: Session, job: Job) -> None:
+        job.updated_at = datetime.utcnow()
+        if not JobRepo.save_owned(db, job, self.owner):
+            raise JobLeaseLost(job.id)
+
+    def _execute_run_selected(self, db: Session, job: Job) -> None:
+        req = RunSelectedRequest(**json.loads(job.payload_json))
+        result = json.loads(job.result_json or "{}")
+        topics = result.get("topics") or [
+            JobTopicProgress(topic_id=tid, state="PENDING").model_dump() for tid in req.topic_ids
+        ]
+
+        # 재시작으로 이어서 도는 경우: 이미 끝난 topic은 건너뜀
+        pending = [i for i, t in enumerate(topics) if t["state"] != "DONE"]
+        if not pending:
+            return
+
+        def on_result(i: int, r: DraftResult) -> None:
+            topics[pending[i]] = JobTopicProgress(topic_id=r.topic_id, state="DONE", draft=r).model_dump()
+            job.result_json = json.dumps({"topics": topics}, ensure_ascii=False)
+            job.done = sum(1 for t in topics if t["state"] == "DONE")
+            self._save_progress(db, job)
+
+        run_selected(
+            db=db,
+            llm=self.llm,
+            topic_ids=[topics[i]["topic_id"] for i in pending],
+            concurrency=req.concurrency,
+            on_result=on_result,
+            cache=req.cache,
+            force=req.force,
+        )
+
+    def _execute_generate_topics(self, db: Session, job: Job) -> None:
+        req = GenerateTopicsRequest(**json.loads(job.payload_json))
+        # 재시작으로 이어서 도는 경우: 이미 저장된 토픽은 두고 나머지만 생성
+        items: list[dict] = list(json.loads(job.result_json or "{}").get("items", []))
+        remaining = req.n - len(items)
+        if remaining <= 0:
+            return
+
+        # 토픽이 하나 저장될 때마다 진행률/부분 결과 기록
+        def on_item(idea: TopicIdea) -> None:
+            items.append(idea.model_dump())
+            job.result_json = json.dumps({"items": items}, ensure_ascii=False)
+            job.done = len(items)
+            self._save_progress(db, job)
+
+        generate_topics(
+            db=db, llm=self.llm, pillar=req.pillar, audience=req.audience, n=remaining, cache=req.cache, on_item=on_item
+        )
@@ -0,0 +1,80 @@
+"""
+topic lease(topics.lease_owner/lease_expires_at): 워커, run_selected(API/job), SSE 스트림이 같은 topic을
+동시에 처리하지 않도록 처리 전에 잡고(TopicRepo.claim/claim_topics), 끝낼 때 DONE/ERROR와 함께 푼다(release_lease).
+처리하는 동안은 LeaseKeeper가 lease를 연장한다. job lease(JobRunner)도 renew만 바꿔서 같이 쓴다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from collections.abc import Callable
+
+from sqlalchemy.orm import Session
+
+from autodraft.db.repos import TopicRepo
+from autodraft.db.session import SessionLocal
+
+logger = logging.getLogger("autodraft.leases")
+
+# (db, ids, owner, lease_s) -> 연장된 id 목록(commit까지)
+RenewFn = Callable[[Session, list[str], str, float], list[str]]
+
+
+def default_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class LeaseKeeper:
+    """
+    owner가 잡고 있는 lease를 lease_s/3마다 lease_s만큼 연장하는 스레드(heartbeat). 기본은 topic lease.
+    처리 시작 시 add, 끝나서 lease를 푼 뒤 discard. start()/stop()은 한 번씩.
+    """
+
+    def __init__(self, owner: str, lease_s: float, renew: RenewFn = TopicRepo.renew_leases):
+        self.owner = owner
+        self.lease_s = lease_s
+        self.renew = renew
+        self._ids: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="lease-heartbeat", daemon=True)
+
+    def start(self) -> LeaseKeeper:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def add(self, topic_id: str) -> None:
+        with self._lock:
+            self._ids.add(topic_id)
+
+    def discard(self, topic_id: str) -> None:
+        with self._lock:
+            self._ids.discard(topic_id)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.lease_s / 3):
+            with self._lock:
+                ids = list(self._ids)
+            if not ids:
+                continue
+            db = SessionLocal()
+            try:
+                renewed = self.renew(db, ids, self.owner, self.lease_s)
+            except Exception:
+                logger.exception("lease heartbeat failed")
+                db.rollback()
+                continue
+            finally:
+                db.close()
+            lost = set(ids) - set(renewed)
+            if lost:
+                # 이미 끝났거나(방금 release) 만료되어 넘어간 것. 후자는 완료 시 release가 실패해서 rollback된다
+                logger.debug("lease not renewed: %s", sorted(lost))
@@ -1,61 +1,448 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from contextvars import copy_context
+from queue import Empty, Full, Queue, SimpleQueue
+
 from sqlalchemy.orm import Session
 
-from autodraft.db.repos import TopicRepo
+from autodraft.db.models import Draft
+from autodraft.db.repos import DraftRepo, ExportRepo, TopicRepo
+from autodraft.db.session import SessionLocal
 from autodraft.integrations.llm import LLMClient
+from autodraft.integrations.llm.cache import CacheMode
+from autodraft.observability import registry, span
+from autodraft.pipelines.inflight import InFlight
+from autodraft.pipelines.leases import LeaseKeeper, default_owner
+from autodraft.pipelines.stages import STATUS_STAGE, Stage, StageContext, StageItem, parse_stage_workers, stages
 from autodraft.schemas.draft import DraftResult
+from autodraft.settings import settings
 
 from autodraft.pipelines.steps.draft import generate_draft
 from autodraft.pipelines.steps.quality_gate import apply_quality_gate
 from autodraft.pipelines.steps.export import export_draft_html
 
+REUSED = registry.counter(
+    "autodraft_pipeline_reused_total",
+    "Topics answered without generating a new draft (completed: existing draft, inflight: joined a running one).",
+    ("reason",),
+)
+QUEUE_WAIT = registry.histogram(
+    "autodraft_pipeline_queue_wait_seconds",
+    "Time a topic waited in a stage's input queue (long waits: that stage needs more workers).",
+    ("stage",),
+)
+
+# 지금 처리 중인 topic_id(같은 topic을 동시에 돌리는 요청/job/스트림은 LLM 호출 1번만)
+inflight_topics: InFlight[DraftResult] = InFlight()
+
+
+def failed_result(topic_id: str) -> DraftResult:
+    return DraftResult(
+        topic_id=topic_id,
+        draft_id="",
+        status="FAILED",
+        risk_score=100,
+        summary="",
+        export_html_ref="",
+    )
+
+
+def busy_result(topic_id: str) -> DraftResult:
+    # 다른 워커/프로세스가 lease를 잡고 처리 중이라 이번 실행에서는 건너뜀
+    return DraftResult(
+        topic_id=topic_id,
+        draft_id="",
+        status="BUSY",
+        risk_score=0,
+        summary="",
+        export_html_ref="",
+    )
+
+
+def draft_result(draft: Draft, reused: bool = False) -> DraftResult:
+    return DraftResult(
+        topic_id=draft.topic_id,
+        draft_id=draft.id,
+        status=draft.status,         # EXPORTED 또는 NEEDS_REVIEW
+        risk_score=draft.risk_score,
+        summary=draft.summary,
+        export_html_ref=draft.export_html_ref,
+        reused=reused,
+    )
+
+
+def reuse_completed(db: Session, topic_id: str, commit: bool, owner: str | None = None) -> DraftResult | None:
+    """
+    이미 완료 초안이 있는 topic이면 그 결과(reused=True), 없으면 None.
+    topic 상태가 DONE이 아니면(시트에서 다시 고른 경우 등) DONE으로 맞춘다.
+    owner를 주면 그 owner가 잡은 lease를 DONE으로 풀면서 맞춘다(lease를 잃었으면 상태는 그대로).
+    """
+    draft = DraftRepo.latest_completed(db, topic_id)
+    if draft is None:
+        return None
+    REUSED.inc(reason="completed")
+    if owner is not None:
+        TopicRepo.release_lease(db, topic_id, owner, "DONE")
+        if commit:
+            db.commit()
+        return draft_result(draft, reused=True)
+    topic = TopicRepo.get(db, topic_id)
+    if topic is not None and topic.status != "DONE":
+        if commit:
+            TopicRepo.update_status(db, topic_id, "DONE")
+        else:
+            TopicRepo.set_status(db, topic_id, "DONE")
+    return draft_result(draft, reused=True)
+
+
+def process_topic(
+    db: Session, llm: LLMClient, topic_id: str, cache: CacheMode, commit: bool, force: bool = False
+) -> DraftResult:
+    """
+    topic 1개에 대해 Draft → QA → Export → 상태 갱신. 실패는 예외로 올린다.
+    commit=False면 변경을 세션에만 쌓는다(unit-of-work).
+    force=False면 완료 초안이 이미 있는 topic은 새로 만들지 않고 그 결과를 돌려준다.
+    """
+    topic = TopicRepo.get(db, topic_id)
+    if not topic:
+        raise ValueError(f"Topic not found: {topic_id}")
+
+    if not force:
+        reused = reuse_completed(db, topic_id, commit=commit)
+        if reused is not None:
+            return reused
+
+    with span("generate_draft"):
+        draft = generate_draft(db, llm, topic, cache=cache, commit=commit)
+    with span("apply_quality_gate"):
+        draft = apply_quality_gate(db, draft, review_threshold=30, commit=commit)
+    with span("export_draft_html"):
+        draft = export_draft_html(db, draft, commit=commit)
+
+    # topic 처리 완료 표시(리스크 높아도 “초안 생성 완료”는 DONE)
+    with span("update_status"):
+        if commit:
+            TopicRepo.update_status(db, topic_id, "DONE")
+        else:
+            TopicRepo.set_status(db, topic_id, "DONE")
+
+    return draft_result(draft)
+
 
-def run_selected(db: Session, llm: LLMClient, topic_ids: list[str]) -> list[DraftResult]:
+_STOP = object()
+
+
+class _Countdown:
+    """
+    stage 워커가 모두 끝났는지(마지막으로 끝난 워커가 다음 stage에 종료 신호를 넘긴다).
+    """
+
+    def __init__(self, n: int):
+        self._n = n
+        self._lock = threading.Lock()
+
+    def done(self) -> bool:
+        with self._lock:
+            self._n -= 1
+            return self._n == 0
+
+
+def _stage_loop(
+    stage: Stage,
+    ctx: StageContext,
+    q_in: Queue,
+    q_out: Queue,
+    left: _Countdown,
+    next_workers: int,
+    abort: threading.Event,
+) -> None:
+    while True:
+        item = q_in.get()
+        if item is _STOP:
+            break
+        QUEUE_WAIT.observe(time.perf_counter() - item.enqueued_at, stage=stage.name)
+        if item.error is None and not abort.is_set():
+            try:
+                with span(stage.span):
+                    stage.fn(ctx, item)
+            except Exception as e:
+                item.error = e
+        item.enqueued_at = time.perf_counter()
+        q_out.put(item)
+    if left.done():
+        for _ in range(next_workers):
+            q_out.put(_STOP)
+
+
+def _save_items(db: Session, items: list[StageItem], abort: threading.Event, owner: str) -> list[DraftResult]:
+    """
+    status stage: 성공한 topic의 draft/exports 인덱스/DONE, 실패한 topic의 ERROR를 한 트랜잭션으로 commit.
+    상태는 owner lease를 풀면서 바꾸고(release_leases), 그 사이 lease를 잃은 topic의 결과는 버린다(BUSY).
+    결과는 commit 전에 메모리 값으로 만들고(commit 후 refresh 없음), 끝나면 세션을 비운다(큰 batch도 메모리 일정).
+    """
+    ok = [it for it in items if it.error is None and it.draft is not None]
+    failed = [it for it in items if it.error is not None or it.draft is None]
+    try:
+        if abort.is_set():
+            # 중단: 저장하지 않고 lease만 ERROR로 푼다
+            TopicRepo.release_leases(db, [it.topic.id for it in items], owner, "ERROR")
+            db.commit()
+            results = [failed_result(it.topic.id) for it in items]
+        else:
+            with span("update_status"):
+                # topic 처리 완료 표시(리스크 높아도 “초안 생성 완료”는 DONE)
+                kept = set(TopicRepo.release_leases(db, [it.topic.id for it in ok], owner, "DONE"))
+                for it in ok:
+                    if it.topic.id in kept:
+                        DraftRepo.add(db, it.draft)
+                        if it.export is not None:
+                            ExportRepo.upsert(db, it.export)
+                TopicRepo.release_leases(db, [it.topic.id for it in failed], owner, "ERROR")
+            results = []
+            for it in items:
+                if it not in ok:
+                    results.append(failed_result(it.topic.id))
+                elif it.topic.id in kept:
+                    results.append(draft_result(it.draft))
+                else:
+                    results.append(busy_result(it.topic.id))
+            with span("commit", topics=len(items)):
+                db.commit()
+    except Exception:
+        # commit 자체가 실패하면 묶음 전체를 실패로 기록
+        db.rollback()
+        try:
+            TopicRepo.release_leases(db, [it.topic.id for it in items], owner, "ERROR")
+            db.commit()
+        except Exception:
+            db.rollback()
+        results = [failed_result(it.topic.id) for it in items]
+    db.expunge_all()
+    return results
+
+
+def _status_loop(
+    q_in: Queue,
+    batch: int,
+    committed: Callable[[StageItem, DraftResult], None],
+    abort: threading.Event,
+    owner: str,
+) -> None:
+    # 도착해 있는 것을 최대 batch개까지 모아 한 번에 commit(group commit, 덜 찼다고 기다리지는 않음)
+    db = SessionLocal()
+    try:
+        stopped = False
+        while not stopped:
+            first = q_in.get()
+            if first is _STOP:
+                break
+            items = [first]
+            while len(items) < batch:
+                try:
+                    nxt = q_in.get_nowait()
+                except Empty:
+                    break
+                if nxt is _STOP:
+                    stopped = True
+                    break
+                items.append(nxt)
+            QUEUE_WAIT.observe(time.perf_counter() - first.enqueued_at, stage=STATUS_STAGE)
+            for item, r in zip(items, _save_items(db, items, abort, owner)):
+                committed(item, r)
+    finally:
+        db.close()
+
+
+def stage_workers(concurrency: int | None = None, n_topics: int | None = None) -> dict[str, int]:
+    """
+    stage별 스레드 수: 등록 기본값 < PIPELINE_STAGE_WORKERS < draft는 concurrency(없으면 PIPELINE_CONCURRENCY).
+    topic 수보다 많이 띄우지는 않는다.
+    """
+    workers = {s.name: s.workers for s in stages()}
+    workers[STATUS_STAGE] = 1
+    workers.update(parse_stage_workers(settings.pipeline_stage_workers))
+    workers["draft"] = concurrency if concurrency is not None else settings.pipeline_concurrency
+    cap = n_topics if n_topics is not None else max(workers.values())
+    return {name: max(1, min(n, cap)) for name, n in workers.items()}
+
+
+def run_selected(
+    db: Session,
+    llm: LLMClient,
+    topic_ids: list[str],
+    concurrency: int | None = None,
+    on_result: Callable[[int, DraftResult], None] | None = None,
+    cache: CacheMode = "use",
+    force: bool = False,
+) -> list[DraftResult]:
     """
     선택된 topic_ids에 대해:
     - Draft 생성
     - Quality Gate(risk_score, status)
     - Export HTML 생성
-    반환: DraftResult 리스트(시트에 적기 좋음)
+    반환: DraftResult 리스트(시트에 적기 좋음, 입력 순서 유지)
+
+    등록된 stage(pipelines/stages.py: draft → quality_gate → export → …)를 크기
+    settings.pipeline_queue_size인 queue로 잇고, stage마다 따로 스레드를 둔다(stage_workers).
+    LLM을 기다리는 동안 다른 topic의 채점/HTML 렌더링/파일 쓰기가 같이 돈다.
+    앞 stage는 다음 queue가 차면 기다리므로, topic이 많아도 메모리에 올라가는 초안 수는 일정하다.
+    마지막 status stage가 draft/exports 인덱스/topic 상태를 최대 settings.pipeline_commit_batch개씩 묶어 commit
+    (unit-of-work 모드가 아니면 topic마다). concurrency는 draft stage 스레드 수(None이면 settings.pipeline_concurrency).
+
+    on_result(index, result)는 topic 결과가 확정될 때마다(commit 후) 호출 스레드에서 불린다
+    (완료 순서대로, index는 topic_ids 기준 위치). job 진행률 기록용.
+
+    이미 완료 초안이 있는 topic은 force=True가 아니면 다시 생성하지 않고 기존 결과(reused=True)를 돌려준다.
+    다른 요청/job이 지금 처리 중인 topic은 그 결과를 기다려서 같이 쓴다(LLM 호출 1번).
+
+    처리할 topic은 넣기 직전에 워커와 같은 lease를 잡고(TopicRepo.claim_topics, 끝날 때까지 LeaseKeeper가 연장)
+    DONE/ERROR는 그 lease를 풀면서 기록한다. 다른 프로세스(워커 등)가 lease를 잡고 있는 topic은 건너뛴다(status=BUSY).
     """
-    results: list[DraftResult] = []
+    results: list[DraftResult | None] = [None] * len(topic_ids)
+    if not topic_ids:
+        return results
 
-    for topic_id in topic_ids:
-        try:
-            topic = TopicRepo.get(db, topic_id)
-            if not topic:
-                raise ValueError(f"Topic not found: {topic_id}")
+    def finish(i: int, r: DraftResult) -> None:
+        results[i] = r
+        if on_result:
+            on_result(i, r)
 
-            draft = generate_draft(db, llm, topic)
-            draft = apply_quality_gate(db, draft, review_threshold=30)
-            draft = export_draft_html(db, draft)
+    pipeline = stages()
+    workers = stage_workers(concurrency, len(topic_ids))
+    names = [s.name for s in pipeline] + [STATUS_STAGE]
+    queues: list[Queue] = [Queue(maxsize=max(1, settings.pipeline_queue_size)) for _ in names]
+    done: SimpleQueue = SimpleQueue()
+    abort = threading.Event()
+    ctx = StageContext(llm=llm, cache=cache)
+    batch = max(1, settings.pipeline_commit_batch) if settings.pipeline_unit_of_work else 1
 
-            # topic 처리 완료 표시(리스크 높아도 “초안 생성 완료”는 DONE)
-            TopicRepo.update_status(db, topic_id, "DONE")
+    owner = default_owner()
+    leases = LeaseKeeper(owner, settings.worker_lease_s)
+    owned: dict[int, tuple[str, Future]] = {}
+    joined: list[tuple[int, Future]] = []
 
-            results.append(
-                DraftResult(
-                    topic_id=topic_id,
-                    draft_id=draft.id,
-                    status=draft.status,         # EXPORTED 또는 NEEDS_REVIEW
-                    risk_score=draft.risk_score,
-                    summary=draft.summary,
-                    export_html_ref=draft.export_html_ref,
-                )
-            )
+    def committed(item: StageItem, r: DraftResult) -> None:
+        # status stage 스레드: commit 직후 같은 topic을 기다리는 다른 요청에 바로 넘긴다
+        topic_id, fut = owned.pop(item.index)
+        leases.discard(topic_id)
+        inflight_topics.release(topic_id, fut, r)
+        done.put((item.index, r))
 
-        except Exception:
-            TopicRepo.update_status(db, topic_id, "ERROR")
-            results.append(
-                DraftResult(
-                    topic_id=topic_id,
-                    draft_id="",
-                    status="FAILED",
-                    risk_score=100,
-                    summary="",
-                    export_html_ref="",
-                )
-            )
+    threads: list[threading.Thread] = []
+    for k, stage in enumerate(pipeline):
+        n = workers[stage.name]
+        left = _Countdown(n)
+        for w in range(n):
+            args = (_stage_loop, stage, ctx, queues[k], queues[k + 1], left, workers[names[k + 1]], abort)
+            threads.append(threading.Thread(target=copy_context().run, args=args, name=f"stage-{stage.name}_{w}"))
+    for w in range(workers[STATUS_STAGE]):
+        args = (_status_loop, queues[-1], batch, committed, abort, owner)
+        threads.append(threading.Thread(target=copy_context().run, args=args, name=f"stage-{STATUS_STAGE}_{w}"))
+    leases.start()
+    for t in threads:
+        t.start()
+
+    pending = 0
+
+    def drain(timeout: float | None = None) -> None:
+        # 끝난 topic 결과를 호출 스레드에서 받아 on_result(timeout이면 하나 올 때까지 기다림)
+        nonlocal pending
+        while pending:
+            try:
+                i, r = done.get(timeout=timeout) if timeout else done.get_nowait()
+            except Empty:
+                return
+            pending -= 1
+            if not abort.is_set():
+                finish(i, r)
+            timeout = None
+
+    def put(item: object) -> None:
+        # queue가 차 있으면(backpressure) 기다리는 동안 끝난 결과를 처리
+        while True:
+            try:
+                queues[0].put(item, timeout=0.05)
+                return
+            except Full:
+                drain()
 
+    stopped = False
+    try:
+        for i, topic_id in enumerate(topic_ids):
+            fut, leader = inflight_topics.claim(topic_id)
+            if not leader:
+                joined.append((i, fut))
+                continue
+            owned[i] = (topic_id, fut)
+            reused: DraftResult | None = None
+            claimed = False
+            try:
+                topic = TopicRepo.snapshot(db, topic_id)
+                if topic is None:
+                    raise ValueError(f"Topic not found: {topic_id}")
+                if not force and topic.status == "DONE":
+                    # 읽기만(lease 없이): 완료 초안이 있으면 그대로
+                    reused = reuse_completed(db, topic_id, commit=True)
+                if reused is None:
+                    claimed = bool(TopicRepo.claim_topics(db, [topic_id], owner, settings.worker_lease_s))
+                    if not claimed:
+                        reused = busy_result(topic_id)
+                    elif not force:
+                        reused = reuse_completed(db, topic_id, commit=True, owner=owner)
+            except Exception:
+                db.rollback()
+                if claimed:
+                    TopicRepo.release_lease(db, topic_id, owner, "ERROR")
+                    db.commit()
+                reused = failed_result(topic_id)
+            if reused is not None:
+                del owned[i]
+                inflight_topics.release(topic_id, fut, reused)
+                finish(i, reused)
+                continue
+            leases.add(topic_id)
+            put(StageItem(index=i, topic=topic, enqueued_at=time.perf_counter()))
+            pending += 1
+            drain()
+        stopped = True
+        for _ in range(workers[names[0]]):
+            put(_STOP)
+        while pending:
+            drain(timeout=0.05)
+    except BaseException as e:
+        # 호출 스레드가 실패(on_result 예외 등): 남은 topic은 저장하지 않고 흘려보낸 뒤 스레드를 정리
+        abort.set()
+        if not stopped:
+            for _ in range(workers[names[0]]):
+                put(_STOP)
+        while pending:
+            drain(timeout=0.05)
+        for t in threads:
+            t.join()
+        leases.stop()
+        if owned:
+            # queue에 넣기 전에 멈춘 topic: 잡아 둔 lease를 ERROR로 푼다
+            try:
+                TopicRepo.release_leases(db, [topic_id for topic_id, _ in owned.values()], owner, "ERROR")
+                db.commit()
+            except Exception:
+                db.rollback()
+        for i, (topic_id, fut) in list(owned.items()):
+            inflight_topics.release(topic_id, fut, exc=e)
+        raise
+    for t in threads:
+        t.join()
+    leases.stop()
+
+    for i, fut in joined:
+        REUSED.inc(reason="inflight")
+        try:
+            r = fut.result().model_copy(update={"reused": True})
+        except Exception:
+            r = failed_result(topic_ids[i])
+        finish(i, r)
     return results
@@ -0,0 +1,137 @@
+"""
+run_selected의 stage 목록. stage는 StageItem(topic 1개) 하나를 받아 필드를 채우는 함수이고,
+등록 순서대로 bounded queue로 이어져 stage마다 정해진 수의 스레드에서 돈다(orchestrator.run_selected).
+
+stage 함수는 DB 세션을 쓰지 않는다. 저장(draft, exports 인덱스, topic 상태)은 마지막 status stage가 묶어서 한 번에 한다.
+새 stage(research, images 등)는 루프를 고치지 않고 등록만 하면 된다:
+
+    @register_stage("research", before="draft", workers=2)
+    def research(ctx: StageContext, item: StageItem) -> None:
+        item.extras["notes"] = ...
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from autodraft.db.models import Draft, ExportEntry, Topic
+from autodraft.integrations.llm import LLMClient
+from autodraft.integrations.llm.cache import CacheMode
+from autodraft.pipelines.steps.draft import write_draft
+from autodraft.pipelines.steps.export import attach_export, write_export_html
+from autodraft.pipelines.steps.quality_gate import grade_draft
+
+# 마지막 저장 stage 이름(등록 stage가 아니라 루프의 끝. 워커 수 설정 키로만 쓴다)
+STATUS_STAGE = "status"
+
+
+@dataclass
+class StageContext:
+    llm: LLMClient
+    cache: CacheMode = "use"
+    review_threshold: int = 30
+
+
+@dataclass(eq=False)
+class StageItem:
+    index: int  # run_selected topic_ids 기준 위치
+    topic: Topic  # 세션에 붙지 않은 사본(TopicRepo.snapshot)
+    draft: Draft | None = None
+    export: ExportEntry | None = None
+    error: Exception | None = None  # 앞 stage에서 실패하면 이후 stage는 건너뛰고 status stage가 ERROR로 기록
+    extras: dict[str, Any] = field(default_factory=dict)  # 추가 stage끼리 주고받는 값
+    enqueued_at: float = 0.0
+
+
+StageFn = Callable[[StageContext, StageItem], None]
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    fn: StageFn
+    workers: int = 1
+    span: str = ""
+
+
+_stages: list[Stage] = []
+_lock = threading.Lock()
+
+
+def register_stage(
+    name: str,
+    *,
+    workers: int = 1,
+    span: str | None = None,
+    before: str | None = None,
+    after: str | None = None,
+) -> Callable[[StageFn], StageFn]:
+    """
+    stage 등록(데코레이터). before/after로 위치 지정(없으면 끝), 같은 이름이면 그 자리에서 교체.
+    workers는 기본 스레드 수(PIPELINE_STAGE_WORKERS로 덮어씀), span은 trace/메트릭 이름(기본 name).
+    """
+
+    def deco(fn: StageFn) -> StageFn:
+        stage = Stage(name=name, fn=fn, workers=max(1, workers), span=span or name)
+        with _lock:
+            names = [s.name for s in _stages]
+            if name in names:
+                _stages[names.index(name)] = stage
+            elif before is not None:
+                _stages.insert(names.index(before), stage)
+            elif after is not None:
+                _stages.insert(names.index(after) + 1, stage)
+            else:
+                _stages.append(stage)
+        return fn
+
+    return deco
+
+
+def unregister_stage(name: str) -> None:
+    with _lock:
+        _stages[:] = [s for s in _stages if s.name != name]
+
+
+def stages() -> list[Stage]:
+    with _lock:
+        return list(_stages)
+
+
+def parse_stage_workers(spec: str) -> dict[str, int]:
+    """
+    "quality_gate=1,export=2,status=1" → {"quality_gate": 1, ...}. 형식이 틀리면 ValueError.
+    """
+    out: dict[str, int] = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, sep, value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid stage workers entry: {part!r}")
+        out[name.strip()] = max(1, int(value))
+    return out
+
+
+# ---------- 기본 stage ----------
+# draft 워커 수는 run_selected의 concurrency(없으면 PIPELINE_CONCURRENCY)
+
+
+@register_stage("draft", span="generate_draft")
+def draft_stage(ctx: StageContext, item: StageItem) -> None:
+    # LLM 대기(I/O). 워커가 많을수록 뒤 stage의 CPU 작업과 겹친다
+    item.draft = write_draft(ctx.llm, item.topic, cache=ctx.cache)
+
+
+@register_stage("quality_gate", span="apply_quality_gate")
+def quality_gate_stage(ctx: StageContext, item: StageItem) -> None:
+    grade_draft(item.draft, ctx.review_threshold)
+
+
+@register_stage("export", workers=2, span="export_draft_html")
+def export_stage(ctx: StageContext, item: StageItem) -> None:
+    out = write_export_html(item.draft.title, item.draft.content_md)
+    item.export = attach_export(item.draft, out)
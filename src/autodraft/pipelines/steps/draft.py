@@ -8,31 +8,44 @@ from sqlalchemy.orm import Session
 from autodraft.db.models import Draft, Topic
 from autodraft.db.repos import DraftRepo
 from autodraft.integrations.llm import LLMClient
+from autodraft.integrations.llm.cache import CacheMode
 
 
-def generate_draft(db: Session, llm: LLMClient, topic: Topic) -> Draft:
+def new_draft(topic: Topic, content_md: str, summary: str, draft_id: str | None = None) -> Draft:
+    return Draft(
+        id=draft_id or f"d_{uuid.uuid4().hex[:10]}",
+        topic_id=topic.id,
+        title=topic.title,
+        content_md=content_md,
+        summary=summary,
+        risk_score=0,
+        status="DRAFTED",
+        export_html_ref="",
+        last_error=None,
+        updated_at=datetime.utcnow(),
+    )
+
+
+def write_draft(llm: LLMClient, topic: Topic, cache: CacheMode = "use") -> Draft:
     """
-    topic 기반으로 초안 생성(Draft row 생성).
+    LLM으로 본문을 받아 Draft 객체만 만든다(세션/DB 없음, staged pipeline의 draft stage).
     """
-    draft_id = f"d_{uuid.uuid4().hex[:10]}"
     out = llm.generate_draft(
         title=topic.title,
         angle=topic.angle,
         pillar=topic.pillar,
         audience=topic.audience,
+        cache=cache,
     )
+    return new_draft(topic, out.content_md, out.summary)
 
-    now = datetime.utcnow()
-    draft = Draft(
-        id=draft_id,
-        topic_id=topic.id,
-        title=topic.title,
-        content_md=out.content_md,
-        summary=out.summary,
-        risk_score=0,
-        status="DRAFTED",
-        export_html_ref="",
-        last_error=None,
-        updated_at=now,
-    )
-    return DraftRepo.create(db, draft)
+
+def generate_draft(
+    db: Session, llm: LLMClient, topic: Topic, cache: CacheMode = "use", commit: bool = True
+) -> Draft:
+    """
+    topic 기반으로 초안 생성(Draft row 생성).
+    commit=False면 세션에만 올리고 commit은 호출자가 한다.
+    """
+    draft = write_draft(llm, topic, cache=cache)
+    return DraftRepo.create(db, draft) if commit else DraftRepo.add(db, draft)
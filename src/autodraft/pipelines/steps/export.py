@@ -1,95 +1,220 @@
 from __future__ import annotations
 
-import re
+import gzip
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 
 from sqlalchemy.orm import Session
 
-from autodraft.db.models import Draft
-from autodraft.db.repos import DraftRepo
+from autodraft.db.models import Draft, ExportEntry
+from autodraft.db.repos import DraftRepo, ExportRepo
+from autodraft.pipelines.steps.markdown import MarkdownRenderer, escape_html, md_to_html
 from autodraft.settings import settings
 
-
-def escape_html(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+try:  # brotli는 선택 의존성(없으면 .gz만 만든다)
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
 
 
 def md_to_basic_html(md: str) -> str:
     """
-    데모용 초간단 MD→HTML 변환기.
-    (운영에서는 markdown 라이브러리 도입 추천)
+    MD→HTML 문자열(단일 패스 렌더러 사용). 파일로 쓸 때는 export_draft_html이 스트리밍한다.
     """
-    lines = md.splitlines()
-    html_lines: list[str] = []
-    for line in lines:
-        if line.startswith("# "):
-            html_lines.append(f"<h1>{escape_html(line[2:].strip())}</h1>")
-        elif line.startswith("## "):
-            html_lines.append(f"<h2>{escape_html(line[3:].strip())}</h2>")
-        elif line.startswith("> "):
-            html_lines.append(f"<blockquote>{escape_html(line[2:].strip())}</blockquote>")
-        elif line.startswith("- "):
-            html_lines.append(f"<li>{escape_html(line[2:].strip())}</li>")
-        elif re.match(r"^\d+\.\s+", line):
-            html_lines.append(f"<p>{escape_html(line.strip())}</p>")
-        elif line.strip() == "":
-            html_lines.append("<br/>")
-        else:
-            html_lines.append(f"<p>{escape_html(line.strip())}</p>")
-    return "\n".join(_wrap_list_items(html_lines))
-
-
-def _wrap_list_items(html_lines: list[str]) -> list[str]:
-    out: list[str] = []
-    in_ul = False
-    for l in html_lines:
-        if l.startswith("<li>") and not in_ul:
-            out.append("<ul>")
-            in_ul = True
-            out.append(l)
-        elif l.startswith("<li>") and in_ul:
-            out.append(l)
-        else:
-            if in_ul:
-                out.append("</ul>")
-                in_ul = False
-            out.append(l)
-    if in_ul:
-        out.append("</ul>")
-    return out
+    return md_to_html(md).rstrip("\n")
 
 
-def export_draft_html(db: Session, draft: Draft) -> Draft:
-    """
-    draft.content_md를 HTML 파일로 저장하고 export_html_ref에 경로를 기록.
-    """
-    export_dir = Path(settings.export_dir)
-    export_dir.mkdir(parents=True, exist_ok=True)
-
-    body = md_to_basic_html(draft.content_md)
-    path = export_dir / f"{draft.id}.html"
-    html = f"""<!doctype html>
+def _html_head(title: str) -> str:
+    return f"""<!doctype html>
 <html lang="ko">
 <head>
   <meta charset="utf-8"/>
   <meta name="viewport" content="width=device-width, initial-scale=1"/>
-  <title>{escape_html(draft.title)}</title>
+  <title>{escape_html(title)}</title>
 </head>
 <body>
-{body}
-</body>
+"""
+
+
+_HTML_TAIL = """</body>
 </html>
 """
-    path.write_text(html, encoding="utf-8")
 
-    draft.export_html_ref = f"/exports/{draft.id}.html"
 
-    draft.updated_at = datetime.utcnow()
-    return DraftRepo.save(db, draft)
+@dataclass(frozen=True)
+class ExportFile:
+    name: str        # <sha256 앞 32자>.html
+    path: Path
+    size: int        # 원본 html 바이트 수
+    sha256: str
+    created: bool    # False면 같은 내용 파일이 이미 있어서 재사용
+
+
+class _HashingWriter:
+    """
+    텍스트를 utf-8로 파일에 쓰면서 sha256/크기를 같이 계산(렌더러 출력 대상).
+    """
+
+    def __init__(self, f: BinaryIO):
+        self.f = f
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, s: str) -> int:
+        b = s.encode("utf-8")
+        self.hash.update(b)
+        self.f.write(b)
+        self.size += len(b)
+        return len(s)
+
+
+def _current_umask() -> int:
+    # umask는 바꿔서 읽는 방법뿐이라 import 시 한 번만(스레드가 돌기 전)
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# mkstemp 임시 파일은 0600이라 rename 후에도 그대로 남는다 → 보통 open()으로 만든 파일과 같은 권한으로 맞춘다
+# (웹 서버/동기화 프로세스가 다른 사용자로 읽을 수 있게)
+_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _mkstemp(directory: Path) -> tuple[int, str]:
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        os.fchmod(fd, _FILE_MODE)
+    except BaseException:
+        os.close(fd)
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return fd, tmp
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    fd, tmp = _mkstemp(path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _precompressed_siblings(path: Path) -> list[Path]:
+    names = [path.name + ".gz"] + ([path.name + ".br"] if brotli is not None else [])
+    return [path.with_name(n) for n in names]
+
+
+def _write_precompressed(path: Path, data: bytes) -> None:
+    # 없는 압축본만 만든다. 같은 내용이면 같은 바이트가 나오도록 gzip mtime 고정
+    for sibling in _precompressed_siblings(path):
+        if sibling.exists():
+            continue
+        if sibling.suffix == ".gz":
+            _atomic_write_bytes(sibling, gzip.compress(data, compresslevel=9, mtime=0))
+        else:
+            _atomic_write_bytes(sibling, brotli.compress(data, quality=11))
+
+
+class ExportWriter:
+    """
+    export HTML을 임시 파일에 점진적으로 렌더링하고, finish()에서 내용 해시 이름으로 rename.
+    - feed()는 줄 중간에서 잘린 MD 청크도 받는다(LLM 스트림을 그대로 흘려보냄)
+    - 같은 내용이 이미 있으면 새로 쓰지 않는다(중복 제거)
+    - .gz(+ brotli 있으면 .br) 압축본을 원본보다 먼저 만들어 둔다
+    - 실패/중단 시 abort()로 임시 파일 정리
+    """
+
+    def __init__(self, title: str, export_dir: Path | None = None):
+        self.export_dir = export_dir or Path(settings.export_dir)
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = _mkstemp(self.export_dir)
+        self._tmp = Path(tmp_name)
+        self._f = os.fdopen(fd, "wb")
+        self._w = _HashingWriter(self._f)
+        self._w.write(_html_head(title))
+        # 본문은 중간 문자열 없이 파일로 바로 렌더링
+        self._renderer = MarkdownRenderer(self._w)
+
+    def feed(self, chunk: str) -> None:
+        self._renderer.feed(chunk)
+
+    def flush(self) -> None:
+        self._f.flush()
+
+    def finish(self) -> ExportFile:
+        try:
+            self._renderer.close()
+            self._w.write(_HTML_TAIL)
+            self._f.close()
+
+            digest = self._w.hash.hexdigest()
+            path = self.export_dir / f"{digest[:32]}.html"
+            if path.exists():
+                # export_precompress/brotli가 나중에 켜졌거나 압축본이 지워졌으면 빠진 압축본을 채운다
+                # (임시 파일은 해시가 같으니 기존 파일과 같은 바이트)
+                if settings.export_precompress and not all(p.exists() for p in _precompressed_siblings(path)):
+                    _write_precompressed(path, self._tmp.read_bytes())
+                self._tmp.unlink()
+                return ExportFile(name=path.name, path=path, size=self._w.size, sha256=digest, created=False)
+
+            if settings.export_precompress:
+                _write_precompressed(path, self._tmp.read_bytes())
+            os.replace(self._tmp, path)
+            return ExportFile(name=path.name, path=path, size=self._w.size, sha256=digest, created=True)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self) -> None:
+        self._f.close()
+        self._tmp.unlink(missing_ok=True)
+
+
+def write_export_html(title: str, content_md: str, export_dir: Path | None = None) -> ExportFile:
+    """
+    MD → HTML을 임시 파일로 스트리밍 렌더링한 뒤 내용 해시 이름으로 rename(원자적). ExportWriter 참고.
+    """
+    w = ExportWriter(title, export_dir)
+    try:
+        w.feed(content_md)
+    except BaseException:
+        w.abort()
+        raise
+    return w.finish()
+
+
+def attach_export(draft: Draft, out: ExportFile) -> ExportEntry:
+    """
+    draft.export_html_ref를 out 파일로 바꾸고 exports 인덱스 행을 만든다(저장은 호출자가, 세션/DB 없음).
+    """
+    now = datetime.utcnow()
+    draft.export_html_ref = f"/exports/{out.name}"
+    draft.updated_at = now
+    return ExportEntry(
+        draft_id=draft.id,
+        path=draft.export_html_ref,
+        size_bytes=out.size,
+        content_hash=out.sha256,
+        created_at=now,
+    )
+
+
+def export_draft_html(db: Session, draft: Draft, commit: bool = True, out: ExportFile | None = None) -> Draft:
+    """
+    draft.content_md를 HTML 파일로 저장하고 export_html_ref에 경로를 기록.
+    파일명은 내용 해시(같은 내용이면 같은 파일을 공유). exports 인덱스 행도 같은 트랜잭션에 기록.
+    out: 스트리밍 중 ExportWriter로 이미 써둔 파일(있으면 다시 렌더링하지 않음)
+    commit=False면 세션에만 반영(unit-of-work).
+    """
+    if out is None:
+        out = write_export_html(draft.title, draft.content_md)
+    ExportRepo.upsert(db, attach_export(draft, out))
+    return DraftRepo.save(db, draft) if commit else DraftRepo.add(db, draft)
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import io
+import re
+from typing import Protocol
+
+
+class _Writer(Protocol):
+    def write(self, s: str) -> object: ...
+
+
+def escape_html(s: str) -> str:
+    return (
+        s.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#39;")
+    )
+
+
+# 인라인 토큰(한 번의 finditer로 처리): `code` / **bold** / *italic* / _italic_ / [text](url)
+_INLINE = re.compile(
+    r"(?P<code>`+)(?P<code_body>.+?)(?P=code)"
+    r"|\*\*(?P<bold>(?!\s).+?(?<!\s))\*\*"
+    r"|\*(?P<em>(?![\s*]).+?(?<!\s))\*"
+    r"|(?<!\w)_(?P<em_u>(?![\s_]).+?(?<!\s))_(?!\w)"
+    r"|\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)\s]+)\)"
+)
+# 인라인 마커가 시작될 수 있는 문자. 여기서만 _INLINE.match를 시도한다
+# (alternation 전체를 모든 위치에서 돌리는 것보다 훨씬 빠름)
+_INLINE_START = re.compile(r"[`*_\[]")
+_ESCAPE_CHARS = frozenset("&<>\"'")
+_SAFE_URL = re.compile(r"^(https?://|mailto:|/|#|\./)", re.IGNORECASE)
+_OL_ITEM = re.compile(r"^\d+[.)]\s+")
+
+
+def _escape_fast(s: str) -> str:
+    return escape_html(s) if not _ESCAPE_CHARS.isdisjoint(s) else s
+
+
+def render_inline(text: str) -> str:
+    start = _INLINE_START.search(text)
+    if start is None:
+        return _escape_fast(text)
+
+    out: list[str] = []
+    pos = 0
+    while start is not None:
+        m = _INLINE.match(text, start.start())
+        if m is None:
+            start = _INLINE_START.search(text, start.start() + 1)
+            continue
+        out.append(_escape_fast(text[pos : m.start()]))
+        pos = m.end()
+        if m.group("code"):
+            out.append(f"<code>{escape_html(m.group('code_body'))}</code>")
+        elif m.group("bold") is not None:
+            out.append(f"<strong>{render_inline(m.group('bold'))}</strong>")
+        elif m.group("em") is not None:
+            out.append(f"<em>{render_inline(m.group('em'))}</em>")
+        elif m.group("em_u") is not None:
+            out.append(f"<em>{render_inline(m.group('em_u'))}</em>")
+        else:
+            label = render_inline(m.group("link_text"))
+            url = m.group("link_url")
+            if _SAFE_URL.match(url):
+                out.append(f'<a href="{escape_html(url)}">{label}</a>')
+            else:
+                out.append(label)  # javascript: 등은 링크로 만들지 않음
+        start = _INLINE_START.search(text, pos)
+    out.append(_escape_fast(text[pos:]))
+    return "".join(out)
+
+
+class MarkdownRenderer:
+    """
+    LLM 프롬프트가 요구하는 범위의 MD → HTML 단일 패스 렌더러.
+    지원: H1~H3, ul/ol, 인용문(> ), **굵게**, *기울임*, [링크](url), `코드`, ``` 코드블록
+    - 줄 단위로 바로 out.write() 하므로 파일에 직접 스트리밍 가능
+    - feed()는 줄 중간에서 잘린 청크도 받는다(LLM 스트림 등)
+    """
+
+    def __init__(self, out: _Writer):
+        self.out = out
+        self._block: str | None = None  # "ul" | "ol" | "blockquote" | "pre"
+        self._quote_lines = 0
+        self._partial = ""
+
+    # ---------- public ----------
+    def feed(self, chunk: str) -> None:
+        data = self._partial + chunk
+        lines = data.split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self.feed_line(line)
+
+    def feed_line(self, line: str) -> None:
+        line = line.rstrip("\r")
+        w = self.out.write
+
+        if self._block == "pre":
+            if line.lstrip().startswith("```"):
+                w("</code></pre>\n")
+                self._block = None
+            else:
+                w(escape_html(line) + "\n")
+            return
+
+        s = line.strip()
+        if not s:
+            if self._block:
+                self._close()
+            return
+
+        # 첫 글자로 분기(startswith 연쇄 비교를 줄 전체에 돌리지 않음)
+        c = s[0]
+        if c == "#":
+            level = len(s) - len(s.lstrip("#"))
+            if level <= 3 and s[level : level + 1] == " ":
+                if self._block:
+                    self._close()
+                w(f"<h{level}>{render_inline(s[level + 1:].strip())}</h{level}>\n")
+                return
+        elif c == ">":
+            if self._block != "blockquote":
+                self._open("blockquote")
+            if self._quote_lines:
+                w("<br/>\n")
+            w(render_inline(s[1:].strip()))
+            self._quote_lines += 1
+            return
+        elif c in "-*+" and s[1:2] == " ":
+            if self._block != "ul":
+                self._open("ul")
+            w(f"<li>{render_inline(s[2:].strip())}</li>\n")
+            return
+        elif c.isdigit():
+            m = _OL_ITEM.match(s)
+            if m:
+                if self._block != "ol":
+                    self._open("ol")
+                w(f"<li>{render_inline(s[m.end():].strip())}</li>\n")
+                return
+        elif c == "`" and s.startswith("```"):
+            if self._block:
+                self._close()
+            w("<pre><code>")
+            self._block = "pre"
+            return
+
+        if self._block:
+            self._close()
+        w(f"<p>{render_inline(s)}</p>\n")
+
+    def close(self) -> None:
+        if self._partial:
+            self.feed_line(self._partial)
+            self._partial = ""
+        if self._block == "pre":
+            self.out.write("</code></pre>\n")
+            self._block = None
+        self._close()
+
+    # ---------- internal ----------
+    def _open(self, block: str) -> None:
+        if self._block == block:
+            return
+        self._close()
+        self.out.write(f"<{block}>" + ("" if block == "blockquote" else "\n"))
+        self._block = block
+        self._quote_lines = 0
+
+    def _close(self) -> None:
+        if self._block in ("ul", "ol", "blockquote"):
+            self.out.write(("\n" if self._block == "blockquote" else "") + f"</{self._block}>\n")
+            self._block = None
+
+
+def render_markdown(md: str, out: _Writer) -> None:
+    r = MarkdownRenderer(out)
+    r.feed(md)
+    r.close()
+
+
+def md_to_html(md: str) -> str:
+    buf = io.StringIO()
+    render_markdown(md, buf)
+    return buf.getvalue()
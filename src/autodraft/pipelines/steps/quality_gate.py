@@ -1,40 +1,62 @@
 from __future__ import annotations
 
-import re
 from datetime import datetime
 
 from sqlalchemy.orm import Session
 
 from autodraft.db.models import Draft
 from autodraft.db.repos import DraftRepo
+from autodraft.pipelines.steps.risk_rules import RiskReport, rule_set
 
-# 데모용 룰 (필요하면 계속 추가)
-FORBIDDEN_PATTERNS: list[tuple[re.Pattern, int]] = [
-    (re.compile(r"\b100%\b|무조건|확실"), 25),            # 과장
-    (re.compile(r"합격\s*보장|단기간에"), 20),             # 과장/오해 소지
-    (re.compile(r"010-\d{4}-\d{4}|전화번호|주민등록"), 40),  # 개인정보
-]
+# 룰은 settings.risk_rules_path(JSON, version 포함)에서 읽는다. 파일을 고치면 자동 반영.
+
+
+def scan_risk(text: str) -> RiskReport:
+    """
+    점수 + 매칭된 룰 id/위치(span).
+    """
+    return rule_set.get().report(text)
+
+
+def score_many(texts: list[str]) -> list[RiskReport]:
+    """
+    여러 본문을 같은 룰 버전으로 일괄 채점(drafts 테이블 재채점용).
+    """
+    return rule_set.get().score_many(texts)
 
 
 def calc_risk_score(text: str) -> int:
-    score = 0
-    for pattern, weight in FORBIDDEN_PATTERNS:
-        if pattern.search(text):
-            score += weight
-    # 너무 짧으면 품질/문맥 불확실 → 약간 가산
-    if len(text) < 600:
-        score += 10
-    return min(100, score)
+    return scan_risk(text).score
+
 
+def review_status(risk: int, review_threshold: int = 30) -> str:
+    return "NEEDS_REVIEW" if risk >= review_threshold else "EXPORTED"
 
-def apply_quality_gate(db: Session, draft: Draft, review_threshold: int = 30) -> Draft:
+
+def grade_draft(draft: Draft, review_threshold: int = 30, report: RiskReport | None = None) -> Draft:
+    """
+    risk_score/status만 채운다(세션/DB 없음, staged pipeline의 quality_gate stage).
+    """
+    risk = report.score if report is not None else calc_risk_score(draft.content_md)
+    draft.risk_score = risk
+    draft.status = review_status(risk, review_threshold)
+    draft.updated_at = datetime.utcnow()
+    return draft
+
+
+def apply_quality_gate(
+    db: Session,
+    draft: Draft,
+    review_threshold: int = 30,
+    commit: bool = True,
+    report: RiskReport | None = None,
+) -> Draft:
     """
     risk_score 계산 후 status 결정.
     - risk < threshold: EXPORTED(다음 단계에서 export 수행)
     - risk >= threshold: NEEDS_REVIEW(그래도 export는 만들어두는게 협업에 유리)
+    report: 스트리밍 중 IncrementalRiskScanner로 이미 낸 결과(있으면 다시 스캔하지 않음)
+    commit=False면 세션에만 반영(unit-of-work).
     """
-    risk = calc_risk_score(draft.content_md)
-    draft.risk_score = risk
-    draft.status = "NEEDS_REVIEW" if risk >= review_threshold else "EXPORTED"
-    draft.updated_at = datetime.utcnow()
-    return DraftRepo.save(db, draft)
+    grade_draft(draft, review_threshold, report)
+    return DraftRepo.save(db, draft) if commit else DraftRepo.add(db, draft)
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from autodraft.settings import settings
+
+try:  # 룰 정규식의 첫 글자/앵커 분석용(3.11부터 re 내부 모듈)
+    from re import _constants as _sc, _parser as _sre_parse
+except ImportError:  # pragma: no cover
+    import sre_constants as _sc
+    import sre_parse as _sre_parse
+
+
+@dataclass(frozen=True)
+class RiskRule:
+    id: str
+    weight: int
+    pattern: str  # 정규식(phrases만 있으면 비움)
+    phrases: tuple[str, ...] = ()  # 리터럴 금칙어 목록(이스케이프해서 합침)
+
+
+@dataclass(frozen=True)
+class RiskHit:
+    rule_id: str
+    start: int
+    end: int
+    text: str
+
+
+@dataclass
+class RiskReport:
+    score: int
+    hits: list[RiskHit] = field(default_factory=list)
+
+    @property
+    def rule_ids(self) -> list[str]:
+        return sorted({h.rule_id for h in self.hits})
+
+
+class RiskMatcher:
+    """
+    룰 전체를 정규식 1개로 합쳐 본문을 한 번만 훑는다. 룰마다 폭 0 lookahead 그룹
+    (?=(?P<_r0>...))?(?=(?P<_r1>...))?...이라 한 위치에서 여러 룰(겹치는 "합격 보장"과 "보장")이 같이 잡히고,
+    룰 패턴에서 뽑은 첫 글자 집합 [...]을 맨 앞에 둬서 어떤 룰도 시작할 수 없는 위치는 정규식 엔진 안에서 바로 건너뛴다.
+    같은 룰의 hit는 finditer처럼 겹치지 않게 고르므로 점수('룰이 한 번이라도 걸렸는지')는
+    룰마다 re.search 하던 이전 방식과 같다. hit는 시작 위치 순(같은 위치면 룰 순서).
+    """
+
+    def __init__(self, rules: list[RiskRule], version: int = 0, short_min_len: int = 600, short_weight: int = 10):
+        self.rules = rules
+        self.version = version
+        self.short_min_len = short_min_len
+        self.short_weight = short_weight
+
+        self._compiled: list[tuple[int, RiskRule, re.Pattern]] = []
+        for i, rule in enumerate(rules):
+            alts = []
+            if rule.pattern:
+                alts.append(rule.pattern)
+            if rule.phrases:
+                alts.extend(re.escape(p) for p in sorted(set(rule.phrases), key=len, reverse=True))
+            if alts:
+                self._compiled.append((i, rule, re.compile("|".join(alts))))
+
+        firsts: set[str] | None = set()
+        self._batchable = True
+        for _, _, regex in self._compiled:
+            info = _pattern_info(regex)
+            self._batchable &= info.batchable
+            firsts = firsts | info.first_chars if firsts is not None and info.first_chars is not None else None
+        groups = "".join(f"(?=(?P<_r{k}>{regex.pattern}))?" for k, (_, _, regex) in enumerate(self._compiled))
+        # 최소 한 룰은 걸리는 위치에서만 매칭(안 그러면 첫 글자만 맞는 위치마다 빈 매칭이 나온다)
+        any_rule = "(?=" + "|".join(f"(?:{regex.pattern})" for _, _, regex in self._compiled) + ")"
+        if firsts:
+            # 첫 글자 집합을 맨 앞에 두면 엔진이 후보 위치를 바로 찾는다. 그 글자를 먹고
+            # 폭 1 lookbehind 안에서 그 위치의 룰 그룹을 본다(다음 검색은 다음 글자부터라 폭 0 매칭과 같음)
+            charset = "[" + "".join(re.escape(c) for c in sorted(firsts)) + "]"
+            combined = f"{charset}(?<={any_rule}{groups}(?s:.))"
+        else:
+            combined = any_rule + groups
+        self._combined = re.compile(combined) if self._compiled else None
+        self._groups = [self._combined.groupindex[f"_r{k}"] for k in range(len(self._compiled))] if self._combined else []
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "RiskMatcher":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        rules = [
+            RiskRule(
+                id=str(r["id"]),
+                weight=int(r["weight"]),
+                pattern=str(r.get("pattern", "")),
+                phrases=tuple(r.get("phrases", ())),
+            )
+            for r in data["rules"]
+        ]
+        short = data.get("short_text", {})
+        return cls(
+            rules,
+            version=int(data.get("version", 0)),
+            short_min_len=int(short.get("min_len", 600)),
+            short_weight=int(short.get("weight", 10)),
+        )
+
+    def scan(self, text: str, pos: int = 0, endpos: int | None = None) -> list[RiskHit]:
+        """
+        text[pos:endpos]의 hit(위치는 text 기준). endpos 뒤는 없는 것으로 본다(re의 endpos).
+        """
+        if self._combined is None:
+            return []
+        endpos = len(text) if endpos is None else endpos
+        hits: list[RiskHit] = []
+        ends = [pos] * len(self._compiled)  # 룰별로 마지막 hit 끝(같은 룰은 겹치지 않게)
+        for m in self._combined.finditer(text, pos, endpos):
+            start = m.start()
+            for k, gi in enumerate(self._groups):
+                end = m.end(gi)
+                if end < 0 or start < ends[k]:
+                    continue
+                ends[k] = end
+                hits.append(RiskHit(rule_id=self._compiled[k][1].id, start=start, end=end, text=text[start:end]))
+        return hits
+
+    def score(self, hits: list[RiskHit], text_len: int) -> int:
+        hit_ids = {h.rule_id for h in hits}
+        score = sum(r.weight for r in self.rules if r.id in hit_ids)
+        # 너무 짧으면 품질/문맥 불확실 → 약간 가산
+        if text_len < self.short_min_len:
+            score += self.short_weight
+        return min(100, score)
+
+    def report(self, text: str) -> RiskReport:
+        hits = self.scan(text)
+        return RiskReport(score=self.score(hits, len(text)), hits=hits)
+
+    def score_many(self, texts: list[str]) -> list[RiskReport]:
+        """
+        여러 본문을 "\n"으로 이어 붙여 결합 정규식을 한 번만 돌린다. 본문 경계를 넘는 매칭은 그 본문 안에서
+        다시 맞춰 보고(endpos), 본문 밖을 볼 수 있는 룰(^, $, lookaround)이 있으면 본문마다 report().
+        """
+        if not self._batchable or len(texts) < 2:
+            return [self.report(t) for t in texts]
+        joined = "\n".join(texts)
+        bounds: list[int] = []  # 본문별 끝 위치(joined 기준)
+        at = 0
+        for t in texts:
+            at += len(t)
+            bounds.append(at)
+            at += 1
+        per_doc: list[list[RiskHit]] = [[] for _ in texts]
+        doc = 0
+        doc_start = 0
+        ends = [0] * len(self._compiled)
+        for m in self._combined.finditer(joined):
+            start = m.start()
+            while start > bounds[doc]:
+                doc += 1
+                doc_start = bounds[doc - 1] + 1
+                ends = [doc_start] * len(self._compiled)
+            if start == bounds[doc]:
+                continue  # 구분자 위치
+            for k, gi in enumerate(self._groups):
+                end = m.end(gi)
+                if end < 0 or start < ends[k]:
+                    continue
+                if end > bounds[doc]:
+                    inner = self._compiled[k][2].match(joined, start, bounds[doc])
+                    if inner is None:
+                        continue
+                    end = inner.end()
+                ends[k] = end
+                per_doc[doc].append(
+                    RiskHit(rule_id=self._compiled[k][1].id, start=start - doc_start, end=end - doc_start, text=joined[start:end])
+                )
+        return [RiskReport(score=self.score(hits, len(t)), hits=hits) for t, hits in zip(texts, per_doc)]
+
+    def incremental(self) -> "IncrementalRiskScanner":
+        return IncrementalRiskScanner(self)
+
+
+class IncrementalRiskScanner:
+    """
+    스트리밍 본문용 스캐너: 청크가 올 때마다 새로 들어온 부분만(+ overlap만큼 뒤로) 다시 훑는다.
+    - 끝에서 overlap 이내에 걸친 매칭은 다음 청크로 더 길어질 수 있어 확정을 미룬다
+    - 청크 단위 hit(feed, self.hits)는 실시간 표시용: overlap보다 긴 매칭(합격\s*보장 사이 공백이 긴 경우 등)은 놓칠 수 있다
+    - finish()는 전체 본문을 report()로 다시 훑은 결과라 게이트 점수는 일괄 채점과 항상 같다
+    """
+
+    def __init__(self, matcher: RiskMatcher, overlap: int = 64):
+        self.matcher = matcher
+        self.overlap = overlap
+        self.hits: list[RiskHit] = []
+        self._parts: list[str] = []
+        self._tail = ""          # 아직 확정 못한 뒷부분(+ overlap 문맥)
+        self._tail_offset = 0    # _tail[0]의 전체 본문 기준 위치
+        self._confirmed = 0      # 이 위치 앞에서 시작하는 매칭은 이미 확정
+
+    @property
+    def score(self) -> int:
+        """
+        지금까지 확정된 hit 기준 점수(짧은 글 가산은 finish에서만).
+        """
+        return self.matcher.score(self.hits, self.matcher.short_min_len)
+
+    def feed(self, chunk: str) -> list[RiskHit]:
+        """
+        청크 추가 후 새로 확정된 hit 목록.
+        """
+        self._parts.append(chunk)
+        self._tail += chunk
+        return self._scan(final=False)
+
+    def finish(self) -> RiskReport:
+        self._scan(final=True)
+        return self.matcher.report(self.text)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def _scan(self, final: bool) -> list[RiskHit]:
+        # limit(꼬리 기준) 뒤에서 끝나는 매칭은 아직 자랄 수 있으므로 보류
+        limit = len(self._tail) if final else len(self._tail) - self.overlap
+        if limit <= 0:
+            return []
+        confirmed = self._tail_offset + limit
+        new: list[RiskHit] = []
+        for h in self.matcher.scan(self._tail):
+            start = h.start + self._tail_offset
+            if start < self._confirmed:
+                continue  # overlap 문맥 구간(이미 처리함)
+            if h.end > limit:
+                # 이 위치부터는 다음 청크에서 다시(같은 위치에서 먼저 확정한 다른 룰 hit도 같이 미룬다)
+                confirmed = start
+                new = [x for x in new if x.start < start]
+                break
+            new.append(RiskHit(rule_id=h.rule_id, start=start, end=h.end + self._tail_offset, text=h.text))
+        self._confirmed = max(self._confirmed, confirmed)
+        # \b 같은 앞 문맥 판정용으로 overlap만큼만 남기고 버린다
+        drop = self._confirmed - self.overlap - self._tail_offset
+        if drop > 0:
+            self._tail = self._tail[drop:]
+            self._tail_offset += drop
+        self.hits.extend(new)
+        return new
+
+
+@dataclass(frozen=True)
+class _PatternInfo:
+    first_chars: set[str] | None  # 매칭이 시작할 수 있는 글자(모르면 None)
+    batchable: bool  # 매칭 범위 밖을 보지 않음(^, $, lookaround 없음) → 이어 붙인 본문에서 그대로 돌려도 됨
+
+
+_REPEATS = tuple(getattr(_sc, n) for n in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT") if hasattr(_sc, n))
+_EDGE_ATS = (_sc.AT_BEGINNING, _sc.AT_BEGINNING_STRING, _sc.AT_END, _sc.AT_END_STRING)
+
+
+def _walk(items):
+    for op, av in items:
+        yield op, av
+        if op is _sc.BRANCH:
+            for branch in av[1]:
+                yield from _walk(branch)
+        elif op is _sc.SUBPATTERN:
+            yield from _walk(av[-1])
+        elif op in _REPEATS:
+            yield from _walk(av[2])
+        elif op in (_sc.ASSERT, _sc.ASSERT_NOT):
+            yield from _walk(av[1])
+        elif op is _sc.GROUPREF_EXISTS:
+            yield from _walk(av[1])
+            if av[2] is not None:
+                yield from _walk(av[2])
+        elif op is getattr(_sc, "ATOMIC_GROUP", None):
+            yield from _walk(av)
+
+
+def _first_chars(items) -> set[str] | None:
+    for op, av in items:
+        if op is _sc.AT:
+            continue  # 폭 0(\b 등)
+        if op is _sc.LITERAL:
+            return {chr(av)}
+        if op is _sc.IN:
+            out: set[str] = set()
+            for o, a in av:
+                if o is _sc.LITERAL:
+                    out.add(chr(a))
+                elif o is _sc.RANGE and a[1] - a[0] < 256:
+                    out.update(chr(c) for c in range(a[0], a[1] + 1))
+                else:
+                    return None  # \d, 부정 등
+            return out
+        if op is _sc.SUBPATTERN:
+            return _first_chars(av[-1])
+        if op is _sc.BRANCH:
+            out = set()
+            for branch in av[1]:
+                sub = _first_chars(branch)
+                if sub is None:
+                    return None
+                out |= sub
+            return out
+        if op in _REPEATS and av[0] >= 1:
+            return _first_chars(av[2])
+        return None
+    return None  # 빈 매칭 가능
+
+
+def _pattern_info(regex: re.Pattern) -> _PatternInfo:
+    try:
+        parsed = _sre_parse.parse(regex.pattern, regex.flags)
+    except Exception:  # 내부 파서가 버전마다 달라도 최적화만 포기
+        return _PatternInfo(first_chars=None, batchable=False)
+    ops = list(_walk(parsed))
+    ignorecase = bool(parsed.state.flags & re.IGNORECASE) or any(
+        op is _sc.SUBPATTERN and av[1] & re.IGNORECASE for op, av in ops
+    )
+    batchable = not any(
+        op in (_sc.ASSERT, _sc.ASSERT_NOT) or (op is _sc.AT and av in _EDGE_ATS) for op, av in ops
+    )
+    return _PatternInfo(first_chars=None if ignorecase else _first_chars(parsed), batchable=batchable)
+
+
+class RuleSetLoader:
+    """
+    룰 파일 hot reload: get() 호출 시 최대 check_interval_s마다 mtime을 확인해 바뀌었으면 다시 읽는다.
+    새 파일이 깨져 있으면 기존 matcher를 계속 쓴다.
+    """
+
+    def __init__(self, path: str | Path, check_interval_s: float = 2.0):
+        self.path = Path(path)
+        self.check_interval_s = check_interval_s
+        self._lock = threading.Lock()
+        self._matcher: RiskMatcher | None = None
+        self._mtime = 0.0
+        self._checked_at = 0.0
+
+    def get(self) -> RiskMatcher:
+        now = time.monotonic()
+        if self._matcher is not None and now - self._checked_at < self.check_interval_s:
+            return self._matcher
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime = self.path.stat().st_mtime
+                if self._matcher is None or mtime != self._mtime:
+                    self._matcher = RiskMatcher.from_file(self.path)
+                    self._mtime = mtime
+            except (OSError, ValueError, KeyError, re.error):
+                if self._matcher is None:
+                    raise
+        return self._matcher
+
+
+rule_set = RuleSetLoader(settings.risk_rules_path)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import math
 import uuid
+from collections.abc import Callable
 from datetime import datetime
 
 from sqlalchemy.orm import Session
@@ -8,38 +10,74 @@ from sqlalchemy.orm import Session
 from autodraft.db.models import Topic
 from autodraft.db.repos import TopicRepo
 from autodraft.integrations.llm import LLMClient
+from autodraft.integrations.llm.cache import CacheMode
+from autodraft.pipelines.steps.topic_index import DUPLICATES, get_topic_index
 from autodraft.schemas.topic import TopicIdea
+from autodraft.settings import settings
 
 
-def generate_topics(db: Session, llm: LLMClient, pillar: str, audience: str, n: int) -> list[TopicIdea]:
+def generate_topics(
+    db: Session,
+    llm: LLMClient,
+    pillar: str,
+    audience: str,
+    n: int,
+    cache: CacheMode = "use",
+    on_item: Callable[[TopicIdea], None] | None = None,
+) -> list[TopicIdea]:
     """
     LLM(현재 stub 포함)로 토픽 후보 생성 + DB 저장.
+    응답 스트림에서 후보가 하나 완성될 때마다 바로 INSERT/commit하고 on_item(TopicIdea)을 부른다.
+    스트림이 중간에 끊겨도 그때까지 저장된 토픽은 남고, 그 목록을 돌려준다(하나도 없으면 예외).
     반환은 시트에 꽂기 좋은 TopicIdea 리스트.
+
+    settings.topic_dedupe_enabled면 기존 토픽(이전 실행 포함)과 제목이 거의 같은 후보는 저장하지 않는다.
+    걸러질 몫까지 n * (1 + topic_dedupe_overgenerate)개를 요청하고 n개가 모이면 스트림을 닫는다
+    (그래도 모자라면 n개보다 적게 돌려준다).
     """
-    now = datetime.utcnow()
-    candidates = llm.generate_topics(pillar=pillar, audience=audience, n=n)
-
-    items: list[TopicIdea] = []
-    for c in candidates:
-        topic_id = f"t_{uuid.uuid4().hex[:10]}"
-        topic = Topic(
-            id=topic_id,
-            pillar=pillar,
-            audience=audience,
-            title=c.title,
-            angle=c.angle,
-            score=int(c.score),
-            status="NEW",
-            created_at=now,
-        )
-        TopicRepo.create(db, topic)
-
-        items.append(
-            TopicIdea(
-                topic_id=topic_id,
-                title=topic.title,
-                angle=topic.angle,
-                score=topic.score,
+    out: list[TopicIdea] = []
+    dedupe = settings.topic_dedupe_enabled
+    index = get_topic_index(db) if dedupe else None
+    request_n = n + math.ceil(n * settings.topic_dedupe_overgenerate) if dedupe else n
+
+    stream = llm.stream_topics(pillar=pillar, audience=audience, n=request_n, cache=cache)
+    try:
+        for c in stream:
+            topic = Topic(
+                id=f"t_{uuid.uuid4().hex[:10]}",
+                pillar=pillar,
+                audience=audience,
+                title=c.title,
+                angle=c.angle,
+                score=int(c.score),
+                status="NEW",
+                created_at=datetime.utcnow(),
             )
-        )
-    return items
+            if index is not None and index.add_if_unique(
+                topic.id, topic.title, settings.topic_dedupe_threshold
+            ) is not None:
+                DUPLICATES.inc()
+                continue
+
+            # refresh 없는 INSERT 1번 + commit(도착한 즉시 다른 요청에서 보이게)
+            try:
+                TopicRepo.bulk_create(db, [topic])
+            except Exception:
+                if index is not None:
+                    index.remove(topic.id)
+                raise
+
+            idea = TopicIdea(topic_id=topic.id, title=topic.title, angle=topic.angle, score=topic.score)
+            out.append(idea)
+            if on_item:
+                on_item(idea)
+            if len(out) >= n:
+                break
+    except Exception:
+        if not out:
+            raise
+        db.rollback()
+    finally:
+        stream.close()
+
+    return out
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import random
+import re
+import threading
+import unicodedata
+import zlib
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from autodraft.db.models import Topic
+from autodraft.observability import registry
+from autodraft.settings import settings
+
+try:  # numpy는 선택 의존성(없으면 같은 해시를 순수 파이썬으로 계산)
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+DUPLICATES = registry.counter(
+    "autodraft_topic_duplicates_total", "Topic candidates dropped as near-duplicates of an existing topic."
+)
+
+# MinHash 해시족: h_i(x) = (a_i * x + b_i) mod P, x는 shingle의 crc32(32비트)
+# P = 2^31 - 1이면 a*x < 2^63이라 numpy uint64에서도 넘치지 않는다(두 경로가 같은 값을 낸다)
+_PRIME = (1 << 31) - 1
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize(text: str) -> str:
+    """
+    NFKC + 소문자 + 공백/문장부호 제거("포인터, 헷갈리는 이유!" ≈ "포인터헷갈리는이유").
+    """
+    return _NON_WORD.sub("", unicodedata.normalize("NFKC", text).lower())
+
+
+def shingles(text: str, k: int = 2) -> set[str]:
+    s = normalize(text)
+    if len(s) <= k:
+        return {s} if s else set()
+    return {s[i : i + k] for i in range(len(s) - k + 1)}
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """
+    shingle 집합 → 길이 num_perm의 MinHash 서명. 두 서명에서 같은 자리 비율 ≈ Jaccard 유사도.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+        if np is not None:
+            self._a_np = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_np = np.array(self._b, dtype=np.uint64)[:, None]
+
+    def signature(self, grams: Iterable[str]) -> array:
+        xs = [zlib.crc32(g.encode("utf-8")) for g in grams]
+        if not xs:
+            return array("I", [_PRIME] * self.num_perm)
+        if np is not None:
+            h = (self._a_np * np.array(xs, dtype=np.uint64) + self._b_np) % _PRIME
+            return array("I", h.min(axis=1).astype(np.uint32).tobytes())
+        return array("I", [min((a * x + b) % _PRIME for x in xs) for a, b in zip(self._a, self._b)])
+
+
+def similarity(sig_a: array, sig_b: array) -> float:
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+@dataclass
+class Match:
+    topic_id: str
+    similarity: float
+
+
+class TopicIndex:
+    """
+    토픽 제목의 근사 중복 인덱스(MinHash + LSH banding, 메모리).
+    angle은 비교에 넣지 않는다: 같은 제목에 구성만 바꾼 후보가 많아서, 섞으면 진짜 중복의 유사도가 threshold 아래로 내려간다.
+    - 서명을 bands개 구간으로 나눠 구간별 버킷에 넣고, 조회 시 한 구간이라도 같은 버킷에 있는 것만 후보로 비교
+      (전체 토픽 수와 무관하게 후보 몇 개만 본다)
+    - 후보 유사도는 서명 일치 비율(추정 Jaccard)
+    - sync(db): 마지막으로 읽은 created_at에서 settle_ms만큼 되돌아간 이후 토픽만 추가로 읽는다(다른 프로세스가 넣은 토픽 반영)
+    """
+
+    def __init__(
+        self, num_perm: int = 128, bands: int = 32, shingle_k: int = 2, seed: int = 1, settle_ms: int = 2000
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_k = shingle_k
+        self.settle = timedelta(milliseconds=settle_ms)
+        self._lock = threading.Lock()
+        self._sigs: dict[str, array] = {}
+        self._buckets: list[dict[bytes, list[str]]] = [{} for _ in range(bands)]
+        self._synced_until: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._sigs)
+
+    def signature(self, title: str) -> array:
+        return self.hasher.signature(shingles(title, self.shingle_k))
+
+    def _band_keys(self, sig: array) -> list[bytes]:
+        r = self.rows
+        return [sig[i * r : (i + 1) * r].tobytes() for i in range(self.bands)]
+
+    def _add(self, topic_id: str, sig: array) -> None:
+        if topic_id in self._sigs:
+            return
+        self._sigs[topic_id] = sig
+        for band, key in zip(self._buckets, self._band_keys(sig)):
+            band.setdefault(key, []).append(topic_id)
+
+    def _matches(self, sig: array, threshold: float) -> list[Match]:
+        seen: set[str] = set()
+        out: list[Match] = []
+        for band, key in zip(self._buckets, self._band_keys(sig)):
+            for topic_id in band.get(key, ()):
+                if topic_id in seen:
+                    continue
+                seen.add(topic_id)
+                sim = similarity(sig, self._sigs[topic_id])
+                if sim >= threshold:
+                    out.append(Match(topic_id, sim))
+        out.sort(key=lambda m: m.similarity, reverse=True)
+        return out
+
+    def add(self, topic_id: str, title: str) -> None:
+        sig = self.signature(title)
+        with self._lock:
+            self._add(topic_id, sig)
+
+    def remove(self, topic_id: str) -> None:
+        with self._lock:
+            sig = self._sigs.pop(topic_id, None)
+            if sig is None:
+                return
+            for band, key in zip(self._buckets, self._band_keys(sig)):
+                ids = band.get(key)
+                if ids and topic_id in ids:
+                    ids.remove(topic_id)
+                    if not ids:
+                        del band[key]
+
+    def query(self, title: str, threshold: float) -> list[Match]:
+        sig = self.signature(title)
+        with self._lock:
+            return self._matches(sig, threshold)
+
+    def add_if_unique(self, topic_id: str, title: str, threshold: float) -> Match | None:
+        """
+        threshold 이상 비슷한 토픽이 없으면 등록하고 None, 있으면 가장 비슷한 Match(등록 안 함).
+        확인과 등록을 한 번에 해서 동시에 도는 생성 요청끼리도 중복을 못 넣는다.
+        """
+        sig = self.signature(title)
+        with self._lock:
+            found = self._matches(sig, threshold)
+            if found:
+                return found[0]
+            self._add(topic_id, sig)
+            return None
+
+    def sync(self, db: Session, batch: int = 2000) -> int:
+        """
+        DB topics 중 아직 안 읽은 것을 인덱스에 추가. 추가한 수를 돌려준다.
+        created_at은 commit 전에 찍히므로 더 이른 created_at 행이 나중에 commit될 수 있다:
+        마지막으로 읽은 created_at에서 settle만큼 되돌아가 다시 읽는다(/sync/changes의 sync_settle_ms와 같은 창).
+        이미 있는 id는 서명 계산 없이 건너뛴다.
+        """
+        stmt = select(Topic.id, Topic.title, Topic.created_at).order_by(Topic.created_at)
+        since = self._synced_until
+        if since is not None:
+            stmt = stmt.where(Topic.created_at >= since - self.settle)
+        added = 0
+        last = since
+        for rows in db.execute(stmt.execution_options(yield_per=batch)).partitions():
+            sigs = [(r.id, self.signature(r.title)) for r in rows if r.id not in self._sigs]
+            with self._lock:
+                for topic_id, sig in sigs:
+                    if topic_id not in self._sigs:
+                        self._add(topic_id, sig)
+                        added += 1
+            if last is None or rows[-1].created_at > last:
+                last = rows[-1].created_at
+        self._synced_until = last
+        return added
+
+
+def build_index(db: Session | None = None) -> TopicIndex:
+    index = TopicIndex(
+        num_perm=settings.topic_dedupe_num_perm,
+        bands=settings.topic_dedupe_bands,
+        shingle_k=settings.topic_dedupe_shingle_k,
+        settle_ms=settings.sync_settle_ms,
+    )
+    if db is not None:
+        index.sync(db)
+    return index
+
+
+# 프로세스 공용 인덱스(처음 쓸 때 만들고 generate_topics마다 sync)
+_topic_index: TopicIndex | None = None
+_topic_index_lock = threading.Lock()
+
+
+def get_topic_index(db: Session) -> TopicIndex:
+    global _topic_index
+    with _topic_index_lock:
+        if _topic_index is None:
+            _topic_index = build_index()
+        index = _topic_index
+    index.sync(db)
+    return index
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterator
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from autodraft.db.repos import DraftRepo, TopicRepo
+from autodraft.db.session import SessionLocal
+from autodraft.integrations.llm import LLMClient
+from autodraft.integrations.llm.cache import CacheMode
+from autodraft.observability import span
+from autodraft.pipelines.leases import LeaseKeeper, default_owner
+from autodraft.pipelines.orchestrator import (
+    REUSED,
+    busy_result,
+    draft_result,
+    failed_result,
+    inflight_topics,
+    reuse_completed,
+)
+from autodraft.pipelines.steps.draft import new_draft
+from autodraft.pipelines.steps.export import ExportWriter, export_draft_html
+from autodraft.pipelines.steps.quality_gate import apply_quality_gate
+from autodraft.pipelines.steps.risk_rules import RiskHit, rule_set
+from autodraft.schemas.draft import DraftResult
+from autodraft.settings import settings
+
+# (event, data) — SSE로 그대로 내보낸다
+StreamEvent = tuple[str, dict[str, Any]]
+
+
+def _hit_event(hit: RiskHit, score: int) -> StreamEvent:
+    return "risk", {"rule_id": hit.rule_id, "text": hit.text, "start": hit.start, "score": score}
+
+
+def _replay(db: Session, topic_id: str, title: str, result: DraftResult) -> Iterator[StreamEvent]:
+    """
+    새로 생성하지 않은 결과(완료 초안/동시 처리 결과)를 같은 이벤트 순서로: start → delta(본문 전체) → done.
+    """
+    if result.status == "FAILED":
+        yield "error", {"topic_id": topic_id, "detail": "Concurrent run for this topic failed"}
+        return
+    yield "start", {"topic_id": topic_id, "draft_id": result.draft_id, "title": title, "reused": True}
+    draft = DraftRepo.get(db, result.draft_id)
+    if draft is not None and draft.content_md:
+        yield "delta", {"text": draft.content_md}
+    yield "done", result.model_dump()
+
+
+def stream_topic_draft(
+    llm: LLMClient, topic_id: str, cache: CacheMode = "use", force: bool = False
+) -> Iterator[StreamEvent]:
+    """
+    topic 1개 초안을 스트리밍으로 생성: Draft → QA → Export → 상태 갱신을 run_selected와 같은 결과로 남긴다.
+    - start: draft_id/title
+    - delta: 도착한 본문 MD 조각(그대로 이어 붙이면 content_md)
+    - risk: 본문에서 새로 걸린 룰(점수는 지금까지 기준)
+    - done: DraftResult / error: 실패 사유
+    본문 조각은 도착하는 대로 위험 스캔(IncrementalRiskScanner)과 export HTML 임시 파일에 흘려보내고,
+    끝나면 Draft/ExportEntry/topic 상태를 한 트랜잭션으로 commit한다.
+    응답 스트림이 오래 열려 있으므로 요청 세션 대신 자기 세션을 쓴다.
+    run_selected와 마찬가지로 완료 초안이 있으면(force=False) 다시 만들지 않고,
+    같은 topic을 다른 곳에서 처리 중이면 그 결과를 기다렸다가 돌려준다(start에 reused=true).
+    생성 전에 워커와 같은 lease를 잡고(스트림 동안 연장) DONE/ERROR는 그 lease를 풀면서 기록한다.
+    다른 프로세스(워커 등)가 lease를 잡고 있으면 error 이벤트로 끝낸다.
+    """
+    db = SessionLocal()
+    exporter: ExportWriter | None = None
+    ok = False
+    fut = None
+    result: DraftResult | None = None
+    owner = default_owner()
+    leases = LeaseKeeper(owner, settings.worker_lease_s)
+    claimed = False  # lease를 잡았고 아직 DONE/ERROR로 풀지 않음
+    try:
+        topic = TopicRepo.get(db, topic_id)
+        if not topic:
+            yield "error", {"topic_id": topic_id, "detail": f"Topic not found: {topic_id}"}
+            return
+
+        fut, leader = inflight_topics.claim(topic_id)
+        if not leader:
+            REUSED.inc(reason="inflight")
+            try:
+                joined = fut.result()
+            except Exception:
+                joined = failed_result(topic_id)
+            fut = None  # release는 leader 몫
+            ok = True
+            yield from _replay(db, topic_id, topic.title, joined.model_copy(update={"reused": True}))
+            return
+
+        if not force and topic.status == "DONE":
+            # 읽기만(lease 없이): 완료 초안이 있으면 그대로
+            result = reuse_completed(db, topic_id, commit=True)
+        if result is None:
+            if not TopicRepo.claim_topics(db, [topic_id], owner, settings.worker_lease_s):
+                result = busy_result(topic_id)
+                yield "error", {"topic_id": topic_id, "detail": "Topic is being processed by another worker"}
+                return
+            claimed = True
+            leases.start()
+            leases.add(topic_id)
+            if not force:
+                result = reuse_completed(db, topic_id, commit=True, owner=owner)
+                claimed = result is None
+        if result is not None:
+            ok = True
+            inflight_topics.release(topic_id, fut, result)
+            fut = None
+            yield from _replay(db, topic_id, topic.title, result)
+            return
+
+        draft_id = f"d_{uuid.uuid4().hex[:10]}"
+        yield "start", {"topic_id": topic_id, "draft_id": draft_id, "title": topic.title}
+
+        try:
+            scanner = rule_set.get().incremental()
+            exporter = ExportWriter(topic.title)
+            with span("generate_draft", streamed=True):
+                stream = llm.stream_draft(
+                    title=topic.title, angle=topic.angle, pillar=topic.pillar, audience=topic.audience, cache=cache
+                )
+                for chunk in stream:
+                    exporter.feed(chunk)
+                    hits = scanner.feed(chunk)
+                    yield "delta", {"text": chunk}
+                    for hit in hits:
+                        yield _hit_event(hit, scanner.score)
+
+            with span("apply_quality_gate", streamed=True):
+                # 게이트 점수는 전체 본문 기준(finish). 청크 단위로 못 보낸 hit만 마저 보낸다
+                sent = {(h.rule_id, h.start, h.end) for h in scanner.hits}
+                report = scanner.finish()
+                for hit in report.hits:
+                    if (hit.rule_id, hit.start, hit.end) not in sent:
+                        yield _hit_event(hit, report.score)
+                draft = DraftRepo.add(db, new_draft(topic, stream.content_md, stream.summary, draft_id=draft_id))
+                draft = apply_quality_gate(db, draft, review_threshold=30, commit=False, report=report)
+
+            with span("export_draft_html", streamed=True):
+                out, exporter = exporter.finish(), None
+                draft = export_draft_html(db, draft, commit=False, out=out)
+
+            with span("update_status"):
+                if not TopicRepo.release_lease(db, topic_id, owner, "DONE"):
+                    # 스트림이 lease보다 오래 멈춰 다른 워커가 가져감: 이쪽 결과는 버린다
+                    raise RuntimeError("Lease lost: topic was taken over by another worker")
+            with span("commit", topics=1):
+                db.commit()
+            claimed = False
+        except Exception as e:
+            db.rollback()
+            TopicRepo.release_lease(db, topic_id, owner, "ERROR")
+            db.commit()
+            claimed = False
+            yield "error", {"topic_id": topic_id, "draft_id": draft_id, "detail": str(e) or type(e).__name__}
+            return
+
+        ok = True
+        result = draft_result(draft)
+        # commit까지 끝났으니 기다리던 쪽을 바로 풀어준다
+        inflight_topics.release(topic_id, fut, result)
+        fut = None
+        yield "done", result.model_dump()
+    finally:
+        if fut is not None:
+            # 실패/중단: 기다리던 쪽은 FAILED 결과를 받는다
+            inflight_topics.release(topic_id, fut, result or failed_result(topic_id))
+        # 실패했거나 클라이언트가 끊어서(GeneratorExit) 중간에 닫힌 경우 임시 export 정리
+        if exporter is not None:
+            exporter.abort()
+        leases.stop()
+        if not ok:
+            db.rollback()
+        if claimed:
+            # 클라이언트가 끊어서(GeneratorExit) 중간에 닫힘: 잡아 둔 lease를 ERROR로 푼다
+            try:
+                TopicRepo.release_lease(db, topic_id, owner, "ERROR")
+                db.commit()
+            except Exception:
+                db.rollback()
+        db.close()
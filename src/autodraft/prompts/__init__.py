@@ -0,0 +1,7 @@
+from .registry import PromptRegistry, PromptTemplate, RenderedPrompt, SUFFIX_MARKER
+from autodraft.settings import settings
+
+# 프로세스 공용 레지스트리(PROMPT_VERSION 디렉토리)
+prompts = PromptRegistry(settings.prompts_dir, settings.prompt_version)
+
+__all__ = ["PromptRegistry", "PromptTemplate", "RenderedPrompt", "SUFFIX_MARKER", "prompts"]
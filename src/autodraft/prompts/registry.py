@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import re
+import string
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+# 이 줄 위는 고정 prefix(호출마다 같은 바이트 → provider prompt cache 대상), 아래는 변수 suffix
+SUFFIX_MARKER = "<!-- variables -->"
+_PLACEHOLDER = re.compile(r"(?<!\{)\{(\w+)\}(?!\})")
+
+
+@dataclass(frozen=True)
+class RenderedPrompt:
+    name: str
+    version: str
+    prefix: str
+    suffix: str
+
+    @property
+    def text(self) -> str:
+        return self.prefix + self.suffix
+
+    @property
+    def cache_key(self) -> str:
+        # provider prompt cache 라우팅 힌트(같은 prefix끼리 같은 키)
+        return f"autodraft:{self.version}/{self.name}"
+
+
+class PromptTemplate:
+    """
+    prompts/<version>/<name>.md 하나. 로드할 때 suffix를 (고정 문자열, 필드) 조각으로 미리 나눠 두고
+    render()는 조각을 이어 붙이기만 한다. prefix에는 변수를 둘 수 없다(넣으면 캐시 prefix가 매번 달라짐).
+    """
+
+    def __init__(self, name: str, version: str, source: str):
+        prefix, sep, suffix = source.partition(SUFFIX_MARKER)
+        if not sep:
+            raise ValueError(f"Prompt {version}/{name}: missing '{SUFFIX_MARKER}' line")
+        leaked = _PLACEHOLDER.findall(prefix)
+        if leaked:
+            raise ValueError(f"Prompt {version}/{name}: placeholders in static prefix: {sorted(set(leaked))}")
+
+        self.name = name
+        self.version = version
+        self.prefix = prefix.rstrip("\n") + "\n"
+        self._parts: list[tuple[str, str | None]] = []
+        for literal, field, spec, conv in string.Formatter().parse(suffix.strip("\n") + "\n"):
+            if spec or conv:
+                raise ValueError(f"Prompt {version}/{name}: format spec/conversion not supported: {{{field}}}")
+            self._parts.append((literal, field))
+        self.fields = frozenset(f for _, f in self._parts if f)
+
+    def render(self, **values: object) -> RenderedPrompt:
+        missing = self.fields - values.keys()
+        if missing:
+            raise KeyError(f"Prompt {self.version}/{self.name}: missing values {sorted(missing)}")
+        suffix = "".join(lit + (str(values[f]) if f else "") for lit, f in self._parts)
+        return RenderedPrompt(self.name, self.version, self.prefix, suffix)
+
+
+class PromptRegistry:
+    """
+    버전 디렉토리(prompts/v1 등)의 *.md 템플릿을 처음 쓸 때 읽어서 PromptTemplate으로 캐시.
+    프롬프트 수정은 파일만 바꾸고(재시작 시 반영), 큰 변경은 새 버전 디렉토리 + PROMPT_VERSION으로.
+    """
+
+    def __init__(self, root: str | Path, version: str):
+        self.root = Path(root)
+        self.version = version
+        self._lock = threading.Lock()
+        self._templates: dict[str, PromptTemplate] = {}
+
+    @property
+    def directory(self) -> Path:
+        return self.root / self.version
+
+    def get(self, name: str) -> PromptTemplate:
+        tpl = self._templates.get(name)
+        if tpl is not None:
+            return tpl
+        with self._lock:
+            tpl = self._templates.get(name)
+            if tpl is None:
+                path = self.directory / f"{name}.md"
+                try:
+                    source = path.read_text(encoding="utf-8")
+                except FileNotFoundError:
+                    raise KeyError(f"Unknown prompt: {self.version}/{name} ({path})") from None
+                tpl = self._templates[name] = PromptTemplate(name, self.version, source)
+            return tpl
+
+    def render(self, name: str, **values: object) -> RenderedPrompt:
+        return self.get(name).render(**values)
+
+    def load_all(self) -> list[str]:
+        """
+        버전 디렉토리의 템플릿을 전부 읽어 검증(시작 시 깨진 템플릿을 바로 드러내기 위함).
+        """
+        names = sorted(p.stem for p in self.directory.glob("*.md"))
+        if not names:
+            raise FileNotFoundError(f"No prompt templates in {self.directory}")
+        for name in names:
+            self.get(name)
+        return names
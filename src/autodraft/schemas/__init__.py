@@ -1,11 +1,25 @@
-from .topic import TopicIdea, GenerateTopicsRequest, GenerateTopicsResponse
-from .draft import DraftResult, RunSelectedRequest, RunSelectedResponse
+from .topic import TopicIdea, GenerateTopicsRequest, GenerateTopicsResponse, TopicItem, TopicPage
+from .draft import DraftItem, DraftPage, DraftResult, RunSelectedRequest, RunSelectedResponse, StreamDraftRequest
+from .job import JobSubmitted, JobTopicProgress, JobStatus
+from .export import ExportIndexItem, ExportIndexPage
+from .sync import SyncChanges
 
 __all__ = [
     "TopicIdea",
     "GenerateTopicsRequest",
     "GenerateTopicsResponse",
+    "TopicItem",
+    "TopicPage",
     "DraftResult",
+    "DraftItem",
+    "DraftPage",
     "RunSelectedRequest",
     "RunSelectedResponse",
+    "StreamDraftRequest",
+    "JobSubmitted",
+    "JobTopicProgress",
+    "JobStatus",
+    "ExportIndexItem",
+    "ExportIndexPage",
+    "SyncChanges",
 ]
@@ -1,20 +1,49 @@
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
 class RunSelectedRequest(BaseModel):
     topic_ids: list[str] = Field(..., min_length=1)
+    concurrency: int | None = Field(None, ge=1, le=16, description="draft stage(LLM 대기) 스레드 수, 미지정 시 PIPELINE_CONCURRENCY")
+    cache: Literal["use", "refresh", "bypass"] = Field("use", description="LLM 응답 캐시 사용 방식")
+    force: bool = Field(False, description="true면 완료 초안이 있는 topic도 새로 생성")
+
+
+class StreamDraftRequest(BaseModel):
+    topic_id: str
+    cache: Literal["use", "refresh", "bypass"] = Field("use", description="LLM 응답 캐시 사용 방식")
+    force: bool = Field(False, description="true면 완료 초안이 있어도 새로 생성")
 
 
 class DraftResult(BaseModel):
     topic_id: str
     draft_id: str
-    status: str  # EXPORTED | NEEDS_REVIEW | FAILED
+    status: str  # EXPORTED | NEEDS_REVIEW | FAILED | BUSY(다른 워커가 처리 중이라 건너뜀)
     risk_score: int = Field(..., ge=0, le=100)
     summary: str
     export_html_ref: str
+    reused: bool = Field(False, description="새로 생성하지 않고 기존/동시 처리 중이던 초안 결과를 돌려줌")
 
 
 class RunSelectedResponse(BaseModel):
     drafts: list[DraftResult]
+
+
+class DraftItem(BaseModel):
+    draft_id: str
+    topic_id: str
+    title: str
+    status: str
+    risk_score: int
+    summary: str
+    export_html_ref: str
+    updated_at: datetime
+
+
+class DraftPage(BaseModel):
+    items: list[DraftItem]   # updated_at, draft_id 내림차순
+    next_cursor: str | None = None  # 없으면 마지막 페이지
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ExportIndexItem(BaseModel):
+    draft_id: str
+    path: str
+    size_bytes: int
+    content_hash: str
+    created_at: datetime
+
+
+class ExportIndexPage(BaseModel):
+    items: list[ExportIndexItem]
+    next_cursor: str | None = None  # 없으면 마지막 페이지
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from autodraft.schemas.draft import DraftResult
+from autodraft.schemas.topic import TopicIdea
+
+
+class JobSubmitted(BaseModel):
+    job_id: str
+    kind: str     # RUN_SELECTED | GENERATE_TOPICS
+    status: str   # QUEUED
+
+
+class JobTopicProgress(BaseModel):
+    topic_id: str
+    state: str  # PENDING | DONE
+    draft: DraftResult | None = None
+
+
+class JobStatus(BaseModel):
+    job_id: str
+    kind: str
+    status: str  # QUEUED | RUNNING | DONE | FAILED
+    total: int
+    done: int
+    topics: list[JobTopicProgress] = []  # RUN_SELECTED: topic별 진행/부분 결과
+    items: list[TopicIdea] = []          # GENERATE_TOPICS: 완료 시 채움
+    last_error: str | None = None
+    created_at: datetime
+    updated_at: datetime
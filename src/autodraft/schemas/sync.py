@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from autodraft.schemas.draft import DraftItem
+from autodraft.schemas.topic import TopicItem
+
+
+class SyncChanges(BaseModel):
+    topics: list[TopicItem]   # updated_at, topic_id 오름차순
+    drafts: list[DraftItem]   # updated_at, draft_id 오름차순
+    next_cursor: str          # 다음 호출의 since(변경이 없으면 since 그대로)
+    has_more: bool            # true면 바로 next_cursor로 다시 호출
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -7,6 +10,7 @@ class GenerateTopicsRequest(BaseModel):
     pillar: str = Field(..., description="예: 📢 공지, 🧠 학습법 등")
     audience: str = Field(..., description="예: 👶 학생-초급, 👨‍👩‍👧 학부모 등")
     n: int = Field(10, ge=1, le=50)
+    cache: Literal["use", "refresh", "bypass"] = Field("use", description="LLM 응답 캐시 사용 방식")
 
 
 class TopicIdea(BaseModel):
@@ -18,3 +22,29 @@ class TopicIdea(BaseModel):
 
 class GenerateTopicsResponse(BaseModel):
     items: list[TopicIdea]
+
+
+class TopicItem(BaseModel):
+    topic_id: str
+    pillar: str
+    audience: str
+    title: str
+    angle: str
+    score: int
+    status: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class TopicPage(BaseModel):
+    items: list[TopicItem]   # created_at, topic_id 내림차순
+    next_cursor: str | None = None  # 없으면 마지막 페이지
+
+
+class SelectTopicsRequest(BaseModel):
+    topic_ids: list[str] = Field(..., min_length=1)
+
+
+class SelectTopicsResponse(BaseModel):
+    selected: list[str]  # SELECTED로 바뀐(워커가 가져갈) topic
+    skipped: list[str]   # 없거나 처리 중/완료/중복이라 그대로 둔 topic
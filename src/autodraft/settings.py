@@ -13,11 +13,130 @@ class Settings(BaseSettings):
     )
 
     db_url: str = "sqlite:///./autodraft.db"
+    # True면 조회 엔드포인트(목록/sync/exports/jobs)가 AsyncSession(aiosqlite/asyncpg)으로 동작. 쓰기는 sync 세션
+    db_async: bool = False  # env: DB_ASYNC
+    # 서버 시작 시 스키마를 migrate할지. 기본은 버전 확인만(적용은 `python -m autodraft.cli.migrate`로 따로)
+    db_auto_migrate: bool = False  # env: DB_AUTO_MIGRATE
+
+    # SQLite 연결 PRAGMA
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+
+    # 서버형 DB(Postgres 등) 커넥션 풀
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle_s: int = 1800
 
     llm_provider: str = "stub"     # env: LLM_PROVIDER
     llm_model: str = "gpt-5-mini"  # env: LLM_MODEL
 
+    # LLM route 목록("openai:gpt-4.1-mini,azure:gpt-4.1-mini", 비우면 LLM_PROVIDER:LLM_MODEL 하나).
+    # route마다 provider가 달라도 된다(provider 장애 시 다른 provider로). 캐시 키는 1순위 route 기준
+    llm_routes: str = ""
+    # openai/stub 외 provider: OpenAI 호환 API 목록("azure=https://.../openai/v1,local=http://localhost:8000/v1").
+    # 키는 <NAME>_API_KEY 환경변수(예: AZURE_API_KEY)
+    llm_providers: str = ""
+    # 1순위가 최근 p{percentile} 지연 안에 안 끝나면 다음 route로 hedge(표본이 적을 땐 llm_hedge_after_s)
+    llm_hedge_enabled: bool = True
+    llm_hedge_percentile: float = 95.0
+    llm_hedge_after_s: float = 20.0
+    llm_hedge_min_samples: int = 20
+    llm_hedge_min_delay_s: float = 0.05
+
+    # LLM transport: 호출별 타임아웃, 429/5xx 재시도(jitter 지수 backoff), RPM/TPM 제한(0=무제한), 회로 차단
+    llm_timeout_s: float = 120.0
+    llm_connect_timeout_s: float = 5.0
+    llm_http_max_connections: int = 20
+    llm_max_retries: int = 4
+    llm_backoff_base_s: float = 0.5
+    llm_backoff_max_s: float = 20.0
+    llm_rpm: int = 0
+    llm_tpm: int = 0
+    llm_breaker_failures: int = 5  # 연속 실패 N회면 차단(0이면 끔)
+    llm_breaker_reset_s: float = 30.0
+
+    # stub provider 지연/실패 주입(벤치마크용). dist: fixed | uniform | exp | lognormal
+    llm_stub_latency_ms: float = 0.0
+    llm_stub_jitter_ms: float = 0.0
+    llm_stub_latency_dist: str = "fixed"
+    llm_stub_failure_rate: float = 0.0
+    llm_stub_seed: int | None = None
+
+    # 프롬프트 템플릿(prompts/<version>/*.md). 고정 prefix + 변수 suffix로 나뉘어 provider prompt cache를 탄다
+    prompts_dir: str = str(Path(__file__).resolve().parent / "prompts")
+    prompt_version: str = "v1"  # env: PROMPT_VERSION
+    # 같은 템플릿 호출을 같은 캐시 서버로 보내는 prompt_cache_key 전달 여부(OpenAI Responses API)
+    llm_prompt_cache_key: bool = True
+
+    # LLM 응답 캐시(메모리 LRU + SQLite 파일)
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = str(BASE_DIR / "llm_cache.db")
+    llm_cache_ttl_s: int = 7 * 24 * 3600
+    llm_cache_max_bytes: int = 64 * 1024 * 1024
+    llm_cache_mem_items: int = 256
+
     export_dir: str = str(BASE_DIR / "exports")
+    # export html 옆에 .gz(.br) 압축본도 만들지
+    export_precompress: bool = True
+
+    # quality gate 룰 파일(수정하면 자동 반영)
+    risk_rules_path: str = str(Path(__file__).resolve().parent / "rules" / "risk_rules.json")
+
+    # 토픽 근사 중복 제거(MinHash/LSH): 기존 토픽 제목과 추정 Jaccard(글자 2-gram)가 threshold 이상이면 저장하지 않음
+    # LLM에는 n * (1 + overgenerate)개를 요청해서 걸러진 만큼 채운다
+    topic_dedupe_enabled: bool = True  # env: TOPIC_DEDUPE_ENABLED
+    topic_dedupe_threshold: float = 0.7
+    topic_dedupe_overgenerate: float = 0.5
+    topic_dedupe_num_perm: int = 128
+    topic_dedupe_bands: int = 32
+    topic_dedupe_shingle_k: int = 2
+
+    # run_selected draft stage(LLM 대기) 스레드 수 = 동시에 LLM을 기다리는 topic 수
+    pipeline_concurrency: int = 4  # env: PIPELINE_CONCURRENCY
+    # 나머지 stage 스레드 수 덮어쓰기("quality_gate=1,export=2,status=1", 비우면 등록 기본값)
+    pipeline_stage_workers: str = ""  # env: PIPELINE_STAGE_WORKERS
+    # stage 사이 queue 크기(차면 앞 stage가 기다림 → 큰 batch도 메모리 일정)
+    pipeline_queue_size: int = 8  # env: PIPELINE_QUEUE_SIZE
+    # status stage가 도착해 있는 topic을 최대 pipeline_commit_batch개씩 묶어 commit할지(False면 topic마다 commit)
+    pipeline_unit_of_work: bool = True  # env: PIPELINE_UNIT_OF_WORK
+    pipeline_commit_batch: int = 1  # env: PIPELINE_COMMIT_BATCH
+
+    # /jobs 백그라운드 실행 워커 수(앱 프로세스 내부)
+    job_workers: int = 2  # env: JOB_WORKERS
+    # 실행 중인 job의 lease 길이(heartbeat는 1/3마다). 프로세스가 죽으면 만료 후 다른 프로세스가 이어서 돌린다
+    job_lease_s: float = 60.0  # env: JOB_LEASE_S
+
+    # 독립 워커(python -m autodraft.worker): 프로세스당 동시 처리 topic 수, lease 길이(heartbeat는 1/3마다),
+    # 할 일이 없을 때 폴링 간격, topic당 최대 claim 횟수(처리 중 워커가 계속 죽으면 ERROR)
+    # lease 길이는 run_selected(API/job)와 SSE 스트림이 topic을 잡을 때도 같이 쓴다
+    worker_concurrency: int = 4  # env: WORKER_CONCURRENCY
+    worker_lease_s: float = 60.0
+    worker_poll_s: float = 1.0
+    worker_max_attempts: int = 3
+
+    # drafts 본문 저장 형식(db/codec.py): zlib | zstd(zstandard 설치 시, 없으면 zlib) | none
+    # 이보다 짧은 본문은 압축하지 않고 원문으로 둔다
+    draft_body_codec: str = "zlib"  # env: DRAFT_BODY_CODEC
+    draft_body_level: int = 6
+    draft_body_min_bytes: int = 256
+
+    # /sync/changes: 최근 이 시간 안에 바뀐 행은 다음 폴링으로 미룸(commit 전 행을 커서가 건너뛰지 않게).
+    # 토픽 중복 인덱스 sync도 이만큼 되돌아가 다시 읽는다
+    sync_settle_ms: int = 2000
+    sync_page_limit: int = 500
+
+    # Idempotency-Key 응답 보관 기간
+    idempotency_ttl_s: int = 24 * 3600
+    # 처리 중 키의 lease: 처리하는 동안 lease_s/3마다 연장하고, 연장이 멈춘(프로세스가 죽은) 키만 재시도가 가져간다
+    idempotency_lease_s: float = 60.0
+    # lease가 없는(이전 버전이 만든) 처리 중 키를 버리는 시간
+    idempotency_pending_timeout_s: int = 15 * 60
+
+    # GET /metrics(Prometheus) 노출 여부, 요청별 span 구조화 로그(JSON 한 줄) 출력 여부
+    metrics_enabled: bool = True  # env: METRICS_ENABLED
+    trace_log_enabled: bool = False  # env: TRACE_LOG_ENABLED
 
     demo_api_token: str = "change-me"
 
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from autodraft.db.models import IdempotencyKey
+from autodraft.db.repos import IdempotencyRepo
+from autodraft.observability import registry
+from autodraft.pipelines.leases import LeaseKeeper, default_owner
+from autodraft.settings import settings
+
+logger = logging.getLogger("autodraft.idempotency")
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+_MAX_KEY_LEN = 255
+
+REPLAYS = registry.counter(
+    "autodraft_idempotency_requests_total",
+    "Requests carrying an Idempotency-Key, by outcome (new/replayed/conflict/mismatch).",
+    ("scope", "outcome"),
+)
+
+
+def request_hash(scope: str, req: BaseModel) -> str:
+    body = json.dumps(req.model_dump(mode="json"), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(f"{scope}\n{body}".encode("utf-8")).hexdigest()
+
+
+def _release_if_dead(db: Session, row: IdempotencyKey, now: datetime) -> bool:
+    """
+    만료된 키를 지운다(지웠으면 True, 재시도가 새로 begin).
+    - 완료된 키: TTL이 지나면
+    - 처리 중인 키: owner의 lease 연장이 멈췄을 때만(프로세스가 죽음). 오래 걸려도 살아 있으면 그대로 둔다
+    """
+    if row.response_json is None:
+        legacy_before = now - timedelta(seconds=settings.idempotency_pending_timeout_s)
+        return IdempotencyRepo.take_over_stale(db, row.key, now, legacy_before)
+    if now - row.created_at > timedelta(seconds=settings.idempotency_ttl_s):
+        IdempotencyRepo.delete(db, row.key)
+        return True
+    return False
+
+
+def run_idempotent(
+    db: Session,
+    key: str | None,
+    scope: str,
+    req: BaseModel,
+    run: Callable[[], BaseModel],
+    status_code: int = 200,
+) -> BaseModel | JSONResponse:
+    """
+    Idempotency-Key가 있으면 같은 키의 첫 응답을 저장해 두고, 재시도에는 다시 실행하지 않고 그대로 돌려준다.
+    - 같은 키 + 같은 요청: 저장된 응답 재생(Idempotent-Replayed: true)
+    - 같은 키 + 다른 요청: 422
+    - 같은 키가 아직 처리 중: 409(잠시 후 재시도하면 재생됨)
+    - run()이 예외로 끝나면 키를 지워서 재시도가 다시 실행되게 한다
+    - 처리하는 동안 LeaseKeeper가 키의 lease를 연장한다. 처리하던 프로세스가 죽으면 lease가 만료되어 재시도가 가져간다
+    키가 없으면 그냥 run().
+    """
+    if key is None:
+        return run()
+    key = key.strip()
+    if not key or len(key) > _MAX_KEY_LEN:
+        raise HTTPException(status_code=400, detail=f"Invalid {IDEMPOTENCY_HEADER}")
+
+    fingerprint = request_hash(scope, req)
+    now = datetime.utcnow()
+    row = IdempotencyRepo.get(db, key)
+    if row is not None and _release_if_dead(db, row, now):
+        row = None
+
+    if row is not None:
+        if row.scope != scope or row.request_hash != fingerprint:
+            REPLAYS.inc(scope=scope, outcome="mismatch")
+            raise HTTPException(status_code=422, detail=f"{IDEMPOTENCY_HEADER} was already used for a different request")
+        if row.response_json is None:
+            REPLAYS.inc(scope=scope, outcome="conflict")
+            raise HTTPException(status_code=409, detail=f"A request with this {IDEMPOTENCY_HEADER} is still in progress")
+        REPLAYS.inc(scope=scope, outcome="replayed")
+        return JSONResponse(
+            content=json.loads(row.response_json),
+            status_code=row.status_code or status_code,
+            headers={REPLAYED_HEADER: "true"},
+        )
+
+    owner = default_owner()
+    lease_s = settings.idempotency_lease_s
+    started = IdempotencyRepo.begin(
+        db,
+        IdempotencyKey(
+            key=key,
+            scope=scope,
+            request_hash=fingerprint,
+            created_at=now,
+            lease_owner=owner,
+            lease_expires_at=now + timedelta(seconds=lease_s),
+        ),
+    )
+    if not started:
+        # 같은 키로 동시에 들어온 요청이 먼저 INSERT함
+        REPLAYS.inc(scope=scope, outcome="conflict")
+        raise HTTPException(status_code=409, detail=f"A request with this {IDEMPOTENCY_HEADER} is still in progress")
+
+    REPLAYS.inc(scope=scope, outcome="new")
+    keeper = LeaseKeeper(owner, lease_s, renew=IdempotencyRepo.renew_leases).start()
+    keeper.add(key)
+    try:
+        out = run()
+    except BaseException:
+        keeper.stop()
+        db.rollback()
+        IdempotencyRepo.delete(db, key, owner=owner)
+        raise
+    keeper.stop()
+    if not IdempotencyRepo.complete(db, key, owner, status_code, out.model_dump_json()):
+        # lease를 잃었다(heartbeat가 lease_s 넘게 멈춤). 가져간 재시도의 응답이 저장된다
+        logger.warning("idempotency key %r lost its lease before completion", key)
+    return out
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from sqlalchemy.orm import Session
+
+from autodraft.db.models import Draft, Topic
+from autodraft.db.repos import DraftRepo, TopicRepo
+from autodraft.db.repos.keyset import decode_cursor, encode_cursor
+from autodraft.schemas.draft import DraftItem, DraftPage
+from autodraft.schemas.topic import TopicItem, TopicPage
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def topic_item(t: Topic) -> TopicItem:
+    return TopicItem(
+        topic_id=t.id,
+        pillar=t.pillar,
+        audience=t.audience,
+        title=t.title,
+        angle=t.angle,
+        score=t.score,
+        status=t.status,
+        created_at=t.created_at,
+        updated_at=t.updated_at,
+    )
+
+
+def draft_item(d: Draft) -> DraftItem:
+    return DraftItem(
+        draft_id=d.id,
+        topic_id=d.topic_id,
+        title=d.title,
+        status=d.status,
+        risk_score=d.risk_score,
+        summary=d.summary,
+        export_html_ref=d.export_html_ref,
+        updated_at=d.updated_at,
+    )
+
+
+def parse_position(cursor: str | None) -> tuple[datetime, str] | None:
+    """
+    (시각, id) 커서 → keyset 위치. 형식이 틀리면 ValueError.
+    """
+    if not cursor:
+        return None
+    raw = decode_cursor(cursor)
+    if len(raw) != 2 or raw[0] is None:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return datetime.fromisoformat(raw[0]), str(raw[1])
+
+
+def _naive_utc(filters: dict) -> dict:
+    # DB 시각은 naive UTC(datetime.utcnow)로 저장되므로 "...Z"/"+09:00"로 들어온 범위도 맞춰서 비교
+    return {
+        k: v.astimezone(timezone.utc).replace(tzinfo=None) if isinstance(v, datetime) and v.tzinfo else v
+        for k, v in filters.items()
+    }
+
+
+def _topic_page(rows: list[Topic], limit: int) -> TopicPage:
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id) if len(rows) == limit else None
+    return TopicPage(items=[topic_item(t) for t in rows], next_cursor=next_cursor)
+
+
+def _draft_page(rows: list[Draft], limit: int) -> DraftPage:
+    next_cursor = encode_cursor(rows[-1].updated_at, rows[-1].id) if len(rows) == limit else None
+    return DraftPage(items=[draft_item(d) for d in rows], next_cursor=next_cursor)
+
+
+def list_topics(db: Session, limit: int, cursor: str | None = None, **filters) -> TopicPage:
+    return _topic_page(TopicRepo.page(db, limit, parse_position(cursor), **_naive_utc(filters)), limit)
+
+
+async def alist_topics(db: AsyncSession, limit: int, cursor: str | None = None, **filters) -> TopicPage:
+    return _topic_page(await TopicRepo.apage(db, limit, parse_position(cursor), **_naive_utc(filters)), limit)
+
+
+def list_drafts(db: Session, limit: int, cursor: str | None = None, **filters) -> DraftPage:
+    return _draft_page(DraftRepo.page(db, limit, parse_position(cursor), **_naive_utc(filters)), limit)
+
+
+async def alist_drafts(db: AsyncSession, limit: int, cursor: str | None = None, **filters) -> DraftPage:
+    return _draft_page(await DraftRepo.apage(db, limit, parse_position(cursor), **_naive_utc(filters)), limit)
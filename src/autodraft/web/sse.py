@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from starlette.responses import StreamingResponse
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # nginx 등 프록시가 버퍼링하지 않게
+}
+
+
+def format_sse(event: str, data: Any) -> str:
+    """
+    text/event-stream 한 건. data는 JSON 한 줄(줄바꿈은 JSON 이스케이프로 처리됨).
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def sse_response(events: Iterable[tuple[str, Any]]) -> StreamingResponse:
+    def body() -> Iterator[str]:
+        for event, data in events:
+            yield format_sse(event, data)
+
+    return StreamingResponse(body(), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import mimetypes
+import os
+import re
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# export_draft_html이 만드는 content-addressed 파일명(<sha256 앞 32자>.html)
+_CONTENT_ADDRESSED = re.compile(r"^[0-9a-f]{32}$")
+
+# Accept-Encoding 선호 순서: (토큰, 파일 확장자)
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+
+def _accepts(accept_encoding: str, token: str) -> bool:
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() == token:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    /exports 정적 서빙.
+    - 미리 만들어 둔 .br/.gz 형제 파일이 있으면 Accept-Encoding에 맞춰 그대로 전송
+    - content-addressed 파일: 해시를 strong ETag로, 1년 immutable 캐시
+    - 그 외(예전 {draft_id}.html 등): stat 기반 ETag + no-cache(매번 재검증)
+    - If-None-Match 일치 시 304
+    """
+
+    def file_response(
+        self,
+        full_path: os.PathLike | str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        path = Path(full_path)
+
+        headers = {"vary": "Accept-Encoding"}
+        serve_path, serve_stat, encoding = path, stat_result, ""
+        accept = request_headers.get("accept-encoding", "")
+        for token, ext in _ENCODINGS:
+            sibling = path.with_name(path.name + ext)
+            if _accepts(accept, token) and sibling.is_file():
+                serve_path, serve_stat, encoding = sibling, sibling.stat(), token
+                headers["content-encoding"] = token
+                break
+
+        if _CONTENT_ADDRESSED.match(path.stem) and path.suffix == ".html":
+            # 인코딩별 표현이 다르므로 strong ETag도 인코딩마다 구분
+            headers["etag"] = f'"{path.stem}-{encoding}"' if encoding else f'"{path.stem}"'
+            headers["cache-control"] = IMMUTABLE_CACHE
+        else:
+            headers["cache-control"] = REVALIDATE_CACHE
+
+        response = FileResponse(
+            serve_path,
+            status_code=status_code,
+            stat_result=serve_stat,
+            headers=headers,
+            media_type=self._media_type(path),
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    @staticmethod
+    def _media_type(path: Path) -> str | None:
+        # 압축본을 보내도 Content-Type은 원본 기준
+        if path.suffix == ".html":
+            return "text/html; charset=utf-8"
+        return mimetypes.guess_type(path.name)[0]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy.orm import Session
+
+from autodraft.db.models import Draft, Topic
+from autodraft.db.repos import DraftRepo, TopicRepo
+from autodraft.db.repos.keyset import decode_cursor, encode_cursor
+from autodraft.schemas.sync import SyncChanges
+from autodraft.settings import settings
+from autodraft.web.listing import draft_item, topic_item
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+Position = tuple[datetime, str]
+
+
+def parse_since(since: str | None) -> tuple[Position | None, Position | None]:
+    """
+    since 커서 → (topics 위치, drafts 위치). 비어 있으면 처음부터. 형식이 틀리면 ValueError.
+    """
+    if not since:
+        return None, None
+    raw = decode_cursor(since)
+    if len(raw) != 4:
+        raise ValueError(f"Invalid cursor: {since}")
+
+    def pos(ts, key) -> Position | None:
+        if ts is None:
+            return None
+        return datetime.fromisoformat(ts), str(key)
+
+    return pos(raw[0], raw[1]), pos(raw[2], raw[3])
+
+
+def _cursor(topic_pos: Position | None, draft_pos: Position | None) -> str:
+    return encode_cursor(*(topic_pos or (None, None)), *(draft_pos or (None, None)))
+
+
+def changes_since(db: Session, since: str | None, limit: int) -> SyncChanges:
+    """
+    since 이후 바뀐 topics/drafts(각 최대 limit개, 오래된 순).
+    최근 settings.sync_settle_ms 안에 찍힌 행은 다음 호출로 미룬다: updated_at은 commit 직전에 찍히므로
+    아직 commit 안 된 더 이른 시각의 행이 커서 뒤로 밀려 영영 빠지는 일을 막기 위함.
+    """
+    topic_pos, draft_pos = parse_since(since)
+    until = _settled_until()
+    topics = TopicRepo.changed_since(db, topic_pos, until, limit)
+    drafts = DraftRepo.changed_since(db, draft_pos, until, limit)
+    return _changes(topic_pos, draft_pos, topics, drafts, limit)
+
+
+async def achanges_since(db: AsyncSession, since: str | None, limit: int) -> SyncChanges:
+    topic_pos, draft_pos = parse_since(since)
+    until = _settled_until()
+    topics = await TopicRepo.achanged_since(db, topic_pos, until, limit)
+    drafts = await DraftRepo.achanged_since(db, draft_pos, until, limit)
+    return _changes(topic_pos, draft_pos, topics, drafts, limit)
+
+
+def _settled_until() -> datetime:
+    return datetime.utcnow() - timedelta(milliseconds=settings.sync_settle_ms)
+
+
+def _changes(
+    topic_pos: Position | None, draft_pos: Position | None, topics: list[Topic], drafts: list[Draft], limit: int
+) -> SyncChanges:
+    if topics:
+        topic_pos = (topics[-1].updated_at, topics[-1].id)
+    if drafts:
+        draft_pos = (drafts[-1].updated_at, drafts[-1].id)
+    return SyncChanges(
+        topics=[topic_item(t) for t in topics],
+        drafts=[draft_item(d) for d in drafts],
+        next_cursor=_cursor(topic_pos, draft_pos),
+        has_more=len(topics) == limit or len(drafts) == limit,
+    )
+
+
+def changes_etag(since: str | None, page: SyncChanges) -> str:
+    """
+    (since, next_cursor)가 같으면 응답 내용도 같다(행이 바뀌면 updated_at이 커서 뒤로 가서 next_cursor가 달라짐).
+    """
+    digest = hashlib.sha256(f"{since or ''}\n{page.next_cursor}".encode("ascii")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from autodraft.observability.metrics import HTTP_SECONDS
+from autodraft.observability.tracing import end_trace, log_trace, logger, start_trace
+
+REQUEST_ID_HEADER = "x-request-id"
+
+
+class TraceMiddleware:
+    """
+    요청마다 Trace를 열어 step/LLM span을 모으고, 요청 지연을 히스토그램에 기록.
+    - X-Request-ID가 오면 trace_id로 쓰고, 응답에도 X-Request-ID를 붙인다
+    - log_traces=True면 요청 종료 시 span 목록을 JSON 한 줄로 로그(autodraft.trace)
+    """
+
+    def __init__(self, app: ASGIApp, log_traces: bool = False):
+        self.app = app
+        self.log_traces = log_traces
+        if log_traces and not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for k, v in scope.get("headers") or ():
+            if k == REQUEST_ID_HEADER.encode():
+                request_id = v.decode("latin-1")[:64]
+                break
+
+        trace, token = start_trace(request_id)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers") or [])
+                headers.append((REQUEST_ID_HEADER.encode(), trace.id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            dt = time.perf_counter() - t0
+            end_trace(token)
+            # 경로 파라미터로 라벨이 폭증하지 않게 라우트 템플릿 사용
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_SECONDS.observe(dt, method=scope["method"], route=route, status=status)
+            if self.log_traces:
+                log_trace(
+                    trace,
+                    method=scope["method"],
+                    path=scope["path"],
+                    route=route,
+                    status=status,
+                    ms=round(dt * 1000, 3),
+                )
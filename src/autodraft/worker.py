@@ -0,0 +1,189 @@
+"""
+독립 워커: SELECTED topic을 lease로 가져가서 run_selected와 같은 draft → QA → export → DONE을 처리한다.
+여러 프로세스/호스트에서 같은 DB로 띄우면 처리량이 프로세스 수만큼 늘어난다.
+
+- claim: UPDATE 한 문장으로 SELECTED → PROCESSING + (워커 id, 만료 시각). 한 topic은 한 워커만 가져간다
+- heartbeat: 처리 중인 topic의 lease를 worker_lease_s/3마다 연장
+- 워커가 죽거나 멈춰 lease가 만료되면 다른 워커가 다시 가져간다(최대 worker_max_attempts번)
+- 완료 시 lease를 아직 갖고 있을 때만 draft/QA/export/DONE을 한 트랜잭션으로 commit(뺏겼으면 rollback)
+
+    python -m autodraft.worker                          # 계속 폴링(SIGTERM/Ctrl-C면 처리 중인 것만 끝내고 종료)
+    python -m autodraft.worker --concurrency 8 --exit-when-idle
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from autodraft.db.migrations import check_version
+from autodraft.db.repos import TopicRepo
+from autodraft.db.session import SessionLocal, engine
+from autodraft.integrations.llm import LLMClient
+from autodraft.integrations.llm.transport import close_http_client
+from autodraft.pipelines.leases import LeaseKeeper, default_owner
+from autodraft.pipelines.orchestrator import process_topic
+from autodraft.settings import settings
+
+logger = logging.getLogger("autodraft.worker")
+
+
+@dataclass
+class WorkerStats:
+    claimed: int = 0
+    done: int = 0
+    reused: int = 0
+    error: int = 0
+    lost: int = 0  # 처리 중 lease가 만료되어 다른 워커에게 넘어감(결과 버림)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def inc(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + n)
+
+
+class Worker:
+    def __init__(
+        self,
+        llm: LLMClient,
+        owner: str | None = None,
+        concurrency: int | None = None,
+        lease_s: float | None = None,
+        poll_s: float | None = None,
+        max_attempts: int | None = None,
+    ):
+        self.llm = llm
+        self.owner = owner or default_owner()
+        self.concurrency = max(1, concurrency or settings.worker_concurrency)
+        self.lease_s = lease_s or settings.worker_lease_s
+        self.poll_s = poll_s if poll_s is not None else settings.worker_poll_s
+        self.max_attempts = max_attempts or settings.worker_max_attempts
+        self.stats = WorkerStats()
+        self._active: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()  # 처리 하나가 끝나면 빈 자리를 바로 채우도록
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    # ---------- loop ----------
+    def run(self, exit_when_idle: bool = False) -> WorkerStats:
+        """
+        stop()(또는 exit_when_idle이고 가져올 topic도 처리 중인 것도 없을 때)까지 claim → 처리 반복.
+        """
+        leases = LeaseKeeper(self.owner, self.lease_s).start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="worker") as pool:
+                while not self._stop.is_set():
+                    with self._lock:
+                        free = self.concurrency - len(self._active)
+                        idle = not self._active
+                    claimed = self._claim(free) if free > 0 else []
+                    for topic_id in claimed:
+                        with self._lock:
+                            self._active.add(topic_id)
+                        leases.add(topic_id)
+                        pool.submit(self._run_topic, leases, topic_id)
+                    if claimed:
+                        continue
+                    if exit_when_idle and idle and free > 0:
+                        break
+                    # 여러 워커가 같은 박자로 폴링하지 않게 jitter
+                    self._wake.wait(self.poll_s * random.uniform(0.5, 1.5))
+                    self._wake.clear()
+        finally:
+            # pool을 빠져나왔으면 처리 중인 것도 끝났다. 그때까지는 heartbeat가 lease를 계속 연장
+            self._stop.set()
+            leases.stop()
+        return self.stats
+
+    def _claim(self, n: int) -> list[str]:
+        db = SessionLocal()
+        try:
+            TopicRepo.fail_exhausted(db, self.max_attempts)
+            claimed = TopicRepo.claim(db, self.owner, n, self.lease_s, self.max_attempts)
+        except Exception:
+            # DB가 잠깐 잠겨 있는 등: 다음 폴링에서 다시
+            logger.exception("claim failed")
+            db.rollback()
+            return []
+        finally:
+            db.close()
+        self.stats.inc("claimed", len(claimed))
+        return claimed
+
+    # ---------- topic ----------
+    def _run_topic(self, leases: LeaseKeeper, topic_id: str) -> None:
+        db = SessionLocal()
+        try:
+            self.stats.inc(self._process(db, topic_id))
+        finally:
+            db.close()
+            leases.discard(topic_id)
+            with self._lock:
+                self._active.discard(topic_id)
+            self._wake.set()
+
+    def _process(self, db, topic_id: str) -> str:
+        """
+        draft/QA/export/DONE을 세션에 쌓고, lease를 아직 갖고 있으면 한 번에 commit. 결과 종류를 돌려준다.
+        """
+        try:
+            result = process_topic(db, self.llm, topic_id, cache="use", commit=False)
+            if not TopicRepo.release_lease(db, topic_id, self.owner, "DONE"):
+                db.rollback()
+                return "lost"
+            db.commit()
+            return "reused" if result.reused else "done"
+        except Exception:
+            logger.exception("topic %s failed", topic_id)
+            db.rollback()
+        try:
+            if not TopicRepo.release_lease(db, topic_id, self.owner, "ERROR"):
+                db.rollback()
+                return "lost"
+            db.commit()
+        except Exception:
+            # 상태도 못 남기면 lease 만료 후 다른 워커가 다시 시도
+            logger.exception("could not mark topic %s as ERROR", topic_id)
+            db.rollback()
+        return "error"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Process SELECTED topics with lease-based claiming")
+    ap.add_argument("--concurrency", type=int, default=None, help="동시 처리 topic 수(기본 WORKER_CONCURRENCY)")
+    ap.add_argument("--lease-s", type=float, default=None, help="lease 길이(기본 WORKER_LEASE_S)")
+    ap.add_argument("--poll-s", type=float, default=None, help="할 일이 없을 때 폴링 간격(기본 WORKER_POLL_S)")
+    ap.add_argument("--owner", default=None, help="워커 id(기본 host:pid:random)")
+    ap.add_argument("--exit-when-idle", action="store_true", help="가져올 topic이 없으면 종료(배치/벤치마크용)")
+    args = ap.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    check_version(engine)
+
+    llm = LLMClient()
+    worker = Worker(llm, owner=args.owner, concurrency=args.concurrency, lease_s=args.lease_s, poll_s=args.poll_s)
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda *_: worker.stop())
+
+    logger.info("worker %s started (concurrency=%d, lease=%ss)", worker.owner, worker.concurrency, worker.lease_s)
+    try:
+        stats = worker.run(exit_when_idle=args.exit_when_idle)
+    finally:
+        llm.router.close()
+        close_http_client()
+    logger.info(
+        "worker %s stopped: claimed=%d done=%d reused=%d error=%d lost=%d",
+        worker.owner, stats.claimed, stats.done, stats.reused, stats.error, stats.lost,
+    )
+
+
+if __name__ == "__main__":
+    main()